@@ -3,16 +3,22 @@ from backend.cache.connection import (
     redis_client,
     get_redis,
     get_redis_pool,
+    get_redis_registry,
     close_redis,
+    RedisConnectionRegistry,
 )
 from backend.cache.session import RedisSessionStore
 from backend.cache.cache import CacheService
+from backend.cache.local import LocalCache
 
 __all__ = [
     "redis_client",
     "get_redis",
     "get_redis_pool",
+    "get_redis_registry",
     "close_redis",
+    "RedisConnectionRegistry",
     "RedisSessionStore",
     "CacheService",
+    "LocalCache",
 ]
@@ -6,23 +6,53 @@ Provides:
 - Cache-aside pattern implementation
 - Cache invalidation
 - Distributed locking
+- Optional in-process L1 cache with pub/sub invalidation
 """
 
+import asyncio
 import hashlib
 import json
+import logging
+import math
 import os
+import random
+import time
+import uuid
 from datetime import timedelta
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Union
 
 import redis.asyncio as redis
 
+from backend.cache.codec import ValueCodec
 from backend.cache.connection import (
-    init_redis,
+    init_redis_binary,
     get_redis,
     CACHE_PREFIX,
     LOCK_PREFIX,
     DEFAULT_CACHE_TTL,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_L1_ENABLED,
+    CACHE_L1_MAX_ENTRIES,
+    CACHE_L1_TTL,
+    CACHE_L1_NAMESPACES,
 )
+from backend.cache.local import LocalCache
+
+logger = logging.getLogger(__name__)
+
+# Secondary index: set of full cache keys per project
+PROJECT_INDEX_PREFIX = f"{CACHE_PREFIX}index:project:"
+
+# Keys per UNLINK command during bulk invalidation
+INVALIDATION_BATCH_SIZE = int(os.getenv("CACHE_INVALIDATION_BATCH_SIZE", "500"))
+
+# Backoff bounds (seconds) for resubscribing to L1 invalidations after an error
+_INVALIDATION_RETRY_MIN = 1.0
+_INVALIDATION_RETRY_MAX = 30.0
+
+
+class _LeaderCancelled(Exception):
+    """Set on a coalesced get_or_set future when the computing caller was cancelled."""
 
 
 class CacheService:
@@ -34,52 +64,221 @@ class CacheService:
     - Configurable TTL
     - Cache key generation
     - Distributed locking for cache stampede prevention
+    - Per-project index sets for invalidation without KEYS
+    - Tagged binary values (orjson/msgpack, zstd above a size threshold)
+    - Optional in-process L1 cache; writes and invalidations are broadcast
+      over a pub/sub channel so every worker drops stale entries
     """
 
-    def __init__(self, redis_client: redis.Redis = None):
+    def __init__(
+        self,
+        redis_client: redis.Redis = None,
+        local_cache: Optional[LocalCache] = None,
+        codec: Optional[ValueCodec] = None,
+    ):
         """
         Initialize cache service.
 
         Args:
-            redis_client: Optional Redis client
+            redis_client: Optional Redis client (must not decode responses)
+            local_cache: Optional L1 cache (created from settings if enabled)
+            codec: Optional value codec
         """
         self.redis = redis_client
+        self.codec = codec or ValueCodec()
         self.prefix = CACHE_PREFIX
         self.lock_prefix = LOCK_PREFIX
         self.default_ttl = DEFAULT_CACHE_TTL
 
+        if local_cache is None and CACHE_L1_ENABLED:
+            local_cache = LocalCache(
+                max_entries=CACHE_L1_MAX_ENTRIES,
+                ttl=CACHE_L1_TTL,
+                namespaces=CACHE_L1_NAMESPACES,
+            )
+        self.local_cache = local_cache
+        self._instance_id = uuid.uuid4().hex
+        self._invalidation_pubsub = None
+        self._invalidation_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Future] = {}  # key -> shared get_or_set computation
+
     async def get_client(self) -> redis.Redis:
         """Get Redis client."""
         if self.redis is None:
-            self.redis = await init_redis()
+            self.redis = await init_redis_binary()
+        if self.local_cache is not None and self._invalidation_task is None:
+            await self._start_invalidation_listener(self.redis)
         return self.redis
 
+    async def _start_invalidation_listener(self, client: redis.Redis) -> None:
+        """Subscribe to L1 invalidations broadcast by other workers."""
+        self._invalidation_pubsub = client.pubsub()
+        await self._invalidation_pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+        self._invalidation_task = asyncio.create_task(self._invalidation_loop())
+
+    async def _invalidation_loop(self) -> None:
+        """Apply invalidation messages to the L1 cache, resubscribing after errors."""
+        delay = _INVALIDATION_RETRY_MIN
+        while True:
+            try:
+                if self._invalidation_pubsub is None:
+                    self._invalidation_pubsub = self.redis.pubsub()
+                    await self._invalidation_pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                    # Invalidations sent while disconnected were missed
+                    self.local_cache.clear()
+                    delay = _INVALIDATION_RETRY_MIN
+                async for message in self._invalidation_pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if payload.get("origin") == self._instance_id:
+                        continue
+                    self._apply_local_invalidation(payload.get("keys"), payload.get("pattern"))
+                raise ConnectionError("pub/sub connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"L1 invalidation listener failed, resubscribing in {delay:.0f}s: {e}")
+                self.local_cache.clear()
+                pubsub, self._invalidation_pubsub = self._invalidation_pubsub, None
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _INVALIDATION_RETRY_MAX)
+
+    def _apply_local_invalidation(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        pattern: Optional[str] = None,
+    ) -> None:
+        """Drop keys or a key pattern from the L1 cache."""
+        if keys:
+            self.local_cache.invalidate(keys)
+        if pattern:
+            self.local_cache.invalidate_pattern(pattern)
+
+    def _invalidation_message(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        pattern: Optional[str] = None,
+    ) -> str:
+        """Build an invalidation message for other workers."""
+        payload = {"origin": self._instance_id}
+        if keys:
+            payload["keys"] = list(keys)
+        if pattern:
+            payload["pattern"] = pattern
+        return json.dumps(payload)
+
+    async def _invalidate_local(
+        self,
+        client: redis.Redis,
+        keys: Optional[Iterable[str]] = None,
+        pattern: Optional[str] = None,
+    ) -> None:
+        """Drop keys from this worker's L1 cache and broadcast to the others."""
+        if self.local_cache is None:
+            return
+        keys = list(keys or [])
+        self._apply_local_invalidation(keys, pattern)
+        try:
+            await client.publish(
+                CACHE_INVALIDATION_CHANNEL, self._invalidation_message(keys, pattern)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    async def close(self) -> None:
+        """Stop the L1 invalidation listener."""
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+
+        if self._invalidation_pubsub is not None:
+            await self._invalidation_pubsub.unsubscribe(CACHE_INVALIDATION_CHANNEL)
+            await self._invalidation_pubsub.close()
+            self._invalidation_pubsub = None
+
+    def get_local_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get L1 hit-ratio metrics per key namespace (None if L1 is disabled)."""
+        if self.local_cache is None:
+            return None
+        return self.local_cache.get_stats()
+
     def _make_key(self, key: str) -> str:
         """Generate cache key with prefix."""
         return f"{self.prefix}{key}"
 
-    def _serialize(self, value: Any) -> str:
+    def _serialize(self, value: Any) -> bytes:
         """Serialize value for storage."""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, bytes):
-            return value.decode("utf-8")
-        return json.dumps(value, default=str)
+        return self.codec.encode(value)
 
-    def _deserialize(self, value: str) -> Any:
-        """Deserialize stored value."""
-        if value is None:
-            return None
-
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return value
+    def _deserialize(self, value: Optional[bytes]) -> Any:
+        """Deserialize stored value (also reads the pre-codec JSON/str format)."""
+        return self.codec.decode(value)
 
     def _hash_key(self, key: str) -> str:
         """Generate hash for complex keys."""
         return hashlib.md5(key.encode()).hexdigest()
 
+    def _project_index_key(self, project_id: str) -> str:
+        """Generate the index set key for a project."""
+        return f"{PROJECT_INDEX_PREFIX}{project_id}"
+
+    async def _unlink_batches(
+        self,
+        client: redis.Redis,
+        keys: Union[Iterable[str], AsyncIterator[str]],
+        batch_size: int = INVALIDATION_BATCH_SIZE,
+    ) -> int:
+        """
+        UNLINK keys in fixed-size batches, sent through one pipeline per batch.
+
+        Args:
+            client: Redis client
+            keys: Keys to remove (sync or async iterable)
+            batch_size: Keys per UNLINK command
+
+        Returns:
+            Number of keys removed
+        """
+        removed = 0
+        batch = []
+
+        async def flush() -> int:
+            pipe = client.pipeline(transaction=False)
+            for start in range(0, len(batch), batch_size):
+                pipe.unlink(*batch[start:start + batch_size])
+            results = await pipe.execute()
+            batch.clear()
+            return sum(results)
+
+        if hasattr(keys, "__aiter__"):
+            async for key in keys:
+                batch.append(key)
+                if len(batch) >= batch_size * 10:
+                    removed += await flush()
+        else:
+            for key in keys:
+                batch.append(key)
+                if len(batch) >= batch_size * 10:
+                    removed += await flush()
+
+        if batch:
+            removed += await flush()
+
+        return removed
+
     async def get(
         self,
         key: str,
@@ -98,12 +297,22 @@ class CacheService:
         client = await self.get_client()
         full_key = self._make_key(key)
 
+        use_local = self.local_cache is not None and self.local_cache.accepts(key)
+        if use_local:
+            found, cached = self.local_cache.get(key)
+            if found:
+                return cached
+            generation = self.local_cache.generation
+
         value = await client.get(full_key)
 
         if value is None:
             return default
 
-        return self._deserialize(value)
+        value = self._deserialize(value)
+        if use_local:
+            self.local_cache.set(key, value, generation)
+        return value
 
     async def set(
         self,
@@ -111,6 +320,7 @@ class CacheService:
         value: Any,
         ttl: int = None,
         nx: bool = False,
+        project_id: Optional[str] = None,
     ) -> bool:
         """
         Set value in cache.
@@ -120,6 +330,7 @@ class CacheService:
             value: Value to cache
             ttl: Time to live in seconds
             nx: Only set if not exists
+            project_id: Optional project to index the key under for invalidation
 
         Returns:
             True if set, False if not set (nx=True and key exists)
@@ -132,18 +343,34 @@ class CacheService:
         if ttl <= 0:
             return False
 
+        pipe = client.pipeline(transaction=False)
         if nx:
-            return await client.setnx(full_key, serialized)
-
-        await client.setex(full_key, ttl, serialized)
-        return True
-
-    async def delete(self, key: str) -> bool:
+            pipe.set(full_key, serialized, ex=ttl, nx=True)
+        else:
+            pipe.setex(full_key, ttl, serialized)
+
+        if project_id is not None:
+            # Keep the index alive at least as long as its longest-lived member
+            index_key = self._project_index_key(project_id)
+            pipe.sadd(index_key, full_key)
+            pipe.expire(index_key, ttl, nx=True)
+            pipe.expire(index_key, ttl, gt=True)
+
+        if self.local_cache is not None:
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, self._invalidation_message([key]))
+
+        results = await pipe.execute()
+        if self.local_cache is not None:
+            self._apply_local_invalidation([key])
+        return bool(results[0])
+
+    async def delete(self, key: str, project_id: Optional[str] = None) -> bool:
         """
         Delete key from cache.
 
         Args:
             key: Cache key
+            project_id: Project the key was indexed under, if any
 
         Returns:
             True if deleted, False if not found
@@ -151,13 +378,24 @@ class CacheService:
         client = await self.get_client()
         full_key = self._make_key(key)
 
-        result = await client.delete(full_key)
+        if project_id is None:
+            result = await client.delete(full_key)
+        else:
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(full_key)
+            pipe.srem(self._project_index_key(project_id), full_key)
+            result, _ = await pipe.execute()
+
+        await self._invalidate_local(client, keys=[key])
         return result > 0
 
     async def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern.
 
+        Walks the keyspace incrementally with SCAN rather than KEYS, so Redis
+        is never blocked; prefer index-based invalidation where available.
+
         Args:
             pattern: Key pattern (e.g., "user:*")
 
@@ -167,12 +405,12 @@ class CacheService:
         client = await self.get_client()
         full_pattern = self._make_key(pattern)
 
-        keys = await client.keys(full_pattern)
-
-        if not keys:
-            return 0
-
-        return await client.delete(*keys)
+        removed = await self._unlink_batches(
+            client,
+            client.scan_iter(match=full_pattern, count=INVALIDATION_BATCH_SIZE),
+        )
+        await self._invalidate_local(client, pattern=pattern)
+        return removed
 
     async def exists(self, key: str) -> bool:
         """
@@ -234,7 +472,9 @@ class CacheService:
         client = await self.get_client()
         full_key = self._make_key(key)
 
-        return await client.incrby(full_key, amount)
+        result = await client.incrby(full_key, amount)
+        await self._invalidate_local(client, keys=[key])
+        return result
 
     async def decrement(self, key: str, amount: int = 1) -> int:
         """
@@ -250,36 +490,180 @@ class CacheService:
         client = await self.get_client()
         full_key = self._make_key(key)
 
-        return await client.decrby(full_key, amount)
+        result = await client.decrby(full_key, amount)
+        await self._invalidate_local(client, keys=[key])
+        return result
+
+    def _delta_key(self, full_key: str) -> str:
+        """Key holding the last recompute time of a get_or_set value."""
+        return f"{full_key}:xfetch-delta"
+
+    async def _get_with_expiry(self, key: str) -> tuple:
+        """
+        Get a value with its remaining TTL and last recompute time.
+
+        Returns:
+            (value, remaining_ttl_seconds, recompute_seconds) tuple
+        """
+        client = await self.get_client()
+        full_key = self._make_key(key)
+
+        pipe = client.pipeline(transaction=False)
+        pipe.get(full_key)
+        pipe.pttl(full_key)
+        pipe.get(self._delta_key(full_key))
+        value, pttl, delta = await pipe.execute()
+
+        if value is None:
+            return None, 0.0, 0.0
+        remaining = pttl / 1000 if pttl and pttl > 0 else math.inf
+        return self._deserialize(value), remaining, float(delta or 0.0)
+
+    @staticmethod
+    def _should_refresh_early(remaining: float, delta: float, beta: float) -> bool:
+        """
+        XFetch: refresh with a probability that rises as expiry approaches.
+
+        Refreshes when -delta * beta * ln(rand) >= remaining TTL, so keys that
+        are slow to recompute start refreshing earlier.
+        """
+        if beta <= 0 or delta <= 0 or math.isinf(remaining):
+            return False
+        return -delta * beta * math.log(1.0 - random.random()) >= remaining
 
     async def get_or_set(
         self,
         key: str,
         factory,
         ttl: int = None,
+        distributed: bool = False,
+        lock_timeout: int = 30,
+        lock_wait: float = 10,
+        early_refresh_beta: float = 0.0,
+        project_id: Optional[str] = None,
     ) -> Any:
         """
         Get value from cache or set using factory.
 
-        Implements cache-aside pattern.
+        Implements cache-aside pattern with stampede protection:
+        concurrent misses for the same key in this process share a single
+        factory call, and with distributed=True the computation is also
+        serialized across workers through lock(); workers that waited
+        re-read the value instead of recomputing it. With
+        early_refresh_beta > 0, hot keys are refreshed before they expire
+        (XFetch) while other callers keep getting the current value.
 
         Args:
             key: Cache key
             factory: Async function to get value if not cached
             ttl: TTL in seconds
+            distributed: Coordinate recomputation across workers with a Redis lock
+            lock_timeout: Lock expiry in seconds (should exceed factory time)
+            lock_wait: How long to wait for another worker's computation
+            early_refresh_beta: XFetch beta (0 disables early refresh; 1 is typical)
+            project_id: Optional project to index the key under
 
         Returns:
             Cached or computed value
         """
-        value = await self.get(key)
-
-        if value is not None:
+        if early_refresh_beta > 0:
+            value, remaining, delta = await self._get_with_expiry(key)
+            refresh = value is not None and self._should_refresh_early(
+                remaining, delta, early_refresh_beta
+            )
+        else:
+            value = await self.get(key)
+            refresh = False
+
+        if value is not None and not refresh:
             return value
 
-        value = await factory()
-        await self.set(key, value, ttl)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Someone is already computing; stale values are served meanwhile
+            if value is not None:
+                return value
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                # The caller computing it was cancelled; compute it ourselves
+                return await self.get_or_set(
+                    key, factory, ttl, distributed, lock_timeout, lock_wait,
+                    early_refresh_beta, project_id,
+                )
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._compute_and_set(
+                key, factory, ttl, distributed, lock_timeout, lock_wait,
+                stale=value, project_id=project_id,
+                record_delta=early_refresh_beta > 0,
+            )
+        except BaseException as e:
+            # Waiters weren't cancelled themselves; they retry instead
+            future.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _compute_and_set(
+        self,
+        key: str,
+        factory,
+        ttl: Optional[int],
+        distributed: bool,
+        lock_timeout: int,
+        lock_wait: float,
+        stale: Any = None,
+        project_id: Optional[str] = None,
+        record_delta: bool = False,
+    ) -> Any:
+        """Run the factory (under the distributed lock if requested) and store the result."""
+        lock = None
+        if distributed:
+            # Early refreshes never wait: someone else refreshing is good enough
+            wait = 0 if stale is not None else lock_wait
+            lock = await self.lock(
+                f"get_or_set:{key}", timeout=lock_timeout, blocking_timeout=wait
+            )
+            if lock is None and stale is not None:
+                return stale
+            if stale is None:
+                # Another worker may have filled the key while we waited
+                value = await self.get(key)
+                if value is not None:
+                    if lock is not None:
+                        await self._release_lock(lock)
+                    return value
 
-        return value
+        try:
+            started = time.monotonic()
+            value = await factory()
+            delta = time.monotonic() - started
+
+            await self.set(key, value, ttl, project_id=project_id)
+            if record_delta:
+                client = await self.get_client()
+                await client.setex(
+                    self._delta_key(self._make_key(key)), ttl or self.default_ttl, f"{delta:.6f}"
+                )
+            return value
+        finally:
+            if lock is not None:
+                await self._release_lock(lock)
+
+    @staticmethod
+    async def _release_lock(lock) -> None:
+        """Release a lock, ignoring locks that already expired."""
+        try:
+            await lock.release()
+        except Exception as e:
+            logger.warning(f"Failed to release cache lock: {e}")
 
     async def lock(
         self,
@@ -324,7 +708,7 @@ class CacheService:
     ) -> bool:
         """Cache decision data."""
         key = f"decision:{project_id}:{decision_id}"
-        return await self.set(key, data, ttl)
+        return await self.set(key, data, ttl, project_id=project_id)
 
     async def get_decision(
         self,
@@ -344,7 +728,7 @@ class CacheService:
     ) -> bool:
         """Cache artifact data."""
         key = f"artifact:{project_id}:{artifact_id}"
-        return await self.set(key, data, ttl)
+        return await self.set(key, data, ttl, project_id=project_id)
 
     async def get_artifact(
         self,
@@ -358,9 +742,45 @@ class CacheService:
     async def invalidate_project_cache(
         self,
         project_id: str,
+        scan_fallback: bool = True,
     ) -> int:
-        """Invalidate all cached data for a project."""
-        return await self.delete_pattern(f"*:{project_id}:*")
+        """
+        Invalidate all cached data for a project.
+
+        Keys indexed under the project are removed in pipelined UNLINK
+        batches. The index is first renamed to a unique key, so keys indexed
+        while the batches run land in a fresh index instead of being dropped
+        with the old one. If the project has no index (e.g. keys written
+        before indexing existed), falls back to a SCAN for "*:{project_id}:*".
+
+        Args:
+            project_id: Project ID
+            scan_fallback: Whether to SCAN when no index exists
+
+        Returns:
+            Number of keys deleted
+        """
+        client = await self.get_client()
+        index_key = self._project_index_key(project_id)
+        draining_key = f"{index_key}:draining:{uuid.uuid4().hex}"
+
+        try:
+            await client.rename(index_key, draining_key)
+        except redis.ResponseError:
+            # No index for the project
+            if not scan_fallback:
+                # Other workers may still hold L1 entries for the project
+                await self._invalidate_local(client, pattern=f"*:{project_id}:*")
+                return 0
+            return await self.delete_pattern(f"*:{project_id}:*")
+
+        removed = await self._unlink_batches(
+            client,
+            client.sscan_iter(draining_key, count=INVALIDATION_BATCH_SIZE),
+        )
+        await client.unlink(draining_key)
+        await self._invalidate_local(client, pattern=f"*:{project_id}:*")
+        return removed
 
 
 # Cache service instance
@@ -0,0 +1,206 @@
+"""
+Value codec for Redis payloads.
+
+Provides:
+- One-byte type tag prefix so payloads decode without trial parsing
+- orjson for JSON-able values, msgpack for values holding bytes
+- Optional zstd compression above a size threshold
+- Fallback to a caller-supplied decoder for untagged (legacy) payloads
+
+orjson, msgpack and zstandard are optional; without them the codec falls
+back to the standard json module and skips msgpack and compression.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Type tags (first byte of every encoded payload)
+TAG_JSON = 0x01
+TAG_MSGPACK = 0x02
+TAG_BYTES = 0x03
+TAG_STR = 0x04
+TAG_PYTHON = 0x05
+FLAG_ZSTD = 0x80
+
+_KNOWN_TAGS = {TAG_JSON, TAG_MSGPACK, TAG_BYTES, TAG_STR, TAG_PYTHON}
+
+# Types tried as JSON/msgpack before python_dumps. Tuples are left out:
+# JSON and msgpack would load them back as lists.
+_PLAIN_TYPES = (dict, list, int, float, bool, type(None))
+
+# Payloads larger than this (in bytes) are zstd-compressed when available
+CODEC_COMPRESS_THRESHOLD = int(os.getenv("CODEC_COMPRESS_THRESHOLD", "8192"))
+CODEC_COMPRESS_LEVEL = int(os.getenv("CODEC_COMPRESS_LEVEL", "3"))
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded."""
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Strict JSON encoding; raises TypeError for unsupported types."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            raise TypeError(str(e)) from e
+    return json.dumps(value).encode("utf-8")
+
+
+def _json_dumps_lossy(value: Any) -> bytes:
+    """JSON encoding that stringifies unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def legacy_json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a pre-codec payload: JSON if it parses, otherwise the raw string."""
+    try:
+        return json.loads(data)
+    except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+        return data.decode("utf-8") if isinstance(data, bytes) else data
+
+
+class ValueCodec:
+    """
+    Tagged, optionally compressed encoding for Redis values.
+
+    Encoding order for plain values: strict JSON, then msgpack (values
+    holding bytes), then python_dumps if provided, else JSON with unsupported
+    types stringified (the historical behaviour). Other objects go straight
+    to python_dumps when it is provided.
+    """
+
+    def __init__(
+        self,
+        compress_threshold: Optional[int] = CODEC_COMPRESS_THRESHOLD,
+        compress_level: int = CODEC_COMPRESS_LEVEL,
+        python_dumps: Optional[Callable[[Any], bytes]] = None,
+        python_loads: Optional[Callable[[bytes], Any]] = None,
+        legacy_loads: Callable[[Union[bytes, str]], Any] = legacy_json_loads,
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            compress_threshold: Minimum payload size to compress (None disables)
+            compress_level: zstd compression level
+            python_dumps: Optional serializer for values JSON/msgpack can't hold
+            python_loads: Deserializer matching python_dumps
+            legacy_loads: Decoder for untagged payloads written before the codec
+        """
+        self.compress_threshold = compress_threshold if zstandard is not None else None
+        self.python_dumps = python_dumps
+        self.python_loads = python_loads
+        self.legacy_loads = legacy_loads
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compress_level) if zstandard is not None else None
+        )
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+    def _encode_body(self, value: Any) -> tuple:
+        """Encode a value, returning (tag, payload)."""
+        if isinstance(value, bytes):
+            return TAG_BYTES, value
+        if isinstance(value, str):
+            return TAG_STR, value.encode("utf-8")
+        if self.python_dumps is not None and not isinstance(value, _PLAIN_TYPES):
+            return TAG_PYTHON, self.python_dumps(value)
+
+        try:
+            return TAG_JSON, _json_dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+        if msgpack is not None:
+            try:
+                return TAG_MSGPACK, msgpack.packb(value, use_bin_type=True)
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        if self.python_dumps is not None:
+            return TAG_PYTHON, self.python_dumps(value)
+
+        return TAG_JSON, _json_dumps_lossy(value)
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value to tagged bytes.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Tag byte followed by the (possibly compressed) payload
+        """
+        tag, payload = self._encode_body(value)
+        if self.compress_threshold is not None and len(payload) >= self.compress_threshold:
+            compressed = self._compressor.compress(payload)
+            if len(compressed) < len(payload):
+                return bytes((tag | FLAG_ZSTD,)) + compressed
+        return bytes((tag,)) + payload
+
+    def decode(self, data: Union[bytes, str, None]) -> Any:
+        """
+        Decode a payload written by encode() or by the pre-codec format.
+
+        Args:
+            data: Stored payload
+
+        Returns:
+            Decoded value (None for None)
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data:
+            return self.legacy_loads(data)
+
+        tag = data[0] & ~FLAG_ZSTD
+        if tag not in _KNOWN_TAGS:
+            return self.legacy_loads(data)
+
+        payload = data[1:]
+        if data[0] & FLAG_ZSTD:
+            if self._decompressor is None:
+                raise CodecError("zstandard is required to decode a compressed payload")
+            payload = self._decompressor.decompress(payload)
+
+        if tag == TAG_JSON:
+            return _json_loads(payload)
+        if tag == TAG_STR:
+            return payload.decode("utf-8")
+        if tag == TAG_BYTES:
+            return payload
+        if tag == TAG_MSGPACK:
+            if msgpack is None:
+                raise CodecError("msgpack is required to decode this payload")
+            return msgpack.unpackb(payload, raw=False)
+        if self.python_loads is None:
+            raise CodecError("No python_loads configured for this payload")
+        return self.python_loads(payload)
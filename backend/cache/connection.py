@@ -2,29 +2,49 @@
 Redis connection and pool management.
 
 Provides:
-- Redis client with connection pooling
+- Application-wide registry of shared Redis connection pools
 - Async/sync Redis operations
-- Connection health checks
+- Connection health checks and pool-utilization metrics
 - Session and cache key prefixes
 """
 
+import logging
 import os
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Dict, Optional, Tuple
+from urllib.parse import quote
 
 import redis.asyncio as redis
 import redis as redis_sync
-from redis.connection import ConnectionPool
+from redis.asyncio import BlockingConnectionPool, ConnectionPool
+from redis.exceptions import RedisError
+
+try:
+    from prometheus_client import REGISTRY
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:
+    REGISTRY = None
+    GaugeMetricFamily = None
+
+logger = logging.getLogger(__name__)
 
 # Redis configuration
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+REDIS_URL = os.getenv(
+    "REDIS_URL",
+    f"redis://{':' + quote(REDIS_PASSWORD, safe='') + '@' if REDIS_PASSWORD else ''}{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
+)
 
 # Connection pool settings
 REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "100"))
 REDIS_SOCKET_TIMEOUT = int(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
 REDIS_SOCKET_CONNECT_TIMEOUT = int(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
+# Seconds to wait for a free pooled connection before raising
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+# Idle connections are PINGed before reuse after this many seconds
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
 
 # Key prefixes
 REDIS_KEY_PREFIX = os.getenv("REDIS_KEY_PREFIX", "specgen:")
@@ -32,11 +52,195 @@ SESSION_PREFIX = f"{REDIS_KEY_PREFIX}session:"
 CACHE_PREFIX = f"{REDIS_KEY_PREFIX}cache:"
 RATE_LIMIT_PREFIX = f"{REDIS_KEY_PREFIX}ratelimit:"
 LOCK_PREFIX = f"{REDIS_KEY_PREFIX}lock:"
+STREAM_EVENTS_PREFIX = f"{REDIS_KEY_PREFIX}stream-events:"
+EMBEDDING_PREFIX = f"{REDIS_KEY_PREFIX}embedding:"
+LLM_RESPONSE_PREFIX = f"{REDIS_KEY_PREFIX}llm-response:"
+
+# Pub/sub channels
+INTERRUPT_CHANNEL = f"{REDIS_KEY_PREFIX}interrupts"
+CACHE_INVALIDATION_CHANNEL = f"{REDIS_KEY_PREFIX}cache-invalidation"
 
 # TTL settings (in seconds)
 DEFAULT_CACHE_TTL = int(os.getenv("DEFAULT_CACHE_TTL", "300"))  # 5 minutes
 SESSION_TTL = int(os.getenv("SESSION_TTL", "86400"))  # 24 hours
 RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", "60"))  # 1 minute
+EMBEDDING_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", str(30 * 86400)))  # 30 days
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 86400)))  # 7 days
+
+# In-process L1 cache settings
+CACHE_L1_ENABLED = os.getenv("CACHE_L1_ENABLED", "false").lower() == "true"
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", "30"))
+CACHE_L1_NAMESPACES = [
+    ns for ns in os.getenv("CACHE_L1_NAMESPACES", "decision,artifact").split(",") if ns
+]
+
+
+class RedisConnectionRegistry:
+    """
+    Application-wide registry of async Redis connection pools.
+
+    One bounded pool is kept per (URL, decode_responses) pair and shared by
+    every component (cache, sessions, checkpoints, interrupt persistence),
+    so the process holds at most max_connections per pool instead of one
+    pool per component instance. Pools block for up to pool_timeout when
+    exhausted rather than opening more connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = REDIS_MAX_CONNECTIONS,
+        pool_timeout: float = REDIS_POOL_TIMEOUT,
+        health_check_interval: int = REDIS_HEALTH_CHECK_INTERVAL,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections: Maximum connections per pool
+            pool_timeout: Seconds to wait for a free connection
+            health_check_interval: Seconds of idleness after which a connection is PINGed before use
+        """
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
+        self._pools: Dict[Tuple[str, bool], ConnectionPool] = {}
+        self._clients: Dict[Tuple[str, bool], redis.Redis] = {}
+
+    @staticmethod
+    def _pool_name(key: Tuple[str, bool]) -> str:
+        url, decode_responses = key
+        host = url.rsplit("@", 1)[-1]
+        return f"{host}{'' if decode_responses else ' (binary)'}"
+
+    def get_pool(self, url: Optional[str] = None, decode_responses: bool = True) -> ConnectionPool:
+        """
+        Get the shared pool for a URL, creating it on first use.
+
+        Args:
+            url: Redis URL (REDIS_URL if not provided)
+            decode_responses: Whether replies are decoded to str
+
+        Returns:
+            Shared connection pool
+        """
+        key = (url or REDIS_URL, decode_responses)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = BlockingConnectionPool.from_url(
+                key[0],
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=self.health_check_interval,
+                decode_responses=decode_responses,
+            )
+            self._pools[key] = pool
+        return pool
+
+    def get_client(self, url: Optional[str] = None, decode_responses: bool = True) -> redis.Redis:
+        """
+        Get a client bound to the shared pool for a URL.
+
+        Closing the returned client does not close the shared pool.
+
+        Args:
+            url: Redis URL (REDIS_URL if not provided)
+            decode_responses: Whether replies are decoded to str
+
+        Returns:
+            Async Redis client
+        """
+        key = (url or REDIS_URL, decode_responses)
+        client = self._clients.get(key)
+        if client is None:
+            client = redis.Redis(connection_pool=self.get_pool(*key))
+            self._clients[key] = client
+        return client
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get utilization of each pool.
+
+        Returns:
+            Dictionary of pool name to in-use, idle and max connection counts
+        """
+        stats = {}
+        for key, pool in self._pools.items():
+            stats[self._pool_name(key)] = {
+                "in_use": len(getattr(pool, "_in_use_connections", ())),
+                "idle": len([c for c in getattr(pool, "_available_connections", ()) if c is not None]),
+                "max": pool.max_connections,
+            }
+        return stats
+
+    async def health_check(self) -> Dict[str, bool]:
+        """
+        PING the default pool and every other registered pool.
+
+        The default pool is always checked, so the result is never empty
+        before anything has used Redis.
+
+        Returns:
+            Dictionary of pool name to reachability
+        """
+        results = {}
+        default_key = (REDIS_URL, True)
+        for key in [default_key] + [key for key in self._pools if key != default_key]:
+            try:
+                results[self._pool_name(key)] = bool(await self.get_client(*key).ping())
+            except (RedisError, OSError) as e:
+                logger.warning(f"Redis health check failed for {self._pool_name(key)}: {e}")
+                results[self._pool_name(key)] = False
+        return results
+
+    async def close(self) -> None:
+        """Close all clients and disconnect all pools."""
+        for client in self._clients.values():
+            await client.close()
+        for pool in self._pools.values():
+            await pool.disconnect()
+        self._clients.clear()
+        self._pools.clear()
+
+
+class RedisPoolCollector:
+    """Prometheus collector exporting registry pool utilization at scrape time."""
+
+    def __init__(self, registry: RedisConnectionRegistry):
+        self.registry = registry
+
+    def collect(self):
+        connections = GaugeMetricFamily(
+            "specgen_redis_pool_connections",
+            "Redis pool connections by state",
+            labels=["pool", "state"],
+        )
+        for pool, stats in self.registry.get_pool_stats().items():
+            for state in ("in_use", "idle", "max"):
+                connections.add_metric([pool, state], stats[state])
+        yield connections
+
+
+_registry: Optional[RedisConnectionRegistry] = None
+
+
+def get_redis_registry() -> RedisConnectionRegistry:
+    """
+    Get the application-wide Redis connection registry.
+
+    Returns:
+        Shared RedisConnectionRegistry instance.
+    """
+    global _registry
+
+    if _registry is None:
+        _registry = RedisConnectionRegistry()
+        if REGISTRY is not None:
+            REGISTRY.register(RedisPoolCollector(_registry))
+
+    return _registry
 
 
 # Async Redis client
@@ -46,7 +250,7 @@ async_redis_client: Optional[redis.Redis] = None
 
 async def init_redis() -> redis.Redis:
     """
-    Initialize async Redis client with connection pooling.
+    Initialize async Redis client on the shared connection pool.
 
     Returns:
         Async Redis client instance.
@@ -56,18 +260,9 @@ async def init_redis() -> redis.Redis:
     if async_redis_client is not None:
         return async_redis_client
 
-    async_redis_pool = ConnectionPool(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
-        db=REDIS_DB,
-        password=REDIS_PASSWORD or None,
-        max_connections=REDIS_MAX_CONNECTIONS,
-        socket_timeout=REDIS_SOCKET_TIMEOUT,
-        socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
-        decode_responses=True,
-    )
-
-    async_redis_client = redis.Redis(connection_pool=async_redis_pool)
+    registry = get_redis_registry()
+    async_redis_pool = registry.get_pool(decode_responses=True)
+    async_redis_client = registry.get_client(decode_responses=True)
 
     # Test connection
     await async_redis_client.ping()
@@ -75,6 +270,35 @@ async def init_redis() -> redis.Redis:
     return async_redis_client
 
 
+# Async Redis client returning raw bytes (binary cache values)
+async_redis_binary_pool: Optional[ConnectionPool] = None
+async_redis_binary_client: Optional[redis.Redis] = None
+
+
+async def init_redis_binary() -> redis.Redis:
+    """
+    Initialize async Redis client that does not decode responses.
+
+    Used for binary payloads such as codec-encoded cache values.
+
+    Returns:
+        Async Redis client instance.
+    """
+    global async_redis_binary_pool, async_redis_binary_client
+
+    if async_redis_binary_client is not None:
+        return async_redis_binary_client
+
+    registry = get_redis_registry()
+    async_redis_binary_pool = registry.get_pool(decode_responses=False)
+    async_redis_binary_client = registry.get_client(decode_responses=False)
+
+    # Test connection
+    await async_redis_binary_client.ping()
+
+    return async_redis_binary_client
+
+
 async def get_redis() -> AsyncGenerator[redis.Redis, None]:
     """
     Dependency that provides an async Redis client.
@@ -114,14 +338,15 @@ async def close_redis() -> None:
     Call this on application shutdown.
     """
     global async_redis_pool, async_redis_client
+    global async_redis_binary_pool, async_redis_binary_client
 
-    if async_redis_client is not None:
-        await async_redis_client.close()
-        async_redis_client = None
+    if _registry is not None:
+        await _registry.close()
 
-    if async_redis_pool is not None:
-        await async_redis_pool.disconnect()
-        async_redis_pool = None
+    async_redis_client = None
+    async_redis_pool = None
+    async_redis_binary_client = None
+    async_redis_binary_pool = None
 
 
 # Sync Redis client (for scripts and migrations)
@@ -0,0 +1,151 @@
+"""
+In-process L1 cache.
+
+Provides:
+- Size- and TTL-bounded LRU cache for hot keys
+- Per-namespace hit/miss metrics
+- Generation guard against caching values read before an invalidation
+"""
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+
+def key_namespace(key: str) -> str:
+    """Get the namespace of a cache key (the segment before the first colon)."""
+    return key.split(":", 1)[0]
+
+
+class LocalCache:
+    """
+    Size- and TTL-bounded in-process LRU cache.
+
+    Values are stored as returned by the Redis layer and shared between
+    callers, so they must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl: float = 30.0,
+        namespaces: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the local cache.
+
+        Args:
+            max_entries: Maximum number of entries (least recently used evicted)
+            ttl: Maximum age of an entry in seconds
+            namespaces: Key namespaces to cache locally (all if None)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.namespaces: Optional[Set[str]] = set(namespaces) if namespaces is not None else None
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._generation = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; snapshot it before reading from Redis."""
+        return self._generation
+
+    def accepts(self, key: str) -> bool:
+        """Check whether a key is eligible for local caching."""
+        return self.namespaces is None or key_namespace(key) in self.namespaces
+
+    def _record(self, key: str, hit: bool) -> None:
+        stats = self._stats.setdefault(key_namespace(key), {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Get a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (found, value) tuple
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record(key, False)
+            return False, None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._record(key, False)
+            return False, None
+
+        self._entries.move_to_end(key)
+        self._record(key, True)
+        return True, value
+
+    def set(self, key: str, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Generation snapshot taken before the value was read;
+                the value is dropped if an invalidation happened since
+
+        Returns:
+            True if stored
+        """
+        if generation is not None and generation != self._generation:
+            return False
+
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, keys: Iterable[str]) -> int:
+        """Drop specific keys."""
+        self._generation += 1
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+        return removed
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Drop all keys matching a glob pattern."""
+        self._generation += 1
+        matches = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matches:
+            del self._entries[key]
+        return len(matches)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._generation += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit-ratio metrics per key namespace.
+
+        Returns:
+            Dictionary with entry count and per-namespace hits, misses and hit ratio
+        """
+        namespaces = {}
+        for namespace, stats in self._stats.items():
+            total = stats["hits"] + stats["misses"]
+            namespaces[namespace] = {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_ratio": stats["hits"] / total if total else 0.0,
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "namespaces": namespaces,
+        }
@@ -13,7 +13,7 @@ import os
 import secrets
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import redis.asyncio as redis
 
@@ -24,6 +24,12 @@ from backend.cache.connection import (
     SESSION_TTL,
 )
 
+# Secondary index: set of session IDs per user
+USER_SESSIONS_PREFIX = f"{SESSION_PREFIX}user:"
+
+# Keys per MGET/UNLINK command when walking a user's sessions
+SESSION_BATCH_SIZE = int(os.getenv("SESSION_BATCH_SIZE", "500"))
+
 
 class RedisSessionStore:
     """
@@ -39,6 +45,7 @@ class RedisSessionStore:
             "ip_address": "...",
             "user_agent": "..."
         }
+        {USER_SESSIONS_PREFIX}{user_id}: set of session IDs
     """
 
     def __init__(self, redis_client: redis.Redis = None):
@@ -62,6 +69,60 @@ class RedisSessionStore:
         """Generate session key."""
         return f"{self.prefix}{session_id}"
 
+    def _user_index_key(self, user_id: Any) -> str:
+        """Generate the session index key for a user."""
+        return f"{USER_SESSIONS_PREFIX}{user_id}"
+
+    async def _scan_user_session_ids(
+        self,
+        client: redis.Redis,
+        user_id: str,
+    ) -> List[str]:
+        """
+        Find a user's sessions by scanning the session keyspace.
+
+        Fallback for sessions created before the user index existed.
+        """
+        session_ids = []
+        batch = []
+
+        async def check_batch() -> None:
+            values = await client.mget(batch)
+            for key, value in zip(batch, values):
+                if value is None:
+                    continue
+                try:
+                    owner = json.loads(value).get("user_id")
+                except (json.JSONDecodeError, AttributeError):
+                    continue
+                if owner == user_id:
+                    session_ids.append(key[len(self.prefix):])
+            batch.clear()
+
+        async for key in client.scan_iter(
+            match=f"{self.prefix}*", count=SESSION_BATCH_SIZE, _type="string"
+        ):
+            batch.append(key)
+            if len(batch) >= SESSION_BATCH_SIZE:
+                await check_batch()
+
+        if batch:
+            await check_batch()
+
+        return session_ids
+
+    async def _get_user_session_ids(
+        self,
+        client: redis.Redis,
+        user_id: str,
+        scan_fallback: bool,
+    ) -> List[str]:
+        """Get a user's session IDs from the index, scanning if it is missing."""
+        session_ids = list(await client.smembers(self._user_index_key(user_id)))
+        if not session_ids and scan_fallback:
+            session_ids = await self._scan_user_session_ids(client, user_id)
+        return session_ids
+
     async def create_session(
         self,
         user_id: uuid.UUID,
@@ -103,13 +164,17 @@ class RedisSessionStore:
         }
 
         key = self._session_key(session_id)
-
-        # Store session with expiration
-        await client.setex(
-            key,
-            int(expires_delta.total_seconds()),
-            json.dumps(session_data),
-        )
+        ttl = int(expires_delta.total_seconds())
+        index_key = self._user_index_key(user_id)
+
+        # Store session with expiration and index it under the user; the
+        # index lives at least as long as the longest-lived session
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(key, ttl, json.dumps(session_data))
+        pipe.sadd(index_key, session_id)
+        pipe.expire(index_key, ttl, nx=True)
+        pipe.expire(index_key, ttl, gt=True)
+        await pipe.execute()
 
         return session_id
 
@@ -194,8 +259,20 @@ class RedisSessionStore:
         client = await self.get_client()
         key = self._session_key(session_id)
 
-        result = await client.delete(key)
-        return result > 0
+        data = await client.get(key)
+        if data is None:
+            return False
+
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(key)
+        try:
+            user_id = json.loads(data).get("user_id")
+        except (json.JSONDecodeError, AttributeError):
+            user_id = None
+        if user_id:
+            pipe.srem(self._user_index_key(user_id), session_id)
+        results = await pipe.execute()
+        return results[0] > 0
 
     async def validate_session(
         self,
@@ -226,28 +303,35 @@ class RedisSessionStore:
         self,
         user_id: uuid.UUID,
         pattern: str = "*",
+        scan_fallback: bool = False,
     ) -> list:
         """
         Get all sessions for a user.
 
+        Sessions are read from the user's index set with batched MGETs;
+        index entries whose session has expired are pruned.
+
         Args:
             user_id: User ID
-            pattern: Key pattern to search
+            pattern: Unused, kept for backwards compatibility
+            scan_fallback: Whether to SCAN when the user has no index
 
         Returns:
             List of session IDs
         """
         client = await self.get_client()
-
-        # Find all user sessions
-        user_pattern = f"{self.prefix}{user_id}:*"
-        keys = await client.keys(user_pattern)
+        session_ids = await self._get_user_session_ids(client, str(user_id), scan_fallback)
 
         sessions = []
-        for key in keys:
-            session_id = key.replace(self.prefix, "")
-            session = await self.get_session(session_id)
-            if session is not None:
+        expired = []
+        for start in range(0, len(session_ids), SESSION_BATCH_SIZE):
+            batch = session_ids[start:start + SESSION_BATCH_SIZE]
+            values = await client.mget([self._session_key(sid) for sid in batch])
+            for session_id, data in zip(batch, values):
+                if data is None:
+                    expired.append(session_id)
+                    continue
+                session = json.loads(data)
                 sessions.append({
                     "session_id": session_id,
                     "created_at": session.get("created_at"),
@@ -256,37 +340,51 @@ class RedisSessionStore:
                     "user_agent": session.get("user_agent"),
                 })
 
+        if expired:
+            await client.srem(self._user_index_key(user_id), *expired)
+
         return sessions
 
     async def delete_user_sessions(
         self,
         user_id: uuid.UUID,
         except_session_id: str = None,
+        scan_fallback: bool = True,
     ) -> int:
         """
         Delete all sessions for a user.
 
+        Sessions are removed in pipelined UNLINK batches and dropped from
+        the user's index set.
+
         Args:
             user_id: User ID
             except_session_id: Session ID to preserve
+            scan_fallback: Whether to SCAN when the user has no index
 
         Returns:
             Number of sessions deleted
         """
         client = await self.get_client()
-
-        user_pattern = f"{self.prefix}{user_id}:*"
-        keys = await client.keys(user_pattern)
-
-        deleted = 0
-        for key in keys:
-            session_id = key.replace(self.prefix, "")
-            if except_session_id and session_id == except_session_id:
-                continue
-            if await client.delete(key):
-                deleted += 1
-
-        return deleted
+        index_key = self._user_index_key(user_id)
+        session_ids = [
+            sid
+            for sid in await self._get_user_session_ids(client, str(user_id), scan_fallback)
+            if sid != except_session_id
+        ]
+
+        if not session_ids:
+            return 0
+
+        pipe = client.pipeline(transaction=False)
+        for start in range(0, len(session_ids), SESSION_BATCH_SIZE):
+            batch = session_ids[start:start + SESSION_BATCH_SIZE]
+            pipe.unlink(*[self._session_key(sid) for sid in batch])
+            pipe.srem(index_key, *batch)
+        results = await pipe.execute()
+
+        # Results alternate UNLINK count, SREM count
+        return sum(results[::2])
 
 
 # Session store instance
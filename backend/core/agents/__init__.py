@@ -77,6 +77,8 @@ from .state import (
     update_state,
     add_message,
     add_error,
+    merge_dicts,
+    merge_unique,
 )
 
 from .human_in_the_loop import (
@@ -172,6 +174,7 @@ from .interrupt_websocket import (
     
     # Factory Functions
     create_websocket_interrupt_manager,
+    get_websocket_interrupt_manager,
     create_websocket_interrupt_handler,
 )
 
@@ -184,6 +187,7 @@ from .supervisor import (
     TaskDelegationStatus,
     AggregationStatus,
     ParallelExecutionStatus,
+    ParallelFailurePolicy,
     SharedStateScope,
     
     # Message Protocol Enums
@@ -318,6 +322,7 @@ from .streaming import (
     
     # Base Handler
     StreamHandler,
+    StreamStateStore,
     
     # Specialized Handlers
     LLMOutputHandler,
@@ -331,6 +336,7 @@ from .streaming import (
     TokenStreamingManager,
     WebSocketStreamManager,
     FrontendWebSocketBridge,
+    EventReplayLog,
     
     # Factory Functions
     create_streaming_manager,
@@ -587,6 +593,8 @@ __all__ = [
     "update_state",
     "add_message",
     "add_error",
+    "merge_dicts",
+    "merge_unique",
     
     # Human-in-the-Loop
     "InterruptType",
@@ -642,6 +650,7 @@ __all__ = [
     "WebSocketInterruptManager",
     "InterruptWebSocketHandler",
     "create_websocket_interrupt_manager",
+    "get_websocket_interrupt_manager",
     "create_websocket_interrupt_handler",
     
     # Frontend Interrupt Handling
@@ -662,6 +671,7 @@ __all__ = [
     "TaskDelegationStatus",
     "AggregationStatus",
     "ParallelExecutionStatus",
+    "ParallelFailurePolicy",
     "SharedStateScope",
     "MessageProtocolType",
     "MessagePriority",
@@ -736,6 +746,7 @@ __all__ = [
     "FrontendStreamConfig",
     "TokenBuffer",
     "StreamHandler",
+    "StreamStateStore",
     "LLMOutputHandler",
     "ToolOutputHandler",
     "AgentOutputHandler",
@@ -745,6 +756,7 @@ __all__ = [
     "TokenStreamingManager",
     "WebSocketStreamManager",
     "FrontendWebSocketBridge",
+    "EventReplayLog",
     "create_streaming_manager",
     "create_websocket_manager",
     "create_frontend_websocket_bridge",
@@ -1354,11 +1354,13 @@ class InterruptPersistence:
         self._redis_client = None
     
     async def _get_redis_client(self):
-        """Get or create Redis client."""
+        """Get a Redis client on the shared connection pool."""
         if self._redis_client is None:
             try:
-                import redis.asyncio as redis
-                self._redis_client = redis.from_url(self.redis_url)
+                from backend.cache.connection import get_redis_registry
+                self._redis_client = get_redis_registry().get_client(
+                    self.redis_url, decode_responses=False,
+                )
             except ImportError:
                 raise ImportError(
                     "redis package required for interrupt persistence. "
@@ -3513,11 +3515,13 @@ class InterruptCheckpointManager:
         self._local_checkpoints: Dict[str, Dict[str, Any]] = {}
     
     async def _get_redis_client(self):
-        """Get or create Redis client."""
+        """Get a Redis client on the shared connection pool."""
         if self._redis_client is None:
             try:
-                import redis.asyncio as redis
-                self._redis_client = redis.from_url(self.redis_url)
+                from backend.cache.connection import get_redis_registry
+                self._redis_client = get_redis_registry().get_client(
+                    self.redis_url, decode_responses=False,
+                )
             except ImportError:
                 raise ImportError(
                     "redis package required for checkpoint persistence. "
@@ -28,6 +28,8 @@ from .state import (
     add_error,
 )
 from ..llm import get_llm_client, TaskComplexity
+from ..llm_limiter import LLMPriority
+from ..prompts import render_context
 
 
 # ==================== Node Names ====================
@@ -189,15 +191,15 @@ class InterrogationAgent:
         rag_context = state.get("rag_context", [])
         existing_questions = state.get("generated_questions", [])
         
+        # Rendered once and sent as a shared prefix so every call can hit the prompt cache
+        shared_context = self._shared_context(rag_context)
         generated_questions = []
         
         for category in missing_categories:
             # Generate question using LLM
             prompt = f"""
-            Generate a thoughtful question for the '{category.value}' decision category.
-            
-            Context from similar decisions:
-            {rag_context[:3] if rag_context else 'No prior context available.'}
+            Generate a thoughtful question for the '{category.value}' decision category,
+            using the context from similar decisions above.
             
             Existing questions in this category:
             {[q for q in existing_questions if q.category == category]}
@@ -208,6 +210,8 @@ class InterrogationAgent:
             response = await self.llm.agenerate(
                 prompt=prompt,
                 system_message="You are an expert software architect helping to define project requirements.",
+                shared_context=shared_context,
+                priority=LLMPriority.INTERACTIVE,
             )
             
             question = Question(
@@ -382,15 +386,14 @@ class InterrogationAgent:
         prompt = f"""
         Question: {question.text}
         
-        Context from similar projects:
-        {rag_context[:3] if rag_context else 'No prior context available.'}
-        
-        Based on the context and best practices, suggest an appropriate answer for this architectural decision.
+        Based on the context from similar projects above and best practices, suggest an appropriate answer for this architectural decision.
         """
         
         response = await self.llm.agenerate(
             prompt=prompt,
             system_message="You are an expert software architect. Provide a thoughtful suggestion for this architectural decision.",
+            shared_context=self._shared_context(rag_context),
+            priority=LLMPriority.INTERACTIVE,
         )
         
         suggested_answer = str(response)
@@ -475,6 +478,12 @@ class InterrogationAgent:
             for i, c in enumerate(relevant_context[:3])
         ])
     
+    def _shared_context(self, rag_context: List[Dict[str, Any]]) -> str:
+        """Render retrieved context as the shared prompt prefix."""
+        if not rag_context:
+            return "Context from similar projects: No prior context available."
+        return "Context from similar projects:\n" + render_context(rag_context[:3])
+    
     def _format_question_text(self, question: Question) -> str:
         """Format question text for presentation."""
         parts = []
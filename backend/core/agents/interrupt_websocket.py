@@ -8,13 +8,14 @@ This module provides:
 4. Response handling via WebSocket
 """
 
-from typing import Any, Dict, List, Optional, Callable, Set
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Set
 from enum import Enum
 from datetime import datetime
 from uuid import uuid4
 from pydantic import BaseModel, Field
 import asyncio
 import json
+import logging
 
 from .human_in_the_loop import (
     HumanInterruptConfig,
@@ -23,6 +24,12 @@ from .human_in_the_loop import (
     InterruptType,
 )
 
+logger = logging.getLogger(__name__)
+
+# Backoff bounds (seconds) for resubscribing the relay after a Redis error
+_RELAY_RETRY_MIN = 1.0
+_RELAY_RETRY_MAX = 30.0
+
 
 class WebSocketState(str, Enum):
     """WebSocket connection states."""
@@ -66,13 +73,40 @@ class WebSocketInterruptManager:
     2. Interrupt subscription by thread/project
     3. Real-time notification broadcasting
     4. Response handling via WebSocket
+    5. Concurrent async delivery with per-connection failure tracking
+    6. Cross-worker fan-out over a shared Redis pub/sub channel
+    
+    Each worker only indexes its own connections; notifications published
+    through the relay reach every worker, which delivers to its local
+    subscribers, so the subscription registry is sharded by worker.
     """
     
-    def __init__(self):
-        """Initialize the WebSocket interrupt manager."""
+    def __init__(
+        self,
+        send_timeout: float = 1.0,
+        max_send_failures: int = 3,
+    ):
+        """
+        Initialize the WebSocket interrupt manager.
+        
+        Args:
+            send_timeout: Per-connection timeout for async sends (seconds)
+            max_send_failures: Consecutive failed sends before a connection is dropped
+        """
         self._connections: Dict[str, Set[str]] = {}  # connection_id -> set of subscribed thread_ids
+        self._connection_projects: Dict[str, Set[str]] = {}  # connection_id -> set of subscribed project_ids
         self._thread_subscribers: Dict[str, Set[str]] = {}  # thread_id -> set of connection_ids
         self._project_subscribers: Dict[str, Set[str]] = {}  # project_id -> set of connection_ids
+        self._failure_counts: Dict[str, int] = {}  # connection_id -> consecutive failed sends
+        self._delivery_stats: Dict[str, int] = {"sent": 0, "failed": 0, "dropped_connections": 0}
+        self.send_timeout = send_timeout
+        self.max_send_failures = max(1, max_send_failures)
+        self._relay_client = None
+        self._relay_pubsub = None
+        self._relay_channel: Optional[str] = None
+        self._relay_task: Optional[asyncio.Task] = None
+        self._relay_send_func: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None
+        self._relay_deliveries: Set[asyncio.Task] = set()
         self._interrupt_handlers: Dict[str, Callable] = {}
         self._notification_handlers: List[Callable] = []
         self._connection_handlers: Dict[str, List[Callable]] = {
@@ -95,6 +129,7 @@ class WebSocketInterruptManager:
             project_ids: List of project IDs to subscribe to
         """
         self._connections[connection_id] = set(thread_ids or [])
+        self._connection_projects[connection_id] = set(project_ids or [])
         
         # Subscribe to threads
         for thread_id in thread_ids or []:
@@ -133,7 +168,7 @@ class WebSocketInterruptManager:
                     del self._thread_subscribers[thread_id]
         
         # Remove from project subscribers
-        for project_id in self._connections[connection_id]:
+        for project_id in self._connection_projects.pop(connection_id, set()):
             if project_id in self._project_subscribers:
                 self._project_subscribers[project_id].discard(connection_id)
                 if not self._project_subscribers[project_id]:
@@ -141,6 +176,7 @@ class WebSocketInterruptManager:
         
         # Remove connection
         del self._connections[connection_id]
+        self._failure_counts.pop(connection_id, None)
         
         # Trigger disconnect handlers
         for handler in self._connection_handlers.get("disconnect", []):
@@ -175,7 +211,7 @@ class WebSocketInterruptManager:
         if connection_id not in self._connections:
             self._connections[connection_id] = set()
         
-        self._connections[connection_id].add(project_id)
+        self._connection_projects.setdefault(connection_id, set()).add(project_id)
         
         if project_id not in self._project_subscribers:
             self._project_subscribers[project_id] = set()
@@ -183,8 +219,8 @@ class WebSocketInterruptManager:
     
     def unsubscribe_from_project(self, connection_id: str, project_id: str) -> None:
         """Unsubscribe a connection from a project."""
-        if connection_id in self._connections:
-            self._connections[connection_id].discard(project_id)
+        if connection_id in self._connection_projects:
+            self._connection_projects[connection_id].discard(project_id)
         
         if project_id in self._project_subscribers:
             self._project_subscribers[project_id].discard(connection_id)
@@ -214,22 +250,8 @@ class WebSocketInterruptManager:
         Returns:
             Number of connections notified
         """
-        message = {
-            "type": "interrupt",
-            "notification": notification.model_dump(mode="json"),
-        }
-        
-        count = 0
-        subscribers = self.get_thread_subscribers(notification.thread_id)
-        
-        for connection_id in subscribers:
-            try:
-                send_func(connection_id, message)
-                count += 1
-            except Exception:
-                pass
-        
-        return count
+        message = self._build_interrupt_message(notification)
+        return self._deliver(notification.thread_id, message, send_func)
     
     def broadcast_interrupt_update(
         self,
@@ -248,22 +270,8 @@ class WebSocketInterruptManager:
         Returns:
             Number of connections notified
         """
-        message = {
-            "type": "interrupt_update",
-            "update": update.model_dump(mode="json"),
-        }
-        
-        count = 0
-        subscribers = self.get_thread_subscribers(thread_id)
-        
-        for connection_id in subscribers:
-            try:
-                send_func(connection_id, message)
-                count += 1
-            except Exception:
-                pass
-        
-        return count
+        message = self._build_update_message(update)
+        return self._deliver(thread_id, message, send_func)
     
     def broadcast_interrupt_response(
         self,
@@ -282,7 +290,29 @@ class WebSocketInterruptManager:
         Returns:
             Number of connections notified
         """
-        message = {
+        message = self._build_response_message(response)
+        return self._deliver(thread_id, message, send_func)
+    
+    @staticmethod
+    def _build_interrupt_message(notification: InterruptNotification) -> Dict[str, Any]:
+        """Build the WebSocket message for an interrupt notification."""
+        return {
+            "type": "interrupt",
+            "notification": notification.model_dump(mode="json"),
+        }
+    
+    @staticmethod
+    def _build_update_message(update: InterruptUpdate) -> Dict[str, Any]:
+        """Build the WebSocket message for an interrupt update."""
+        return {
+            "type": "interrupt_update",
+            "update": update.model_dump(mode="json"),
+        }
+    
+    @staticmethod
+    def _build_response_message(response: InterruptResponse) -> Dict[str, Any]:
+        """Build the WebSocket message for an interrupt response."""
+        return {
             "type": "interrupt_response",
             "response": {
                 "response_id": response.response_id,
@@ -294,19 +324,238 @@ class WebSocketInterruptManager:
                 "responded_by": response.user_id,
             },
         }
+    
+    def _record_send_result(self, connection_id: str, success: bool) -> None:
+        """Track consecutive send failures, dropping connections that keep failing."""
+        if success:
+            self._delivery_stats["sent"] += 1
+            self._failure_counts.pop(connection_id, None)
+            return
         
+        self._delivery_stats["failed"] += 1
+        if connection_id not in self._connections:
+            # Unregistered while the send was in flight
+            self._failure_counts.pop(connection_id, None)
+            return
+        failures = self._failure_counts.get(connection_id, 0) + 1
+        self._failure_counts[connection_id] = failures
+        if failures >= self.max_send_failures:
+            self._delivery_stats["dropped_connections"] += 1
+            self.unregister_connection(connection_id)
+    
+    def _deliver(
+        self,
+        thread_id: str,
+        message: Dict[str, Any],
+        send_func: Callable[[str, Dict[str, Any]], None],
+    ) -> int:
+        """Send a message to a thread's subscribers one by one."""
         count = 0
-        subscribers = self.get_thread_subscribers(thread_id)
-        
-        for connection_id in subscribers:
+        for connection_id in self.get_thread_subscribers(thread_id):
             try:
                 send_func(connection_id, message)
-                count += 1
             except Exception:
-                pass
+                self._record_send_result(connection_id, False)
+                continue
+            self._record_send_result(connection_id, True)
+            count += 1
+        return count
+    
+    async def _adeliver(
+        self,
+        thread_id: str,
+        message: Dict[str, Any],
+        send_func: Callable[[str, Dict[str, Any]], Awaitable[None]],
+    ) -> int:
+        """Send a message to a thread's subscribers concurrently."""
+        subscribers = list(self.get_thread_subscribers(thread_id))
+        if not subscribers:
+            return 0
+        
+        async def send(connection_id: str) -> None:
+            await asyncio.wait_for(send_func(connection_id, message), timeout=self.send_timeout)
+        
+        results = await asyncio.gather(
+            *(send(connection_id) for connection_id in subscribers),
+            return_exceptions=True,
+        )
         
+        count = 0
+        for connection_id, result in zip(subscribers, results):
+            success = not isinstance(result, BaseException)
+            self._record_send_result(connection_id, success)
+            count += int(success)
         return count
     
+    async def abroadcast_interrupt(
+        self,
+        notification: InterruptNotification,
+        send_func: Callable[[str, Dict[str, Any]], Awaitable[None]],
+    ) -> int:
+        """
+        Broadcast an interrupt notification to local subscribers concurrently.
+        
+        Args:
+            notification: The interrupt notification to broadcast
+            send_func: Coroutine function sending a message to a connection
+        
+        Returns:
+            Number of connections notified
+        """
+        message = self._build_interrupt_message(notification)
+        return await self._adeliver(notification.thread_id, message, send_func)
+    
+    async def abroadcast_interrupt_update(
+        self,
+        update: InterruptUpdate,
+        thread_id: str,
+        send_func: Callable[[str, Dict[str, Any]], Awaitable[None]],
+    ) -> int:
+        """Broadcast an interrupt status update to local subscribers concurrently."""
+        message = self._build_update_message(update)
+        return await self._adeliver(thread_id, message, send_func)
+    
+    async def abroadcast_interrupt_response(
+        self,
+        response: InterruptResponse,
+        thread_id: str,
+        send_func: Callable[[str, Dict[str, Any]], Awaitable[None]],
+    ) -> int:
+        """Broadcast an interrupt response to local subscribers concurrently."""
+        message = self._build_response_message(response)
+        return await self._adeliver(thread_id, message, send_func)
+    
+    # ==================== Cross-worker relay ====================
+    
+    async def start_relay(
+        self,
+        send_func: Callable[[str, Dict[str, Any]], Awaitable[None]],
+        redis_client: Any = None,
+        channel: Optional[str] = None,
+    ) -> None:
+        """
+        Start relaying interrupt messages between workers over Redis pub/sub.
+        
+        Args:
+            send_func: Coroutine function sending a message to a local connection
+            redis_client: Optional async Redis client (shared client if None)
+            channel: Pub/sub channel (defaults to INTERRUPT_CHANNEL)
+        """
+        if self._relay_task is not None and not self._relay_task.done():
+            return
+        
+        if redis_client is None:
+            from backend.cache.connection import init_redis
+            redis_client = await init_redis()
+        if channel is None:
+            from backend.cache.connection import INTERRUPT_CHANNEL
+            channel = INTERRUPT_CHANNEL
+        
+        self._relay_client = redis_client
+        self._relay_channel = channel
+        self._relay_send_func = send_func
+        try:
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(channel)
+            self._relay_pubsub = pubsub
+        except Exception as e:
+            # The relay loop keeps retrying the subscription
+            logger.warning(f"Interrupt relay subscription failed: {e}")
+        self._relay_task = asyncio.create_task(self._relay_loop())
+    
+    async def stop_relay(self) -> None:
+        """Stop the cross-worker relay."""
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+        
+        if self._relay_pubsub is not None:
+            try:
+                await self._relay_pubsub.unsubscribe(self._relay_channel)
+                await self._relay_pubsub.close()
+            except Exception as e:
+                logger.warning(f"Failed to close interrupt relay subscription: {e}")
+            self._relay_pubsub = None
+    
+    async def _relay_loop(self) -> None:
+        """Deliver relayed messages to local subscribers, resubscribing after errors."""
+        delay = _RELAY_RETRY_MIN
+        while True:
+            try:
+                if self._relay_pubsub is None:
+                    pubsub = self._relay_client.pubsub()
+                    await pubsub.subscribe(self._relay_channel)
+                    self._relay_pubsub = pubsub
+                    delay = _RELAY_RETRY_MIN
+                async for raw in self._relay_pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    try:
+                        payload = json.loads(raw["data"])
+                        thread_id = payload["thread_id"]
+                        message = payload["message"]
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    
+                    # Deliver without blocking the listener on slow connections
+                    task = asyncio.create_task(
+                        self._adeliver(thread_id, message, self._relay_send_func)
+                    )
+                    self._relay_deliveries.add(task)
+                    task.add_done_callback(self._relay_deliveries.discard)
+                raise ConnectionError("pub/sub connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Interrupt relay failed, resubscribing in {delay:.0f}s: {e}")
+                pubsub, self._relay_pubsub = self._relay_pubsub, None
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RELAY_RETRY_MAX)
+    
+    async def _publish(self, thread_id: str, message: Dict[str, Any]) -> int:
+        """Publish a message to all workers, or deliver locally without a running relay."""
+        if self._relay_client is not None and self._relay_task is not None and not self._relay_task.done():
+            payload = json.dumps({"thread_id": thread_id, "message": message}, default=str)
+            try:
+                return await self._relay_client.publish(self._relay_channel, payload)
+            except Exception as e:
+                logger.warning(f"Failed to publish interrupt message, delivering locally: {e}")
+        
+        if self._relay_send_func is None:
+            return 0
+        return await self._adeliver(thread_id, message, self._relay_send_func)
+    
+    async def publish_interrupt(self, notification: InterruptNotification) -> int:
+        """
+        Publish an interrupt notification to subscribers on every worker.
+        
+        Args:
+            notification: The interrupt notification to publish
+        
+        Returns:
+            Number of workers that received it (local deliveries without a relay)
+        """
+        return await self._publish(
+            notification.thread_id, self._build_interrupt_message(notification)
+        )
+    
+    async def publish_interrupt_update(self, update: InterruptUpdate, thread_id: str) -> int:
+        """Publish an interrupt status update to subscribers on every worker."""
+        return await self._publish(thread_id, self._build_update_message(update))
+    
+    async def publish_interrupt_response(self, response: InterruptResponse, thread_id: str) -> int:
+        """Publish an interrupt response to subscribers on every worker."""
+        return await self._publish(thread_id, self._build_response_message(response))
+    
     def register_interrupt_handler(
         self,
         interrupt_id: str,
@@ -368,6 +617,14 @@ class WebSocketInterruptManager:
     def get_all_project_ids(self) -> List[str]:
         """Get all subscribed project IDs."""
         return list(self._project_subscribers.keys())
+    
+    def get_failure_count(self, connection_id: str) -> int:
+        """Get the number of consecutive failed sends for a connection."""
+        return self._failure_counts.get(connection_id, 0)
+    
+    def get_delivery_stats(self) -> Dict[str, int]:
+        """Get delivery counters (sent, failed, dropped connections)."""
+        return dict(self._delivery_stats)
 
 
 class InterruptWebSocketHandler:
@@ -642,6 +899,24 @@ def create_websocket_interrupt_manager() -> WebSocketInterruptManager:
     return WebSocketInterruptManager()
 
 
+# Shared manager for the app's WebSocket connections
+_websocket_interrupt_manager: Optional[WebSocketInterruptManager] = None
+
+
+def get_websocket_interrupt_manager() -> WebSocketInterruptManager:
+    """
+    Get the process-wide WebSocket interrupt manager.
+    
+    Returns:
+        WebSocketInterruptManager instance
+    """
+    global _websocket_interrupt_manager
+    
+    if _websocket_interrupt_manager is None:
+        _websocket_interrupt_manager = WebSocketInterruptManager()
+    return _websocket_interrupt_manager
+
+
 def create_websocket_interrupt_handler(
     manager: Optional[WebSocketInterruptManager] = None,
 ) -> InterruptWebSocketHandler:
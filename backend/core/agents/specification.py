@@ -5,13 +5,18 @@ This module implements the SpecificationAgent as a LangGraph StateGraph
 that manages artifact generation from decisions.
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Tuple, Union
 from datetime import datetime
 from uuid import uuid4
-import json
+import asyncio
+import logging
+import os
+import re
+import time
 
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import CheckpointSaver
+from langgraph.types import Send
 
 from .types import (
     AgentType,
@@ -19,10 +24,43 @@ from .types import (
     Artifact,
     ArtifactType,
     ArtifactFormat,
-    SpecificationAgentState,
 )
-from .state import create_specification_state
-from ..llm import get_llm_client, TaskComplexity, select_model
+from .state import SpecificationAgentState, create_specification_state
+from ..llm import get_llm_client, ModelConfig, TaskComplexity, select_model
+from ..prompts import build_messages, render_decisions
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum concurrent LLM calls across parallel generation branches
+SPEC_LLM_CONCURRENCY = int(os.getenv("SPEC_LLM_CONCURRENCY", "4"))
+
+# Characters of each upstream artifact included in a dependent node's prompt
+SPEC_UPSTREAM_CONTEXT_CHARS = int(os.getenv("SPEC_UPSTREAM_CONTEXT_CHARS", "4000"))
+
+# Streamed characters between partial-content pushes to listeners
+SPEC_STREAM_PUBLISH_CHARS = int(os.getenv("SPEC_STREAM_PUBLISH_CHARS", "400"))
+
+# Minimum seconds between checkpoints of completed sections
+SPEC_STREAM_CHECKPOINT_SECONDS = float(os.getenv("SPEC_STREAM_CHECKPOINT_SECONDS", "5"))
+
+# Section starts: markdown headings, Gherkin features and top-level YAML keys
+_SECTION_START = re.compile(r"^(?:#{1,6} |Feature:|[A-Za-z_][\w-]*:[ \t]*$)", re.MULTILINE)
+
+RESUME_INSTRUCTIONS = """
+
+        A previous attempt was interrupted. The output below was already
+        written; continue directly after it without repeating any of it:
+
+{content}"""
+
+
+def _completed_sections_end(content: str) -> int:
+    """Offset where the last (possibly unfinished) section starts."""
+    last = 0
+    for match in _SECTION_START.finditer(content):
+        last = match.start()
+    return last
 
 
 # ==================== Node Names ====================
@@ -31,6 +69,7 @@ class SpecificationNode:
     """Node names for the Specification Agent."""
     START = "start"
     CHECK_DEPENDENCIES = "check_dependencies"
+    SCHEDULE_ARTIFACTS = "schedule_artifacts"
     GENERATE_PRD = "generate_prd"
     GENERATE_API_CONTRACTS = "generate_api_contracts"
     GENERATE_DB_SCHEMA = "generate_db_schema"
@@ -42,6 +81,34 @@ class SpecificationNode:
     END = "end"
 
 
+# Generation DAG: node -> nodes whose artifacts it builds on. Every node whose
+# dependencies are complete runs in the same step, so a full specification
+# takes two LLM round trips (the critical path) instead of seven.
+ARTIFACT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    SpecificationNode.GENERATE_PRD: (),
+    SpecificationNode.GENERATE_ARCHITECTURE: (),
+    SpecificationNode.GENERATE_DB_SCHEMA: (),
+    SpecificationNode.GENERATE_API_CONTRACTS: (),
+    SpecificationNode.GENERATE_TICKETS: (SpecificationNode.GENERATE_PRD,),
+    SpecificationNode.GENERATE_TESTS: (
+        SpecificationNode.GENERATE_PRD,
+        SpecificationNode.GENERATE_API_CONTRACTS,
+    ),
+    SpecificationNode.GENERATE_DEPLOYMENT: (SpecificationNode.GENERATE_ARCHITECTURE,),
+}
+
+# Artifact type produced by each generation node
+ARTIFACT_NODE_TYPES: Dict[str, ArtifactType] = {
+    SpecificationNode.GENERATE_PRD: ArtifactType.PRD,
+    SpecificationNode.GENERATE_API_CONTRACTS: ArtifactType.API_SPEC,
+    SpecificationNode.GENERATE_DB_SCHEMA: ArtifactType.DATABASE_SCHEMA,
+    SpecificationNode.GENERATE_TICKETS: ArtifactType.TICKETS,
+    SpecificationNode.GENERATE_ARCHITECTURE: ArtifactType.ARCHITECTURE_DIAGRAM,
+    SpecificationNode.GENERATE_TESTS: ArtifactType.TEST_PLAN,
+    SpecificationNode.GENERATE_DEPLOYMENT: ArtifactType.DEPLOYMENT_GUIDE,
+}
+
+
 # ==================== Specification Agent ====================
 
 class SpecificationAgent:
@@ -58,6 +125,9 @@ class SpecificationAgent:
         self,
         checkpoint_saver: Optional[CheckpointSaver] = None,
         on_progress: Optional[Callable[[str, float], None]] = None,
+        llm_concurrency: int = SPEC_LLM_CONCURRENCY,
+        on_partial: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+        storage_service: Optional[Any] = None,
     ):
         """
         Initialize the Specification Agent.
@@ -65,10 +135,19 @@ class SpecificationAgent:
         Args:
             checkpoint_saver: Checkpoint saver for state persistence
             on_progress: Progress callback
+            llm_concurrency: Maximum concurrent LLM calls across generation nodes
+            on_partial: Async callback for streamed content (project_id, data);
+                defaults to broadcast_artifact_progress
+            storage_service: StorageService for partial checkpoints
+                (defaults to the shared instance)
         """
         self.checkpoint_saver = checkpoint_saver
         self.on_progress = on_progress
+        self.on_partial = on_partial
+        self.storage_service = storage_service
         self.llm = get_llm_client()
+        self.llm_concurrency = max(1, llm_concurrency)
+        self._llm_semaphore = asyncio.Semaphore(self.llm_concurrency)
         self.graph = self._build_graph()
     
     def _build_graph(self) -> StateGraph:
@@ -84,6 +163,7 @@ class SpecificationAgent:
         # Add nodes
         builder.add_node(SpecificationNode.START, self._start_node)
         builder.add_node(SpecificationNode.CHECK_DEPENDENCIES, self._check_dependencies_node)
+        builder.add_node(SpecificationNode.SCHEDULE_ARTIFACTS, self._schedule_artifacts_node)
         builder.add_node(SpecificationNode.GENERATE_PRD, self._generate_prd_node)
         builder.add_node(SpecificationNode.GENERATE_API_CONTRACTS, self._generate_api_contracts_node)
         builder.add_node(SpecificationNode.GENERATE_DB_SCHEMA, self._generate_db_schema_node)
@@ -100,40 +180,30 @@ class SpecificationAgent:
         # Add edges
         builder.add_edge(SpecificationNode.START, SpecificationNode.CHECK_DEPENDENCIES)
         
-        # Parallel generation edges
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_PRD)
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_API_CONTRACTS)
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_DB_SCHEMA)
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_ARCHITECTURE)
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_TESTS)
-        builder.add_edge(SpecificationNode.CHECK_DEPENDENCIES, SpecificationNode.GENERATE_DEPLOYMENT)
-        
-        # All generation nodes go to validation
-        all_generation = [
-            SpecificationNode.GENERATE_PRD,
-            SpecificationNode.GENERATE_API_CONTRACTS,
-            SpecificationNode.GENERATE_DB_SCHEMA,
-            SpecificationNode.GENERATE_TICKETS,
-            SpecificationNode.GENERATE_ARCHITECTURE,
-            SpecificationNode.GENERATE_TESTS,
-            SpecificationNode.GENERATE_DEPLOYMENT,
-        ]
-        
-        for node in all_generation:
-            builder.add_edge(node, SpecificationNode.VALIDATE_ARTIFACT)
-        
-        builder.add_edge(SpecificationNode.VALIDATE_ARTIFACT, SpecificationNode.END)
-        
         # Conditional edge for missing dependencies
         builder.add_conditional_edges(
             SpecificationNode.CHECK_DEPENDENCIES,
             self._dependencies_router,
             {
-                "complete": all_generation,
+                "complete": SpecificationNode.SCHEDULE_ARTIFACTS,
                 "incomplete": SpecificationNode.END,
             },
         )
         
+        # DAG fan-out: the scheduler sends every ready generation node as a
+        # parallel branch; each branch loops back until all are complete
+        builder.add_conditional_edges(
+            SpecificationNode.SCHEDULE_ARTIFACTS,
+            self._schedule_router,
+            [*ARTIFACT_DEPENDENCIES, SpecificationNode.VALIDATE_ARTIFACT],
+        )
+        
+        for node in ARTIFACT_DEPENDENCIES:
+            builder.add_edge(node, SpecificationNode.SCHEDULE_ARTIFACTS)
+        
+        builder.add_edge(SpecificationNode.VALIDATE_ARTIFACT, SpecificationNode.END)
+        builder.add_edge(SpecificationNode.END, END)
+        
         # Compile with checkpoint saver
         if self.checkpoint_saver:
             builder.checkpointer = self.checkpoint_saver
@@ -193,23 +263,26 @@ class SpecificationAgent:
         
         return state
     
-    async def _generate_prd_node(
+    async def _schedule_artifacts_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
-        """Generate Product Requirements Document."""
-        decisions = state.get("decisions", {})
+    ) -> Dict[str, Any]:
+        """Report generation progress between DAG steps."""
+        completed = state.get("completed_nodes", [])
+        progress = 0.1 + 0.8 * len(completed) / len(ARTIFACT_DEPENDENCIES)
         
-        # Collect all decision text
-        decision_texts = []
-        for decision_id, decision in decisions.items():
-            if hasattr(decision, "answer_text"):
-                decision_texts.append(f"- **{decision.category.value}**: {decision.answer_text}")
+        if self.on_progress:
+            self.on_progress("generating_artifacts", progress)
         
-        prompt = f"""
-        Generate a comprehensive Product Requirements Document (PRD) based on the following architectural decisions:
-
-        {chr(10).join(decision_texts)}
+        return {"generation_progress": progress}
+    
+    async def _generate_prd_node(
+        self,
+        state: SpecificationAgentState,
+    ) -> Dict[str, Any]:
+        """Generate Product Requirements Document."""
+        prompt = """
+        Generate a comprehensive Product Requirements Document (PRD) based on the project decisions above.
 
         The PRD should include:
         1. Executive Summary
@@ -223,12 +296,12 @@ class SpecificationAgent:
         Format the output as well-structured markdown.
         """
         
-        selection = select_model(TaskComplexity.COMPLEX)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_PRD,
+            prompt,
             system_message="You are an expert product manager creating comprehensive PRDs.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.COMPLEX,
         )
         
         artifact = Artifact(
@@ -237,38 +310,20 @@ class SpecificationAgent:
             type=ArtifactType.PRD,
             format=ArtifactFormat.MARKDOWN,
             title="Product Requirements Document",
-            content=str(response) if hasattr(response, "__str__") else response.text,
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        # Update progress
-        progress = state.get("generation_progress", 0.0) + 0.15
-        state["generation_progress"] = progress
-        if self.on_progress:
-            self.on_progress("prd_generated", progress)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_PRD, artifact)
     
     async def _generate_api_contracts_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate API contracts (OpenAPI)."""
-        decisions = state.get("decisions", {})
-        
-        # Extract API-related decisions
-        api_decisions = [
-            d for d in decisions.values()
-            if hasattr(d, "category") and d.category.value in ["api_design", "architecture"]
-        ]
-        
-        prompt = f"""
-        Generate OpenAPI 3.0 specification based on these architectural decisions:
-
-        {json.dumps([d.answer_text if hasattr(d, 'answer_text') else str(d) for d in api_decisions], indent=2)}
+        prompt = """
+        Generate OpenAPI 3.0 specification based on the project decisions above,
+        focusing on the api_design and architecture decisions.
 
         Include:
         - API title and version
@@ -280,12 +335,12 @@ class SpecificationAgent:
         Return valid OpenAPI YAML.
         """
         
-        selection = select_model(TaskComplexity.MODERATE)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_API_CONTRACTS,
+            prompt,
             system_message="You are an expert API designer creating OpenAPI specifications.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.MODERATE,
         )
         
         artifact = Artifact(
@@ -294,32 +349,20 @@ class SpecificationAgent:
             type=ArtifactType.API_SPEC,
             format=ArtifactFormat.OPENAPI,
             title="API Specification",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_API_CONTRACTS, artifact)
     
     async def _generate_db_schema_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate database schema."""
-        decisions = state.get("decisions", {})
-        
-        # Extract data model decisions
-        db_decisions = [
-            d for d in decisions.values()
-            if hasattr(d, "category") and d.category.value in ["data_model", "architecture"]
-        ]
-        
-        prompt = f"""
-        Generate database schema (SQL DDL and Mermaid ERD) based on:
-
-        {json.dumps([d.answer_text if hasattr(d, 'answer_text') else str(d) for d in db_decisions], indent=2)}
+        prompt = """
+        Generate database schema (SQL DDL and Mermaid ERD) based on the project
+        decisions above, focusing on the data_model and architecture decisions.
 
         Include:
         - Create table statements with constraints
@@ -330,12 +373,12 @@ class SpecificationAgent:
         Output as markdown with SQL and Mermaid code blocks.
         """
         
-        selection = select_model(TaskComplexity.MODERATE)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_DB_SCHEMA,
+            prompt,
             system_message="You are an expert database designer creating schemas.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.MODERATE,
         )
         
         artifact = Artifact(
@@ -344,26 +387,22 @@ class SpecificationAgent:
             type=ArtifactType.DATABASE_SCHEMA,
             format=ArtifactFormat.MERMAID,
             title="Database Schema",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_DB_SCHEMA, artifact)
     
     async def _generate_tickets_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate development tickets."""
-        decisions = state.get("decisions", {})
-        
         prompt = f"""
-        Generate development tickets (user stories with acceptance criteria) based on:
+        Generate development tickets (user stories with acceptance criteria) based on
+        the project decisions above.
 
-        {json.dumps({d.decision_id: d.answer_text for d in decisions.values() if hasattr(d, 'decision_id')}, indent=2)}
+        {self._upstream_context(state, SpecificationNode.GENERATE_TICKETS)}
 
         Format each ticket as:
         ## Ticket Title
@@ -379,12 +418,12 @@ class SpecificationAgent:
         - Notes here
         """
         
-        selection = select_model(TaskComplexity.MODERATE)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_TICKETS,
+            prompt,
             system_message="You are an expert project manager creating tickets.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.MODERATE,
         )
         
         artifact = Artifact(
@@ -393,26 +432,19 @@ class SpecificationAgent:
             type=ArtifactType.TICKETS,
             format=ArtifactFormat.MARKDOWN,
             title="Development Tickets",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_TICKETS, artifact)
     
     async def _generate_architecture_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate architecture diagrams."""
-        decisions = state.get("decisions", {})
-        
-        prompt = f"""
-        Generate C4 architecture diagrams (Mermaid) based on:
-
-        {json.dumps([d.answer_text if hasattr(d, 'answer_text') else str(d) for d in decisions.values()], indent=2)}
+        prompt = """
+        Generate C4 architecture diagrams (Mermaid) based on the project decisions above.
 
         Include:
         - System Context diagram
@@ -423,12 +455,12 @@ class SpecificationAgent:
         Use Mermaid syntax for all diagrams.
         """
         
-        selection = select_model(TaskComplexity.COMPLEX)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_ARCHITECTURE,
+            prompt,
             system_message="You are an expert architect creating diagrams.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.COMPLEX,
         )
         
         artifact = Artifact(
@@ -437,26 +469,22 @@ class SpecificationAgent:
             type=ArtifactType.ARCHITECTURE_DIAGRAM,
             format=ArtifactFormat.MERMAID,
             title="Architecture Diagrams",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_ARCHITECTURE, artifact)
     
     async def _generate_tests_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate test specifications."""
-        decisions = state.get("decisions", {})
-        
         prompt = f"""
-        Generate Gherkin test specifications (Given-When-Then format) based on:
+        Generate Gherkin test specifications (Given-When-Then format) based on the
+        project decisions above.
 
-        {json.dumps([d.answer_text if hasattr(d, 'answer_text') else str(d) for d in decisions.values()], indent=2)}
+        {self._upstream_context(state, SpecificationNode.GENERATE_TESTS)}
 
         Include:
         - Feature files with scenarios
@@ -464,12 +492,12 @@ class SpecificationAgent:
         - Examples table for scenarios
         """
         
-        selection = select_model(TaskComplexity.MODERATE)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_TESTS,
+            prompt,
             system_message="You are an expert QA engineer creating test specs.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.MODERATE,
         )
         
         artifact = Artifact(
@@ -478,26 +506,21 @@ class SpecificationAgent:
             type=ArtifactType.TEST_PLAN,
             format=ArtifactFormat.GHERKIN,
             title="Test Specifications",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_TESTS, artifact)
     
     async def _generate_deployment_node(
         self,
         state: SpecificationAgentState,
-    ) -> SpecificationAgentState:
+    ) -> Dict[str, Any]:
         """Generate deployment guide."""
-        decisions = state.get("decisions", {})
-        
         prompt = f"""
-        Generate deployment guide based on:
+        Generate deployment guide based on the project decisions above.
 
-        {json.dumps([d.answer_text if hasattr(d, 'answer_text') else str(d) for d in decisions.values()], indent=2)}
+        {self._upstream_context(state, SpecificationNode.GENERATE_DEPLOYMENT)}
 
         Include:
         - Infrastructure requirements
@@ -507,12 +530,12 @@ class SpecificationAgent:
         - Monitoring setup
         """
         
-        selection = select_model(TaskComplexity.MODERATE)
-        
-        response = await self.llm.agenerate(
-            prompt=prompt,
+        content = await self._stream_artifact(
+            state,
+            SpecificationNode.GENERATE_DEPLOYMENT,
+            prompt,
             system_message="You are an expert DevOps engineer creating deployment guides.",
-            model=selection.model_name if hasattr(selection, "model_name") else None,
+            complexity=TaskComplexity.MODERATE,
         )
         
         artifact = Artifact(
@@ -521,14 +544,11 @@ class SpecificationAgent:
             type=ArtifactType.DEPLOYMENT_GUIDE,
             format=ArtifactFormat.MARKDOWN,
             title="Deployment Guide",
-            content=str(response),
-            based_on_decisions=list(decisions.keys()),
+            content=content,
+            based_on_decisions=list(state.get("decisions", {}).keys()),
         )
         
-        state["artifacts"][artifact.artifact_id] = artifact
-        state["artifact_queue"].append(artifact.artifact_id)
-        
-        return state
+        return self._artifact_update(SpecificationNode.GENERATE_DEPLOYMENT, artifact)
     
     async def _validate_artifact_node(
         self,
@@ -592,6 +612,181 @@ class SpecificationAgent:
         
         return state
     
+    # ==================== Generation Helpers ====================
+    
+    async def _stream_artifact(
+        self,
+        state: SpecificationAgentState,
+        node: str,
+        prompt: str,
+        system_message: str,
+        complexity: TaskComplexity,
+    ) -> str:
+        """
+        Stream an artifact from the LLM under the agent-wide concurrency cap.
+        
+        The rendered project decisions are sent as a shared prompt prefix,
+        identical for every node of the run, so the provider can serve it
+        from its prompt cache after the first call. Partial content is
+        published as it arrives and the completed sections are checkpointed
+        to storage, so a retry of the same thread continues after the last
+        completed section instead of starting over.
+        
+        Args:
+            state: Current (or branch) state
+            node: Generation node producing the artifact
+            prompt: User prompt
+            system_message: System message
+            complexity: Task complexity for model selection
+        
+        Returns:
+            Full artifact content
+        """
+        project_id = state["project_id"]
+        partial_id = f"{state.get('thread_id') or project_id}/{node}"
+        
+        content = await self._load_partial(project_id, partial_id)
+        resumed = bool(content)
+        if resumed:
+            prompt += RESUME_INSTRUCTIONS.format(content=content)
+        
+        selection = select_model(complexity)
+        model = ModelConfig(provider=selection.provider, model_name=selection.model_name)
+        messages = build_messages(
+            prompt,
+            system_message=system_message,
+            shared_context=render_decisions(state.get("decisions", {})),
+            provider=model.provider.value,
+        )
+        
+        published = checkpointed = len(content)
+        last_checkpoint = time.monotonic()
+        
+        try:
+            async with self._llm_semaphore:
+                async for token in self.llm.astream(
+                    messages,
+                    model=model,
+                    on_usage=lambda usage: logger.debug(
+                        f"{node} cached-token ratio: {usage['cached_token_ratio']:.2f}"
+                    ),
+                ):
+                    content += token
+                    
+                    if len(content) - published >= SPEC_STREAM_PUBLISH_CHARS:
+                        await self._publish_partial(project_id, node, content, published, resumed)
+                        published = len(content)
+                    
+                    if time.monotonic() - last_checkpoint >= SPEC_STREAM_CHECKPOINT_SECONDS:
+                        last_checkpoint = time.monotonic()
+                        completed = _completed_sections_end(content)
+                        if completed > checkpointed:
+                            await self._save_partial(project_id, partial_id, content[:completed])
+                            checkpointed = completed
+        except Exception:
+            completed = _completed_sections_end(content)
+            if completed > checkpointed:
+                await self._save_partial(project_id, partial_id, content[:completed])
+            raise
+        
+        await self._publish_partial(project_id, node, content, published, resumed, done=True)
+        if checkpointed:
+            await self._delete_partial(project_id, partial_id)
+        
+        return content
+    
+    async def _publish_partial(
+        self,
+        project_id: str,
+        node: str,
+        content: str,
+        published: int,
+        resumed: bool,
+        done: bool = False,
+    ) -> None:
+        """Push newly streamed content to listeners (best effort)."""
+        if self.on_partial is None:
+            try:
+                from backend.api.endpoints.websocket import broadcast_artifact_progress
+            except ImportError:
+                return
+            self.on_partial = broadcast_artifact_progress
+        
+        try:
+            await self.on_partial(project_id, {
+                "node": node,
+                "artifact_type": ARTIFACT_NODE_TYPES[node].value,
+                "delta": content[published:],
+                "offset": published,
+                "length": len(content),
+                "resumed": resumed,
+                "done": done,
+            })
+        except Exception as e:
+            logger.warning(f"Failed to publish partial artifact for {node}: {e}")
+    
+    async def _get_storage(self):
+        """Get the storage service used for partial checkpoints."""
+        if self.storage_service is None:
+            from backend.storage.service import get_storage_service
+            
+            self.storage_service = get_storage_service()
+            await self.storage_service.initialize()
+        return self.storage_service
+    
+    async def _load_partial(self, project_id: str, partial_id: str) -> str:
+        """Load checkpointed content for a generation ("" if none)."""
+        try:
+            storage = await self._get_storage()
+            return await storage.load_partial_artifact(project_id, partial_id) or ""
+        except Exception as e:
+            logger.warning(f"Failed to load partial artifact {partial_id}: {e}")
+            return ""
+    
+    async def _save_partial(self, project_id: str, partial_id: str, content: str) -> None:
+        """Checkpoint completed sections of a generation (best effort)."""
+        try:
+            storage = await self._get_storage()
+            await storage.save_partial_artifact(project_id, partial_id, content)
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint partial artifact {partial_id}: {e}")
+    
+    async def _delete_partial(self, project_id: str, partial_id: str) -> None:
+        """Drop the checkpoint of a finished generation (best effort)."""
+        try:
+            storage = await self._get_storage()
+            await storage.delete_partial_artifact(project_id, partial_id)
+        except Exception as e:
+            logger.warning(f"Failed to delete partial artifact {partial_id}: {e}")
+    
+    def _artifact_update(self, node: str, artifact: Artifact) -> Dict[str, Any]:
+        """
+        Build the partial state update for a generated artifact.
+        
+        Generation nodes run as parallel branches, so they return only the
+        keys they add to; the state reducers merge them.
+        """
+        return {
+            "artifacts": {artifact.artifact_id: artifact},
+            "artifact_queue": [artifact.artifact_id],
+            "completed_nodes": [node],
+        }
+    
+    def _upstream_context(self, state: SpecificationAgentState, node: str) -> str:
+        """Format the artifacts a node depends on for inclusion in its prompt."""
+        upstream_types = {
+            ARTIFACT_NODE_TYPES[dependency]
+            for dependency in ARTIFACT_DEPENDENCIES.get(node, ())
+        }
+        sections = [
+            f"## {artifact.title}\n{artifact.content[:SPEC_UPSTREAM_CONTEXT_CHARS]}"
+            for artifact in state.get("artifacts", {}).values()
+            if artifact.type in upstream_types
+        ]
+        if not sections:
+            return ""
+        return "Stay consistent with these previously generated artifacts:\n\n" + "\n\n".join(sections)
+    
     # ==================== Routing Functions ====================
     
     def _dependencies_router(self, state: SpecificationAgentState) -> str:
@@ -602,6 +797,30 @@ class SpecificationAgent:
             return "complete"
         return "incomplete"
     
+    def _schedule_router(self, state: SpecificationAgentState) -> Union[List[Send], str]:
+        """
+        Fan out every generation node whose dependencies are complete.
+        
+        Branches sent together run concurrently in one step; the router runs
+        again once they have all finished.
+        """
+        completed = set(state.get("completed_nodes", []))
+        ready = [
+            node for node, dependencies in ARTIFACT_DEPENDENCIES.items()
+            if node not in completed and completed.issuperset(dependencies)
+        ]
+        
+        if not ready:
+            return SpecificationNode.VALIDATE_ARTIFACT
+        
+        payload = {
+            "project_id": state["project_id"],
+            "thread_id": state.get("thread_id"),
+            "decisions": state.get("decisions", {}),
+            "artifacts": state.get("artifacts", {}),
+        }
+        return [Send(node, payload) for node in ready]
+    
     # ==================== Public Interface ====================
     
     async def start(
@@ -658,22 +877,23 @@ class SpecificationAgent:
         
         # Generate based on type
         node_map = {
-            ArtifactType.PRD: SpecificationNode.GENERATE_PRD,
-            ArtifactType.API_SPEC: SpecificationNode.GENERATE_API_CONTRACTS,
-            ArtifactType.DATABASE_SCHEMA: SpecificationNode.GENERATE_DB_SCHEMA,
-            ArtifactType.TICKETS: SpecificationNode.GENERATE_TICKETS,
-            ArtifactType.ARCHITECTURE_DIAGRAM: SpecificationNode.GENERATE_ARCHITECTURE,
-            ArtifactType.TEST_PLAN: SpecificationNode.GENERATE_TESTS,
-            ArtifactType.DEPLOYMENT_GUIDE: SpecificationNode.GENERATE_DEPLOYMENT,
+            ArtifactType.PRD: self._generate_prd_node,
+            ArtifactType.API_SPEC: self._generate_api_contracts_node,
+            ArtifactType.DATABASE_SCHEMA: self._generate_db_schema_node,
+            ArtifactType.TICKETS: self._generate_tickets_node,
+            ArtifactType.ARCHITECTURE_DIAGRAM: self._generate_architecture_node,
+            ArtifactType.TEST_PLAN: self._generate_tests_node,
+            ArtifactType.DEPLOYMENT_GUIDE: self._generate_deployment_node,
         }
         
         node = node_map.get(artifact_type)
-        if node:
-            # Execute single node
-            state = await node(state)
+        if node is None:
+            return None
         
-        artifacts = state.get("artifacts", {})
-        return list(artifacts.values())[-1] if artifacts else None
+        # Execute single node
+        update = await node(state)
+        artifacts = update.get("artifacts", {})
+        return next(iter(artifacts.values()), None)
     
     async def get_state(self, thread_id: str) -> Optional[SpecificationAgentState]:
         """Get the current state for a thread."""
@@ -694,6 +914,7 @@ class SpecificationAgent:
 def create_specification_agent(
     checkpoint_saver: Optional[CheckpointSaver] = None,
     redis_url: Optional[str] = None,
+    llm_concurrency: int = SPEC_LLM_CONCURRENCY,
 ) -> SpecificationAgent:
     """
     Create a Specification Agent instance.
@@ -701,6 +922,7 @@ def create_specification_agent(
     Args:
         checkpoint_saver: Optional checkpoint saver
         redis_url: Redis URL for default checkpointing
+        llm_concurrency: Maximum concurrent LLM calls across generation nodes
     
     Returns:
         Configured SpecificationAgent instance
@@ -710,4 +932,7 @@ def create_specification_agent(
     if checkpoint_saver is None and redis_url:
         checkpoint_saver = get_checkpoint_saver(redis_url=redis_url)
     
-    return SpecificationAgent(checkpoint_saver=checkpoint_saver)
+    return SpecificationAgent(
+        checkpoint_saver=checkpoint_saver,
+        llm_concurrency=llm_concurrency,
+    )
@@ -28,6 +28,26 @@ from .types import (
 )
 
 
+# ==================== State Reducers ====================
+
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reducer merging dict updates from parallel branches (right wins)."""
+    merged = dict(left or {})
+    merged.update(right or {})
+    return merged
+
+
+def merge_unique(left: Optional[List[Any]], right: Optional[List[Any]]) -> List[Any]:
+    """
+    Reducer appending list items not already present.
+
+    Idempotent, so a node returning the full state doesn't duplicate entries.
+    """
+    merged = list(left or [])
+    merged.extend(item for item in (right or []) if item not in merged)
+    return merged
+
+
 # ==================== Core Agent State ====================
 
 class AgentState(TypedDict):
@@ -98,14 +118,15 @@ class SpecificationAgentState(AgentState):
     decisions: Dict[str, Decision]
     locked_decisions: List[str]
     
-    # Artifacts
-    artifacts: Dict[str, Artifact]
+    # Artifacts (reducers let generation nodes run as parallel branches)
+    artifacts: Annotated[Dict[str, Artifact], merge_dicts]
     current_artifact_id: Optional[str]
-    artifact_queue: List[str]  # artifact_ids
+    artifact_queue: Annotated[List[str], merge_unique]  # artifact_ids
     
     # Generation
     generated_content: Dict[str, Any]
     generation_progress: float
+    completed_nodes: Annotated[List[str], merge_unique]  # generation nodes done
     
     # Dependencies
     missing_dependencies: List[str]
@@ -125,6 +146,11 @@ class ValidationAgentState(AgentState):
     # Decisions
     decisions: Dict[str, Decision]
     
+    # Incremental validation (relative to the project's last run)
+    changed_decisions: List[str]
+    removed_decisions: List[str]
+    affected_decisions: List[str]
+    
     # Contradictions
     contradictions: Dict[str, Contradiction]
     pending_contradictions: List[str]
@@ -468,6 +494,7 @@ def create_specification_state(
         artifact_queue=[],
         generated_content={},
         generation_progress=0.0,
+        completed_nodes=[],
         missing_dependencies=[],
         resolved_dependencies=[],
         validation_queue=[],
@@ -485,6 +512,9 @@ def create_validation_state(
     return ValidationAgentState(
         **base,
         decisions={},
+        changed_decisions=[],
+        removed_decisions=[],
+        affected_decisions=[],
         contradictions={},
         pending_contradictions=[],
         resolved_contradictions=[],
@@ -14,10 +14,13 @@ import asyncio
 import json
 import logging
 import re
+import sys
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 
@@ -823,6 +826,139 @@ class ProgressTracker:
 
 
 
+class StreamStateStore:
+    """
+    TTL'd, size-bounded per-stream state for long-lived handlers.
+
+    State is grouped into one bucket per stream (or run), so dropping a
+    stream is O(1) no matter how many keys it accumulated. Buckets are kept
+    in least-recently-touched order: expired buckets are pruned from the
+    front on every touch, and the oldest bucket is evicted when max_streams
+    is exceeded. Streams that error out before cleanup therefore still age
+    out instead of growing memory forever.
+    """
+
+    def __init__(
+        self,
+        max_streams: int = 1000,
+        max_entries_per_stream: int = 1000,
+        ttl_seconds: float = 3600.0,
+    ):
+        """
+        Initialize the state store.
+
+        Args:
+            max_streams: Maximum number of stream buckets kept
+            max_entries_per_stream: Maximum number of keys per bucket (oldest evicted)
+            ttl_seconds: Idle time after which a bucket is dropped
+        """
+        self.max_streams = max(1, max_streams)
+        self.max_entries_per_stream = max(1, max_entries_per_stream)
+        self.ttl_seconds = ttl_seconds
+        self._buckets: "OrderedDict[str, OrderedDict[str, Any]]" = OrderedDict()
+        self._touched_at: Dict[str, float] = {}
+        self._entry_count = 0
+        self._approx_bytes = 0
+        self._evictions = 0
+
+    def _touch(self, stream_id: str, create: bool) -> Optional["OrderedDict[str, Any]"]:
+        """Return a stream's bucket, marking it as recently used."""
+        now = time.monotonic()
+        self._prune_expired(now)
+
+        bucket = self._buckets.get(stream_id)
+        if bucket is None:
+            if not create:
+                return None
+            bucket = OrderedDict()
+            self._buckets[stream_id] = bucket
+            while len(self._buckets) > self.max_streams:
+                oldest = next(iter(self._buckets))
+                self.clear_stream(oldest)
+                self._evictions += 1
+        else:
+            self._buckets.move_to_end(stream_id)
+
+        self._touched_at[stream_id] = now
+        return bucket
+
+    def _prune_expired(self, now: float) -> None:
+        """Drop buckets idle for longer than the TTL (oldest first)."""
+        while self._buckets:
+            oldest = next(iter(self._buckets))
+            if now - self._touched_at.get(oldest, now) < self.ttl_seconds:
+                break
+            self.clear_stream(oldest)
+            self._evictions += 1
+
+    def get(self, stream_id: str, key: str, default: Any = None) -> Any:
+        """Get a value from a stream's bucket."""
+        bucket = self._touch(stream_id, create=False)
+        if bucket is None:
+            return default
+        return bucket.get(key, default)
+
+    def set(self, stream_id: str, key: str, value: Any) -> None:
+        """Set a value in a stream's bucket, evicting its oldest key if full."""
+        bucket = self._touch(stream_id, create=True)
+        if key in bucket:
+            self._approx_bytes -= sys.getsizeof(bucket[key])
+            bucket.move_to_end(key)
+        else:
+            self._entry_count += 1
+        bucket[key] = value
+        self._approx_bytes += sys.getsizeof(value)
+
+        while len(bucket) > self.max_entries_per_stream:
+            _, evicted = bucket.popitem(last=False)
+            self._entry_count -= 1
+            self._approx_bytes -= sys.getsizeof(evicted)
+            self._evictions += 1
+
+    def pop(self, stream_id: str, key: str, default: Any = None) -> Any:
+        """Remove and return a value from a stream's bucket."""
+        bucket = self._buckets.get(stream_id)
+        if bucket is None or key not in bucket:
+            return default
+        value = bucket.pop(key)
+        self._entry_count -= 1
+        self._approx_bytes -= sys.getsizeof(value)
+        return value
+
+    def clear_stream(self, stream_id: str) -> None:
+        """Drop all state for a stream."""
+        bucket = self._buckets.pop(stream_id, None)
+        self._touched_at.pop(stream_id, None)
+        if bucket is None:
+            return
+        self._entry_count -= len(bucket)
+        self._approx_bytes -= sum(sys.getsizeof(value) for value in bucket.values())
+
+    def clear(self) -> None:
+        """Drop all state."""
+        self._buckets.clear()
+        self._touched_at.clear()
+        self._entry_count = 0
+        self._approx_bytes = 0
+
+    def __contains__(self, stream_id: str) -> bool:
+        return stream_id in self._buckets
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get memory gauge metrics.
+
+        Returns:
+            Dictionary with stream, entry and approximate byte counts
+        """
+        return {
+            "streams": len(self._buckets),
+            "entries": self._entry_count,
+            "approx_bytes": self._approx_bytes,
+            "evictions": self._evictions,
+        }
+
+
 class StreamHandler:
     """Base class for stream event handlers."""
 
@@ -1096,12 +1232,15 @@ class LLMOutputHandler(StreamHandler):
     - Supports partial and final output aggregation
     """
 
-    def __init__(self):
-        """Initialize the LLM output handler."""
+    def __init__(self, state_store: Optional[StreamStateStore] = None):
+        """
+        Initialize the LLM output handler.
+
+        Args:
+            state_store: Optional per-run state store (bounded default if None)
+        """
         super().__init__()
-        self._current_outputs: Dict[str, str] = {}  # run_id -> accumulated output
-        self._token_counts: Dict[str, int] = {}
-        self._start_times: Dict[str, datetime] = {}
+        self._runs = state_store or StreamStateStore()  # run_id -> output, token_count, start_time
         self._on_token: Optional[Callable] = None
         self._on_complete: Optional[Callable] = None
 
@@ -1140,16 +1279,15 @@ class LLMOutputHandler(StreamHandler):
         run_id = event.run_id or "default"
         token = event.data.get("chunk", "")
 
-        if run_id not in self._current_outputs:
-            self._current_outputs[run_id] = ""
-            self._token_counts[run_id] = 0
-            self._start_times[run_id] = datetime.utcnow()
+        if run_id not in self._runs:
+            self._runs.set(run_id, "start_time", datetime.utcnow())
 
-        self._current_outputs[run_id] += token
-        self._token_counts[run_id] += 1
+        token_count = self._runs.get(run_id, "token_count", 0) + 1
+        self._runs.set(run_id, "output", self._runs.get(run_id, "output", "") + token)
+        self._runs.set(run_id, "token_count", token_count)
 
         if self._on_token:
-            self._on_token(run_id, token, self._token_counts[run_id])
+            self._on_token(run_id, token, token_count)
 
     def _handle_new_token(self, event: StreamEvent) -> None:
         """Handle new token event."""
@@ -1158,26 +1296,28 @@ class LLMOutputHandler(StreamHandler):
     def _handle_complete(self, event: StreamEvent) -> None:
         """Handle LLM completion."""
         run_id = event.run_id or "default"
-        start_time = self._start_times.get(run_id)
+        start_time = self._runs.get(run_id, "start_time")
         duration = (datetime.utcnow() - start_time).total_seconds() if start_time else 0
 
-        output = self._current_outputs.get(run_id, "")
+        output = self._runs.get(run_id, "output", "")
 
         if self._on_complete:
             self._on_complete(run_id, output, duration)
 
         # Cleanup
-        self._current_outputs.pop(run_id, None)
-        self._token_counts.pop(run_id, None)
-        self._start_times.pop(run_id, None)
+        self._runs.clear_stream(run_id)
 
     def get_current_output(self, run_id: str = "default") -> str:
         """Get current accumulated output for a run."""
-        return self._current_outputs.get(run_id, "")
+        return self._runs.get(run_id, "output", "")
 
     def get_token_count(self, run_id: str = "default") -> int:
         """Get token count for a run."""
-        return self._token_counts.get(run_id, 0)
+        return self._runs.get(run_id, "token_count", 0)
+
+    def get_memory_metrics(self) -> Dict[str, Any]:
+        """Get memory gauge metrics for tracked runs."""
+        return self._runs.get_metrics()
 
 
 class ToolOutputHandler(StreamHandler):
@@ -1191,10 +1331,15 @@ class ToolOutputHandler(StreamHandler):
     - Handles errors gracefully
     """
 
-    def __init__(self):
-        """Initialize the tool output handler."""
+    def __init__(self, state_store: Optional[StreamStateStore] = None):
+        """
+        Initialize the tool output handler.
+
+        Args:
+            state_store: Optional per-run state store (bounded default if None)
+        """
         super().__init__()
-        self._executions: Dict[str, Dict[str, Any]] = {}
+        self._executions = state_store or StreamStateStore()  # run_id -> execution
         self._on_start: Optional[Callable] = None
         self._on_complete: Optional[Callable] = None
         self._on_error: Optional[Callable] = None
@@ -1244,11 +1389,11 @@ class ToolOutputHandler(StreamHandler):
         tool_name = event.name or "unknown"
         input_data = event.data.get("input", {})
 
-        self._executions[run_id] = {
+        self._executions.set(run_id, "execution", {
             "tool_name": tool_name,
             "input": input_data,
             "start_time": datetime.utcnow(),
-        }
+        })
 
         if self._on_start:
             self._on_start(run_id, tool_name, input_data)
@@ -1256,7 +1401,7 @@ class ToolOutputHandler(StreamHandler):
     def _handle_complete(self, event: StreamEvent) -> None:
         """Handle tool execution completion."""
         run_id = event.run_id or "default"
-        execution = self._executions.get(run_id, {})
+        execution = self._executions.get(run_id, "execution", {})
         tool_name = execution.get("tool_name", event.name or "unknown")
         start_time = execution.get("start_time")
         duration = (datetime.utcnow() - start_time).total_seconds() if start_time else 0
@@ -1265,7 +1410,7 @@ class ToolOutputHandler(StreamHandler):
         if self._on_complete:
             self._on_complete(run_id, tool_name, output, duration)
 
-        self._executions.pop(run_id, None)
+        self._executions.clear_stream(run_id)
 
     def _handle_error(self, event: StreamEvent) -> None:
         """Handle tool execution error."""
@@ -1276,11 +1421,15 @@ class ToolOutputHandler(StreamHandler):
         if self._on_error:
             self._on_error(run_id, tool_name, error)
 
-        self._executions.pop(run_id, None)
+        self._executions.clear_stream(run_id)
 
     def get_execution_status(self, run_id: str = "default") -> Optional[Dict[str, Any]]:
         """Get current execution status for a run."""
-        return self._executions.get(run_id)
+        return self._executions.get(run_id, "execution")
+
+    def get_memory_metrics(self) -> Dict[str, Any]:
+        """Get memory gauge metrics for tracked executions."""
+        return self._executions.get_metrics()
 
 
 class AgentOutputHandler(StreamHandler):
@@ -1293,10 +1442,15 @@ class AgentOutputHandler(StreamHandler):
     - Records node execution details
     """
 
-    def __init__(self):
-        """Initialize the agent output handler."""
+    def __init__(self, max_history: int = 1000):
+        """
+        Initialize the agent output handler.
+
+        Args:
+            max_history: Maximum number of state transitions kept (oldest dropped)
+        """
         super().__init__()
-        self._state_history: List[Dict[str, Any]] = []
+        self._state_history: "deque[Dict[str, Any]]" = deque(maxlen=max(1, max_history))
         self._on_state_change: Optional[Callable] = None
         self._on_agent_action: Optional[Callable] = None
 
@@ -1350,8 +1504,15 @@ class AgentOutputHandler(StreamHandler):
             )
 
     def get_state_history(self) -> List[Dict[str, Any]]:
-        """Get full state transition history."""
-        return self._state_history.copy()
+        """Get retained state transition history."""
+        return list(self._state_history)
+
+    def get_memory_metrics(self) -> Dict[str, Any]:
+        """Get memory gauge metrics for retained history."""
+        return {
+            "entries": len(self._state_history),
+            "max_entries": self._state_history.maxlen,
+        }
 
 
 class CheckpointHandler(StreamHandler):
@@ -2136,6 +2297,7 @@ class FrontendEventType(str, Enum):
     STREAM_START = "stream_start"
     STREAM_END = "stream_end"
     STREAM_ERROR = "stream_error"
+    STREAM_RESUMED = "stream_resumed"
     BATCH_UPDATE = "batch_update"
 
     # Agent events
@@ -2186,6 +2348,9 @@ class FrontendStreamConfig:
     debounce_event_types: List[EventType] = field(
         default_factory=lambda: [EventType.AGENT_UPDATE]
     )
+    enable_event_replay: bool = False  # Record stream events for reconnect replay
+    replay_max_events: int = 1000  # Approximate cap per stream
+    replay_ttl_seconds: int = 3600
 
 
 class EventDebouncer:
@@ -2196,11 +2361,13 @@ class EventDebouncer:
         enabled: bool = True,
         debounce_interval_ms: int = 100,
         debounce_event_types: Optional[List[EventType]] = None,
+        state_store: Optional[StreamStateStore] = None,
     ):
         self.enabled = enabled
         self.debounce_interval_ms = max(1, debounce_interval_ms)
         self.debounce_event_types = set(debounce_event_types or [EventType.AGENT_UPDATE])
-        self._last_emit_at: Dict[str, datetime] = {}
+        # stream_id -> {event key -> last emit time}
+        self._last_emit_at = state_store or StreamStateStore()
 
     def should_emit(self, stream_id: str, event: StreamEvent) -> bool:
         """Return True if event should be emitted based on debounce rules."""
@@ -2212,7 +2379,6 @@ class EventDebouncer:
 
         key = "|".join(
             [
-                stream_id,
                 event.event_type.value,
                 event.agent_name or "",
                 event.node_name or "",
@@ -2220,23 +2386,182 @@ class EventDebouncer:
             ]
         )
         now = datetime.utcnow()
-        previous = self._last_emit_at.get(key)
+        previous = self._last_emit_at.get(stream_id, key)
         if previous is None:
-            self._last_emit_at[key] = now
+            self._last_emit_at.set(stream_id, key, now)
             return True
 
         elapsed_ms = (now - previous).total_seconds() * 1000
         if elapsed_ms >= self.debounce_interval_ms:
-            self._last_emit_at[key] = now
+            self._last_emit_at.set(stream_id, key, now)
             return True
 
         return False
 
     def clear_stream(self, stream_id: str) -> None:
         """Clear debounce cache entries for a specific stream."""
-        prefix = f"{stream_id}|"
-        for key in [k for k in self._last_emit_at.keys() if k.startswith(prefix)]:
-            del self._last_emit_at[key]
+        self._last_emit_at.clear_stream(stream_id)
+
+    def get_memory_metrics(self) -> Dict[str, Any]:
+        """Get memory gauge metrics for debounce state."""
+        return self._last_emit_at.get_metrics()
+
+
+class EventReplayLog:
+    """
+    Capped Redis Stream of formatted frontend events, one stream per stream_id.
+
+    Each appended message gets the Redis Stream entry ID as its event_id, so a
+    reconnecting client can pass the last ID it saw and receive everything
+    emitted after it.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        key_prefix: Optional[str] = None,
+        max_events: int = 1000,
+        ttl_seconds: int = 3600,
+    ):
+        """
+        Initialize the replay log.
+
+        Args:
+            redis_client: Optional async Redis client (shared client if None)
+            key_prefix: Key prefix for replay streams
+            max_events: Approximate maximum number of events kept per stream
+            ttl_seconds: Expiry applied to a stream after each append
+        """
+        if key_prefix is None:
+            from backend.cache.connection import STREAM_EVENTS_PREFIX
+            key_prefix = STREAM_EVENTS_PREFIX
+
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+        self.max_events = max(1, max_events)
+        self.ttl_seconds = ttl_seconds
+
+    async def _get_client(self):
+        """Get the Redis client, falling back to the shared application client."""
+        if self._redis is None:
+            from backend.cache.connection import init_redis
+            self._redis = await init_redis()
+        return self._redis
+
+    def _make_key(self, stream_id: str) -> str:
+        """Build the Redis Stream key for a stream."""
+        return f"{self.key_prefix}{stream_id}"
+
+    def _make_owner_key(self, stream_id: str) -> str:
+        """Build the key of the hash recording who owns a stream."""
+        return f"{self.key_prefix}{stream_id}:owner"
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def append(self, stream_id: str, message: Dict[str, Any]) -> str:
+        """
+        Append a message to a stream's replay log.
+
+        Args:
+            stream_id: Stream identifier
+            message: Formatted frontend message
+
+        Returns:
+            Event ID assigned to the message
+        """
+        client = await self._get_client()
+        key = self._make_key(stream_id)
+
+        pipe = client.pipeline(transaction=False)
+        pipe.xadd(
+            key,
+            {"payload": json.dumps(message, default=str)},
+            maxlen=self.max_events,
+            approximate=True,
+        )
+        pipe.expire(key, self.ttl_seconds)
+        pipe.expire(self._make_owner_key(stream_id), self.ttl_seconds)
+        event_id, _, _ = await pipe.execute()
+        return self._decode(event_id)
+
+    async def set_owner(
+        self,
+        stream_id: str,
+        user_id: Optional[str],
+        project_id: Optional[str],
+    ) -> None:
+        """
+        Record the user and project a stream belongs to.
+
+        Args:
+            stream_id: Stream identifier
+            user_id: Owning user (None for anonymous streams)
+            project_id: Owning project
+        """
+        client = await self._get_client()
+        key = self._make_owner_key(stream_id)
+
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping={"user_id": user_id or "", "project_id": project_id or ""})
+        pipe.expire(key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def get_owner(self, stream_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the user and project a stream belongs to.
+
+        Args:
+            stream_id: Stream identifier
+
+        Returns:
+            Dict with user_id and project_id, or None if no owner is recorded
+        """
+        client = await self._get_client()
+        owner = await client.hgetall(self._make_owner_key(stream_id))
+        if not owner:
+            return None
+        owner = {self._decode(k): self._decode(v) for k, v in owner.items()}
+        return {
+            "user_id": owner.get("user_id") or None,
+            "project_id": owner.get("project_id") or None,
+        }
+
+    async def read_since(
+        self,
+        stream_id: str,
+        last_event_id: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Read messages recorded after an event ID.
+
+        Args:
+            stream_id: Stream identifier
+            last_event_id: Last event ID the client received (all events if None)
+            count: Optional maximum number of events to return
+
+        Returns:
+            List of (event_id, message) tuples in emission order
+        """
+        client = await self._get_client()
+        start = f"({last_event_id}" if last_event_id else "-"
+        entries = await client.xrange(self._make_key(stream_id), min=start, max="+", count=count)
+
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        for entry_id, fields in entries:
+            payload = fields.get("payload", fields.get(b"payload"))
+            if payload is None:
+                continue
+            events.append((self._decode(entry_id), json.loads(payload)))
+        return events
+
+    async def delete(self, stream_id: str) -> None:
+        """Delete a stream's replay log."""
+        client = await self._get_client()
+        await client.delete(self._make_key(stream_id), self._make_owner_key(stream_id))
 
 
 class FrontendWebSocketBridge:
@@ -2251,21 +2576,34 @@ class FrontendWebSocketBridge:
     - Connection lifecycle management
     - Event batching for performance
     - Heartbeat and reconnection support
+    - Resumable streams backed by a Redis Streams replay log
     """
 
-    def __init__(self, config: Optional[FrontendStreamConfig] = None):
+    def __init__(
+        self,
+        config: Optional[FrontendStreamConfig] = None,
+        replay_log: Optional[EventReplayLog] = None,
+    ):
         """
         Initialize the frontend WebSocket bridge.
 
         Args:
             config: Frontend streaming configuration
+            replay_log: Optional replay log (created from config if replay is enabled)
         """
         self.config = config or FrontendStreamConfig()
         self._connections: Dict[str, Dict[str, Any]] = {}  # connection_id -> connection_info
         self._streams: Dict[str, Dict[str, Any]] = {}  # stream_id -> stream_info
         self._manager: Optional[StreamingManager] = None
-        self._token_buffers: Dict[str, List[str]] = {}  # connection_id -> tokens
+        self._token_buffers: Dict[str, List[str]] = {}  # stream_id -> tokens
         self._progress_trackers: Dict[str, ProgressTracker] = {}  # stream_id -> tracker
+        self._stream_locks: Dict[str, asyncio.Lock] = {}  # stream_id -> publish lock
+        if replay_log is None and self.config.enable_event_replay:
+            replay_log = EventReplayLog(
+                max_events=self.config.replay_max_events,
+                ttl_seconds=self.config.replay_ttl_seconds,
+            )
+        self._replay_log = replay_log
         self._debouncer = EventDebouncer(
             enabled=self.config.enable_event_debouncing,
             debounce_interval_ms=self.config.debounce_interval_ms,
@@ -2302,6 +2640,8 @@ class FrontendWebSocketBridge:
         connection_id: str,
         user_id: Optional[str] = None,
         project_id: Optional[str] = None,
+        stream_id: Optional[str] = None,
+        last_event_id: Optional[str] = None,
     ) -> None:
         """
         Accept a new WebSocket connection.
@@ -2311,6 +2651,8 @@ class FrontendWebSocketBridge:
             connection_id: Unique connection identifier
             user_id: Optional user identifier
             project_id: Optional project identifier
+            stream_id: Optional stream to resume on this connection
+            last_event_id: Last event ID the client received on that stream
         """
         self._connections[connection_id] = {
             "websocket": websocket,
@@ -2321,8 +2663,6 @@ class FrontendWebSocketBridge:
             "last_activity": datetime.utcnow().isoformat(),
         }
 
-        self._token_buffers[connection_id] = []
-
         # Send connection confirmation
         await self._send_message(
             connection_id,
@@ -2335,9 +2675,109 @@ class FrontendWebSocketBridge:
             },
         )
 
+        if stream_id:
+            await self.resume_stream(connection_id, stream_id, last_event_id)
+
         if self._on_connection:
             self._on_connection(connection_id)
 
+    async def resume_stream(
+        self,
+        connection_id: str,
+        stream_id: str,
+        last_event_id: Optional[str] = None,
+    ) -> int:
+        """
+        Replay missed events for a stream and switch it to live delivery.
+
+        Events recorded after last_event_id are sent first; if the stream is
+        still running on this bridge it is then reattached to the connection.
+        Publishing is blocked for the stream while this runs, so no event is
+        lost or duplicated between replay and live delivery.
+
+        Only a connection with the stream's user and project may resume it;
+        other connections get a STREAM_ERROR and nothing is replayed.
+
+        Args:
+            connection_id: Connection identifier
+            stream_id: Stream identifier
+            last_event_id: Last event ID the client received (full replay if None)
+
+        Returns:
+            Number of replayed events
+        """
+        if connection_id not in self._connections or self._replay_log is None:
+            return 0
+
+        async with self._get_stream_lock(stream_id):
+            if not await self._may_resume(connection_id, stream_id):
+                logging.warning(
+                    f"Refused resume of stream {stream_id} by connection {connection_id}"
+                )
+                await self._send_message(
+                    connection_id,
+                    {
+                        "type": FrontendEventType.STREAM_ERROR,
+                        "stream_id": stream_id,
+                        "error": "Not authorized to resume this stream",
+                        "timestamp": datetime.utcnow().isoformat(),
+                    },
+                )
+                if stream_id not in self._streams:
+                    self._stream_locks.pop(stream_id, None)
+                return 0
+
+            try:
+                events = await self._replay_log.read_since(stream_id, last_event_id)
+            except Exception as e:
+                logging.warning(f"Failed to read replay log for stream {stream_id}: {e}")
+                events = []
+
+            for event_id, message in events:
+                await self._send_message(
+                    connection_id,
+                    {**message, "event_id": event_id, "replayed": True},
+                )
+
+            stream = self._streams.get(stream_id)
+            if stream is not None:
+                stream["connection_id"] = connection_id
+
+            await self._send_message(
+                connection_id,
+                {
+                    "type": FrontendEventType.STREAM_RESUMED,
+                    "stream_id": stream_id,
+                    "replayed_count": len(events),
+                    "last_event_id": events[-1][0] if events else last_event_id,
+                    "live": stream is not None,
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            )
+
+        if stream_id not in self._streams:
+            self._stream_locks.pop(stream_id, None)
+
+        return len(events)
+
+    async def _may_resume(self, connection_id: str, stream_id: str) -> bool:
+        """Check that a connection belongs to the user and project that own a stream."""
+        owner = self._streams.get(stream_id)
+        if owner is None:
+            try:
+                owner = await self._replay_log.get_owner(stream_id)
+            except Exception as e:
+                logging.warning(f"Failed to read owner of stream {stream_id}: {e}")
+                return False
+            if owner is None:
+                return False
+
+        connection = self._connections[connection_id]
+        return (
+            connection.get("user_id") == owner.get("user_id")
+            and connection.get("project_id") == owner.get("project_id")
+        )
+
     async def disconnect(self, connection_id: str, reason: str = "client_disconnect") -> None:
         """
         Handle WebSocket disconnection.
@@ -2349,19 +2789,18 @@ class FrontendWebSocketBridge:
         if connection_id in self._connections:
             del self._connections[connection_id]
 
-        if connection_id in self._token_buffers:
-            del self._token_buffers[connection_id]
-
-        # Clean up streams for this connection
+        # Clean up streams for this connection. With a replay log, running
+        # streams are detached instead so the client can resume them.
         streams_to_remove = [
             sid for sid, stream in self._streams.items()
             if stream.get("connection_id") == connection_id
         ]
         for sid in streams_to_remove:
-            del self._streams[sid]
-            if sid in self._progress_trackers:
-                del self._progress_trackers[sid]
-            self._debouncer.clear_stream(sid)
+            if self._replay_log is not None and self._streams[sid].get("graph"):
+                self._streams[sid]["connection_id"] = None
+                self._streams[sid]["detached_at"] = datetime.utcnow().isoformat()
+            else:
+                self._release_stream(sid)
 
         # Send disconnect notification
         await self._send_message(
@@ -2406,6 +2845,8 @@ class FrontendWebSocketBridge:
         if stream_id:
             self._streams[stream_id] = {
                 "connection_id": connection_id,
+                "user_id": self._connections[connection_id].get("user_id"),
+                "project_id": self._connections[connection_id].get("project_id"),
                 "started_at": datetime.utcnow().isoformat(),
             }
 
@@ -2439,8 +2880,11 @@ class FrontendWebSocketBridge:
         if connection_id not in self._connections:
             return
 
+        connection = self._connections[connection_id]
         self._streams[stream_id] = {
             "connection_id": connection_id,
+            "user_id": connection.get("user_id"),
+            "project_id": connection.get("project_id"),
             "graph": graph,
             "input_data": input_data,
             "config": config,
@@ -2451,9 +2895,18 @@ class FrontendWebSocketBridge:
         # Initialize progress tracker
         self._progress_trackers[stream_id] = ProgressTracker()
 
+        if self._replay_log is not None:
+            try:
+                await self._replay_log.set_owner(
+                    stream_id, connection.get("user_id"), connection.get("project_id"),
+                )
+            except Exception as e:
+                logging.warning(f"Failed to record owner of stream {stream_id}: {e}")
+
         # Send stream start event
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.STREAM_START,
                 "stream_id": stream_id,
@@ -2473,15 +2926,9 @@ class FrontendWebSocketBridge:
             stream_id: Stream identifier
             reason: Stop reason
         """
-        if stream_id in self._streams:
-            del self._streams[stream_id]
-
-        if stream_id in self._progress_trackers:
-            del self._progress_trackers[stream_id]
-        self._debouncer.clear_stream(stream_id)
-
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.STREAM_END,
                 "stream_id": stream_id,
@@ -2490,6 +2937,54 @@ class FrontendWebSocketBridge:
             },
         )
 
+        self._release_stream(stream_id)
+
+    def _get_stream_lock(self, stream_id: str) -> asyncio.Lock:
+        """Get the lock serializing publish and resume for a stream."""
+        lock = self._stream_locks.get(stream_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._stream_locks[stream_id] = lock
+        return lock
+
+    def _release_stream(self, stream_id: str) -> None:
+        """Drop all local state kept for a stream."""
+        self._streams.pop(stream_id, None)
+        self._progress_trackers.pop(stream_id, None)
+        self._token_buffers.pop(stream_id, None)
+        self._stream_locks.pop(stream_id, None)
+        self._debouncer.clear_stream(stream_id)
+
+    async def _publish(
+        self,
+        connection_id: str,
+        stream_id: str,
+        message: Dict[str, Any],
+    ) -> None:
+        """
+        Deliver a stream-scoped message, recording it in the replay log.
+
+        Messages for a registered stream go to the stream's current connection,
+        which changes when a client resumes on a new connection; a detached
+        stream is only recorded. Unregistered streams go to connection_id.
+        """
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            await self._send_message(connection_id, message)
+            return
+
+        async with self._get_stream_lock(stream_id):
+            if self._replay_log is not None:
+                try:
+                    event_id = await self._replay_log.append(stream_id, message)
+                    message = {**message, "event_id": event_id}
+                except Exception as e:
+                    logging.warning(f"Failed to record event for stream {stream_id}: {e}")
+
+            target = stream.get("connection_id")
+            if target:
+                await self._send_message(target, message)
+
     async def _stream_to_connection(
         self,
         connection_id: str,
@@ -2546,12 +3041,13 @@ class FrontendWebSocketBridge:
                             await self._handle_checkpoint_event(connection_id, stream_id, event)
                         # Handle other events
                         else:
-                            await self._send_message(connection_id, formatted)
+                            await self._publish(connection_id, stream_id, formatted)
 
         except Exception as e:
             logging.error(f"Error streaming to connection {connection_id}: {e}")
-            await self._send_message(
+            await self._publish(
                 connection_id,
+                stream_id,
                 {
                     "type": FrontendEventType.STREAM_ERROR,
                     "stream_id": stream_id,
@@ -2561,8 +3057,9 @@ class FrontendWebSocketBridge:
             )
 
         # Send stream end
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.STREAM_END,
                 "stream_id": stream_id,
@@ -2571,6 +3068,11 @@ class FrontendWebSocketBridge:
         )
         self._debouncer.clear_stream(stream_id)
 
+        # Nobody will stop a stream that finished while detached
+        stream = self._streams.get(stream_id)
+        if stream is not None and stream.get("connection_id") is None:
+            self._release_stream(stream_id)
+
     async def _handle_event_batch(
         self,
         connection_id: str,
@@ -2597,8 +3099,9 @@ class FrontendWebSocketBridge:
                 batch_payload.append(formatted)
 
         if batch_payload:
-            await self._send_message(
+            await self._publish(
                 connection_id,
+                stream_id,
                 {
                     "type": FrontendEventType.BATCH_UPDATE,
                     "stream_id": stream_id,
@@ -2708,13 +3211,14 @@ class FrontendWebSocketBridge:
         if not token:
             return
 
-        self._token_buffers[connection_id].append(token)
+        tokens = self._token_buffers.setdefault(stream_id, [])
+        tokens.append(token)
 
         # Send tokens periodically
-        tokens = self._token_buffers[connection_id]
         if len(tokens) >= 5 or event.event_type == EventType.LLM_END:
-            await self._send_message(
+            await self._publish(
                 connection_id,
+                stream_id,
                 {
                     "type": FrontendEventType.LLM_TOKEN,
                     "stream_id": stream_id,
@@ -2723,7 +3227,7 @@ class FrontendWebSocketBridge:
                     "timestamp": datetime.utcnow().isoformat(),
                 },
             )
-            self._token_buffers[connection_id] = []
+            self._token_buffers[stream_id] = []
 
     async def _handle_checkpoint_event(
         self,
@@ -2745,8 +3249,9 @@ class FrontendWebSocketBridge:
         })
 
         if progress_event:
-            await self._send_message(
+            await self._publish(
                 connection_id,
+                stream_id,
                 {
                     "type": FrontendEventType.PROGRESS_UPDATE,
                     "stream_id": stream_id,
@@ -2781,8 +3286,9 @@ class FrontendWebSocketBridge:
         """
         percentage = (current_step / total_steps) * 100 if total_steps > 0 else 0
 
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.PROGRESS_UPDATE,
                 "stream_id": stream_id,
@@ -2811,8 +3317,9 @@ class FrontendWebSocketBridge:
             milestone_name: Milestone name
             description: Milestone description
         """
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.MILESTONE,
                 "stream_id": stream_id,
@@ -2840,8 +3347,9 @@ class FrontendWebSocketBridge:
             message: Interrupt message
             details: Optional additional details
         """
-        await self._send_message(
+        await self._publish(
             connection_id,
+            stream_id,
             {
                 "type": FrontendEventType.INTERRUPT,
                 "stream_id": stream_id,
@@ -2887,6 +3395,16 @@ class FrontendWebSocketBridge:
         """Get list of active stream IDs."""
         return list(self._streams.keys())
 
+    def get_memory_metrics(self) -> Dict[str, Any]:
+        """Get memory gauge metrics for per-connection and per-stream state."""
+        return {
+            "connections": len(self._connections),
+            "streams": len(self._streams),
+            "progress_trackers": len(self._progress_trackers),
+            "token_buffers": len(self._token_buffers),
+            "debouncer": self._debouncer.get_memory_metrics(),
+        }
+
     async def broadcast(
         self,
         message: Dict[str, Any],
@@ -3023,9 +3541,10 @@ def create_websocket_manager() -> WebSocketStreamManager:
 
 def create_frontend_websocket_bridge(
     config: Optional[FrontendStreamConfig] = None,
+    replay_log: Optional[EventReplayLog] = None,
 ) -> FrontendWebSocketBridge:
     """Create a new frontend WebSocket bridge."""
-    return FrontendWebSocketBridge(config)
+    return FrontendWebSocketBridge(config, replay_log)
 
 
 # Event filter helper functions
@@ -10,14 +10,19 @@ all specialized agents:
 - DeliveryAgent: Exports and delivers artifacts
 """
 
-from typing import Any, Dict, List, Optional, Callable, Union, Set
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Callable, Tuple, Union, Set
 from enum import Enum
 from datetime import datetime
 from uuid import uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from langgraph.graph import StateGraph
 from langgraph.types import Interrupt, Command
 import asyncio
+import bisect
+import contextvars
+import functools
+import os
 import threading
 
 from .types import (
@@ -42,6 +47,20 @@ from .human_in_the_loop import (
 )
 
 
+# Messages retained per MessageQueue before the oldest are evicted
+MESSAGE_QUEUE_MAX_MESSAGES = int(os.getenv("MESSAGE_QUEUE_MAX_MESSAGES", "10000"))
+
+# SharedStateStore retention: history records per key and change log records
+SHARED_STATE_HISTORY_LIMIT = int(os.getenv("SHARED_STATE_HISTORY_LIMIT", "100"))
+SHARED_STATE_CHANGE_LOG_LIMIT = int(os.getenv("SHARED_STATE_CHANGE_LOG_LIMIT", "10000"))
+
+# Keep dict diffs instead of full values in SharedStateStore history
+SHARED_STATE_STORE_DIFFS = os.getenv("SHARED_STATE_STORE_DIFFS", "false").lower() == "true"
+
+# Agent runs in flight at once across execute_parallel/run_batch calls
+SUPERVISOR_MAX_CONCURRENCY = int(os.getenv("SUPERVISOR_MAX_CONCURRENCY", "4"))
+
+
 # ==================== Supervisor Enums ====================
 
 class SupervisorAction(str, Enum):
@@ -298,6 +317,23 @@ class ParallelExecutionStatus(str, Enum):
     PARTIAL = "partial"
 
 
+class ParallelFailurePolicy(str, Enum):
+    """What parallel execution does when a task fails."""
+    CONTINUE = "continue"  # Run every task and report partial results
+    FAIL_FAST = "fail_fast"  # Cancel the remaining tasks on the first failure
+
+
+class _FailFast(Exception):
+    """Raised inside the scheduler's TaskGroup to cancel the remaining jobs."""
+
+
+# Worker threads of timed-out sync agents that still hold the current job's
+# concurrency slot (set by SupervisorAgent._run_scheduled)
+_slot_stragglers: contextvars.ContextVar[Optional[List[asyncio.Future]]] = contextvars.ContextVar(
+    "supervisor_slot_stragglers", default=None
+)
+
+
 class ParallelExecution(BaseModel):
     """Parallel execution of multiple agents."""
     execution_id: str = Field(default_factory=lambda: str(uuid4()))
@@ -309,7 +345,8 @@ class ParallelExecution(BaseModel):
     errors: Dict[TaskType, str] = Field(default_factory=dict)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    timeout_seconds: int = 300
+    timeout_seconds: int = 300  # Per task, unless the TimeoutManager has a config
+    failure_policy: ParallelFailurePolicy = ParallelFailurePolicy.CONTINUE
     
     def add_result(self, task_type: TaskType, result: AgentResult) -> None:
         """Add a result for a task type."""
@@ -502,8 +539,10 @@ class TimeoutManager(BaseModel):
         return False
     
     def get_effective_timeout(self, agent_type: AgentType, task_type: Optional[TaskType] = None) -> int:
-        """Get effective timeout for an agent/task."""
+        """Get effective timeout for an agent/task, falling back to the agent's default config."""
         config = self.get_timeout(agent_type, task_type)
+        if config is None and task_type is not None:
+            config = self.get_timeout(agent_type)
         
         if config:
             return config.timeout_seconds
@@ -2429,6 +2468,33 @@ class SharedStateUpdate(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     version: int = 1
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    global_version: int = 0  # Store-wide sequence number of the change
+    diff: Optional[Dict[str, Any]] = None  # Set instead of value in diff-only history records
+    deleted: bool = False
+
+
+def _shallow_diff(previous: Dict[str, Any], value: Dict[str, Any]) -> Dict[str, Any]:
+    """Top-level diff between two dicts, with the old values needed to revert it."""
+    changed = {k: v for k, v in value.items() if k not in previous or previous[k] != v}
+    unset = [k for k in previous if k not in value]
+    return {
+        "set": changed,
+        "unset": unset,
+        "previous": {k: previous[k] for k in (*changed, *unset) if k in previous},
+    }
+
+
+def _revert_diff(value: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    """Undo a diff produced by _shallow_diff."""
+    reverted = dict(value)
+    for k in diff["set"]:
+        if k in diff["previous"]:
+            reverted[k] = diff["previous"][k]
+        else:
+            reverted.pop(k, None)
+    for k in diff["unset"]:
+        reverted[k] = diff["previous"][k]
+    return reverted
 
 
 class SharedStateEntry(BaseModel):
@@ -2442,14 +2508,16 @@ class SharedStateEntry(BaseModel):
     source_agent: Optional[AgentType] = None
     subscribers: List[AgentType] = Field(default_factory=list)
     history: List[SharedStateUpdate] = Field(default_factory=list)
+    max_history: Optional[int] = None  # Overrides the store's history_limit
 
-    def update(
+    def apply(
         self,
         value: Any,
         source_agent: AgentType,
         metadata: Optional[Dict[str, Any]] = None,
+        global_version: int = 0,
     ) -> SharedStateUpdate:
-        """Update the entry value."""
+        """Set a new value and return the update, without recording history."""
         update = SharedStateUpdate(
             key=self.key,
             value=value,
@@ -2457,23 +2525,109 @@ class SharedStateEntry(BaseModel):
             scope=self.scope,
             version=self.version + 1,
             metadata=metadata or {},
+            global_version=global_version,
         )
         self.value = value
         self.updated_at = datetime.utcnow()
         self.version = update.version
         self.source_agent = source_agent
-        self.history.append(update)
         return update
 
+    def record(
+        self,
+        update: SharedStateUpdate,
+        previous: Any = None,
+        store_diff: bool = False,
+        history_limit: Optional[int] = None,
+    ) -> SharedStateUpdate:
+        """
+        Append an update to the history, trimming it to the retention limit.
+        
+        Args:
+            update: Update to record
+            previous: Value before the update
+            store_diff: Store a diff against the previous value instead of
+                the full value (when both are dicts)
+            history_limit: Store default retention (max_history overrides it)
+        
+        Returns:
+            The history record (a diff-only copy when store_diff applies)
+        """
+        record = update
+        if store_diff and isinstance(previous, dict) and isinstance(update.value, dict):
+            record = update.model_copy(update={"value": None, "diff": _shallow_diff(previous, update.value)})
+
+        self.history.append(record)
+        limit = self.max_history if self.max_history is not None else history_limit
+        if limit is not None and len(self.history) > limit:
+            del self.history[:len(self.history) - limit]
+        return record
+
+    def update(
+        self,
+        value: Any,
+        source_agent: AgentType,
+        metadata: Optional[Dict[str, Any]] = None,
+        store_diff: bool = False,
+        history_limit: Optional[int] = None,
+    ) -> SharedStateUpdate:
+        """Update the entry value."""
+        previous = self.value
+        update = self.apply(value, source_agent, metadata)
+        self.record(update, previous, store_diff, history_limit)
+        return update
+
+    def value_at(self, version: int) -> Optional[Any]:
+        """
+        Reconstruct the value at an earlier version from the retained history.
+        
+        Args:
+            version: Entry version
+        
+        Returns:
+            The value, or None if that version is no longer reconstructable
+        """
+        value, known = self.value, True
+        for record in reversed(self.history):
+            if record.diff is None:
+                value, known = record.value, True
+            if record.version == version:
+                return value if known else None
+            if record.diff is None:
+                # The value before a full record isn't stored with it
+                known = False
+            elif known:
+                value = _revert_diff(value, record.diff)
+        return None
+
 
 class SharedStateStore(BaseModel):
-    """Shared state store for agent communication."""
+    """
+    Shared state store for agent communication.
+    
+    Every change gets a store-wide global_version and is appended to a
+    bounded change log, so get_updates_since is a binary search plus a
+    slice. Per-key history is capped at history_limit (or the entry's
+    max_history) and can hold dict diffs instead of full values.
+    """
     store_id: str = Field(default_factory=lambda: str(uuid4()))
     project_id: str
     entries: Dict[str, SharedStateEntry] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     global_version: int = 1
+    history_limit: Optional[int] = SHARED_STATE_HISTORY_LIMIT
+    change_log_limit: int = SHARED_STATE_CHANGE_LOG_LIMIT
+    store_diffs: bool = SHARED_STATE_STORE_DIFFS
+    
+    _change_log: List[SharedStateUpdate] = PrivateAttr(default_factory=list)
+    
+    def _log(self, record: SharedStateUpdate) -> None:
+        """Append a record to the change log, trimming it in batches."""
+        change_log = self._change_log
+        change_log.append(record)
+        if len(change_log) > self.change_log_limit + max(1, self.change_log_limit // 4):
+            del change_log[:len(change_log) - self.change_log_limit]
     
     def set(
         self,
@@ -2482,11 +2636,29 @@ class SharedStateStore(BaseModel):
         source_agent: AgentType,
         scope: SharedStateScope = SharedStateScope.GLOBAL,
         metadata: Optional[Dict[str, Any]] = None,
+        history_limit: Optional[int] = None,
     ) -> SharedStateUpdate:
-        """Set a value in the shared state."""
-        if key in self.entries:
-            entry = self.entries[key]
-            return entry.update(value, source_agent, metadata)
+        """
+        Set a value in the shared state.
+        
+        Args:
+            key: State key
+            value: Value to store
+            source_agent: Agent setting the value
+            scope: Visibility scope (used when the key is created)
+            metadata: Optional metadata
+            history_limit: History retained for this key (store default if not provided)
+        
+        Returns:
+            The update, with the full value
+        """
+        self.global_version += 1
+        self.updated_at = datetime.utcnow()
+        
+        entry = self.entries.get(key)
+        if entry is not None:
+            previous = entry.value
+            update = entry.apply(value, source_agent, metadata, self.global_version)
         else:
             entry = SharedStateEntry(
                 key=key,
@@ -2495,16 +2667,34 @@ class SharedStateStore(BaseModel):
                 source_agent=source_agent,
             )
             self.entries[key] = entry
-            self.updated_at = datetime.utcnow()
-            self.global_version += 1
-            return SharedStateUpdate(
+            previous = None
+            update = SharedStateUpdate(
                 key=key,
                 value=value,
                 source_agent=source_agent,
                 scope=scope,
                 version=1,
                 metadata=metadata or {},
+                global_version=self.global_version,
             )
+        
+        if history_limit is not None:
+            entry.max_history = history_limit
+        entry.record(update, previous, self.store_diffs, self.history_limit)
+        # The change log keeps full values; only per-key history holds diffs
+        self._log(update)
+        return update
+    
+    def set_history_limit(self, key: str, limit: Optional[int]) -> bool:
+        """Set the history retained for a key (None restores the store default)."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        entry.max_history = limit
+        effective = limit if limit is not None else self.history_limit
+        if effective is not None and len(entry.history) > effective:
+            del entry.history[:len(entry.history) - effective]
+        return True
     
     def get(self, key: str, scope: Optional[SharedStateScope] = None) -> Optional[Any]:
         """Get a value from the shared state."""
@@ -2519,14 +2709,26 @@ class SharedStateStore(BaseModel):
         """Get the full entry for a key."""
         return self.entries.get(key)
     
-    def delete(self, key: str) -> bool:
+    def _log_deletion(self, entry: SharedStateEntry, source_agent: Optional[AgentType]) -> None:
+        self.global_version += 1
+        self._log(SharedStateUpdate(
+            key=entry.key,
+            value=None,
+            source_agent=source_agent or entry.source_agent or AgentType.SUPERVISOR,
+            scope=entry.scope,
+            version=entry.version + 1,
+            global_version=self.global_version,
+            deleted=True,
+        ))
+    
+    def delete(self, key: str, source_agent: Optional[AgentType] = None) -> bool:
         """Delete a key from the shared state."""
-        if key in self.entries:
-            del self.entries[key]
-            self.updated_at = datetime.utcnow()
-            self.global_version += 1
-            return True
-        return False
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self._log_deletion(entry, source_agent)
+        self.updated_at = datetime.utcnow()
+        return True
     
     def get_by_scope(self, scope: SharedStateScope) -> Dict[str, Any]:
         """Get all entries with a specific scope."""
@@ -2537,13 +2739,25 @@ class SharedStateStore(BaseModel):
         }
     
     def get_updates_since(self, version: int) -> List[SharedStateUpdate]:
-        """Get all updates since a specific version."""
-        updates = []
-        for entry in self.entries.values():
-            for update in entry.history:
-                if update.version > version:
-                    updates.append(update)
-        return sorted(updates, key=lambda u: u.version)
+        """
+        Get all changes after a store global_version.
+        
+        Changes older than the retained change log are not returned; compare
+        the first result's global_version with version + 1 to detect a gap.
+        
+        Args:
+            version: Last global_version the caller has seen
+        
+        Returns:
+            Updates (including deletions) in global_version order
+        """
+        change_log = self._change_log
+        start = bisect.bisect_right(change_log, version, key=lambda u: u.global_version)
+        return change_log[start:]
+    
+    def get_oldest_logged_version(self) -> Optional[int]:
+        """Oldest global_version still in the change log."""
+        return self._change_log[0].global_version if self._change_log else None
     
     def subscribe(
         self,
@@ -2576,9 +2790,27 @@ class SharedStateStore(BaseModel):
     
     def clear(self) -> None:
         """Clear all entries."""
+        for entry in self.entries.values():
+            self._log_deletion(entry, None)
         self.entries.clear()
         self.updated_at = datetime.utcnow()
         self.global_version += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+        
+        Returns:
+            Entry, history and change log sizes and the current global_version
+        """
+        return {
+            "entries": len(self.entries),
+            "history_records": sum(len(entry.history) for entry in self.entries.values()),
+            "change_log_records": len(self._change_log),
+            "oldest_logged_version": self.get_oldest_logged_version(),
+            "global_version": self.global_version,
+            "store_diffs": self.store_diffs,
+        }
 
 
 class AgentMessage(BaseModel):
@@ -2595,12 +2827,40 @@ class AgentMessage(BaseModel):
 
 
 class MessageQueue(BaseModel):
-    """Queue for messages between agents."""
+    """
+    Queue for messages between agents.
+    
+    Messages are indexed by ID, by recipient (per-agent inbox deques), by
+    type and by the message they reply to, so lookups don't scan the whole
+    history. Read state is tracked per recipient, outside the message
+    content. At most max_messages are retained; the oldest are evicted.
+    """
     queue_id: str = Field(default_factory=lambda: str(uuid4()))
     project_id: str
-    messages: List[AgentMessage] = Field(default_factory=list)
     pending_responses: Dict[str, AgentMessage] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    max_messages: int = MESSAGE_QUEUE_MAX_MESSAGES
+    
+    _by_id: Dict[str, AgentMessage] = PrivateAttr(default_factory=dict)
+    _order: Deque[str] = PrivateAttr(default_factory=deque)
+    _inboxes: Dict[AgentType, Deque[str]] = PrivateAttr(default_factory=dict)
+    _unread: Dict[AgentType, Dict[str, None]] = PrivateAttr(default_factory=lambda: defaultdict(dict))
+    _by_type: Dict[str, Dict[str, None]] = PrivateAttr(default_factory=lambda: defaultdict(dict))
+    _replies: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _inbox_refs: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _evicted: int = PrivateAttr(default=0)
+    
+    @property
+    def messages(self) -> List[AgentMessage]:
+        """All retained messages, oldest first."""
+        return list(self._by_id.values())
+    
+    def _append_to_inbox(self, agent: AgentType, message_id: str) -> None:
+        inbox = self._inboxes.setdefault(agent, deque())
+        inbox.append(message_id)
+        # Evicted IDs are pruned lazily; compact once they dominate the inbox
+        if len(inbox) > 2 * self.max_messages:
+            self._inboxes[agent] = deque(i for i in inbox if i in self._by_id)
     
     def send_message(
         self,
@@ -2622,24 +2882,89 @@ class MessageQueue(BaseModel):
             priority=priority,
             requires_ack=requires_ack,
         )
-        self.messages.append(message)
+        message_id = message.message_id
+        
+        self._by_id[message_id] = message
+        self._order.append(message_id)
+        if len(self._order) > 2 * self.max_messages:
+            self._order = deque(i for i in self._order if i in self._by_id)
+        self._by_type[message_type][message_id] = None
+        recipients = list(dict.fromkeys(to_agents))
+        for agent in recipients:
+            self._append_to_inbox(agent, message_id)
+            self._unread[agent][message_id] = None
+        self._inbox_refs[message_id] = len(recipients)
+        if reply_to is not None:
+            self._replies.setdefault(reply_to, []).append(message_id)
+        
+        while len(self._by_id) > self.max_messages:
+            self._evict_oldest()
+        
         return message
     
+    def _evict_oldest(self) -> None:
+        """Drop the oldest retained message from every index."""
+        while self._order:
+            message = self._by_id.get(self._order.popleft())
+            if message is not None:
+                self._forget(message)
+                self._evicted += 1
+                return
+    
+    def _forget(self, message: AgentMessage) -> None:
+        """Remove a message from the indexes (inbox deques are pruned lazily)."""
+        message_id = message.message_id
+        self._by_id.pop(message_id, None)
+        self._inbox_refs.pop(message_id, None)
+        self._by_type[message.message_type].pop(message_id, None)
+        for agent in message.to_agents:
+            self._unread[agent].pop(message_id, None)
+        
+        if message.reply_to is not None:
+            replies = self._replies.get(message.reply_to)
+            if replies is not None and message_id in replies:
+                replies.remove(message_id)
+                if not replies:
+                    del self._replies[message.reply_to]
+    
+    def get_message(self, message_id: str) -> Optional[AgentMessage]:
+        """Get a message by ID."""
+        return self._by_id.get(message_id)
+    
     def get_messages_for_agent(self, agent: AgentType) -> List[AgentMessage]:
         """Get all messages for a specific agent."""
-        return [m for m in self.messages if agent in m.to_agents]
+        return [
+            self._by_id[message_id]
+            for message_id in self._inboxes.get(agent, ())
+            if message_id in self._by_id
+        ]
     
     def get_unread_for_agent(self, agent: AgentType) -> List[AgentMessage]:
         """Get unread messages for an agent."""
-        return [m for m in self.messages if agent in m.to_agents and not m.content.get("_read", False)]
+        return [self._by_id[message_id] for message_id in self._unread.get(agent, {})]
     
-    def mark_as_read(self, message_id: str) -> bool:
-        """Mark a message as read."""
-        for message in self.messages:
-            if message.message_id == message_id:
-                message.content["_read"] = True
-                return True
-        return False
+    def mark_as_read(self, message_id: str, agent: Optional[AgentType] = None) -> bool:
+        """
+        Mark a message as read.
+        
+        Args:
+            message_id: Message ID
+            agent: Recipient that read it (all recipients if not provided)
+        
+        Returns:
+            True if the message exists
+        """
+        message = self._by_id.get(message_id)
+        if message is None:
+            return False
+        
+        for recipient in ([agent] if agent is not None else message.to_agents):
+            self._unread[recipient].pop(message_id, None)
+        return True
+    
+    def is_read(self, message_id: str, agent: AgentType) -> bool:
+        """Check whether an agent has read a message."""
+        return message_id in self._by_id and message_id not in self._unread.get(agent, {})
     
     def reply_to_message(
         self,
@@ -2648,13 +2973,9 @@ class MessageQueue(BaseModel):
         content: Dict[str, Any],
     ) -> Optional[AgentMessage]:
         """Reply to a specific message."""
-        original = self.pending_responses.get(original_message_id)
-        if not original:
-            # Find in messages
-            for msg in self.messages:
-                if msg.message_id == original_message_id:
-                    original = msg
-                    break
+        original = self.pending_responses.get(original_message_id) or self._by_id.get(
+            original_message_id
+        )
         
         if original:
             return self.send_message(
@@ -2668,24 +2989,67 @@ class MessageQueue(BaseModel):
     
     def get_messages_by_type(self, message_type: str) -> List[AgentMessage]:
         """Get all messages of a specific type."""
-        return [m for m in self.messages if m.message_type == message_type]
+        return [self._by_id[message_id] for message_id in self._by_type.get(message_type, {})]
     
     def get_pending_responses(self, message_id: str) -> List[AgentMessage]:
         """Get pending responses to a message."""
-        return [m for m in self.messages if m.reply_to == message_id]
+        return [self._by_id[reply_id] for reply_id in self._replies.get(message_id, ())]
     
     def clear_processed(self, agent: AgentType) -> int:
-        """Clear processed messages for an agent."""
-        count = 0
-        to_remove = []
-        for message in self.messages:
-            if agent in message.to_agents and message.content.get("_read", False):
-                to_remove.append(message)
-        for msg in to_remove:
-            if msg in self.messages:
-                self.messages.remove(msg)
-                count += 1
-        return count
+        """
+        Clear processed (read) messages from an agent's inbox.
+        
+        A message is dropped from the queue once it is in no recipient's inbox.
+        
+        Args:
+            agent: Agent whose inbox to clear
+        
+        Returns:
+            Number of messages cleared
+        """
+        inbox = self._inboxes.get(agent)
+        if not inbox:
+            return 0
+        
+        # Locals: private attribute lookups go through pydantic's __getattr__
+        by_id = self._by_id
+        refs = self._inbox_refs
+        unread = self._unread.get(agent, {})
+        kept: Deque[str] = deque()
+        cleared = []
+        for message_id in inbox:
+            if message_id not in by_id:
+                continue
+            if message_id in unread:
+                kept.append(message_id)
+            else:
+                cleared.append(message_id)
+        self._inboxes[agent] = kept
+        
+        for message_id in cleared:
+            refs[message_id] -= 1
+            if refs[message_id] <= 0:
+                self._forget(by_id[message_id])
+        
+        return len(cleared)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+        
+        Returns:
+            Retained and evicted message counts and per-agent unread counts
+        """
+        return {
+            "messages": len(self._by_id),
+            "max_messages": self.max_messages,
+            "evicted": self._evicted,
+            "unread": {
+                getattr(agent, "value", agent): len(unread)
+                for agent, unread in self._unread.items()
+                if unread
+            },
+        }
 
 
 # ==================== Supervisor Agent ====================
@@ -2741,6 +3105,9 @@ class SupervisorAgent:
         
         # Timeout manager
         self._timeout_manager: Optional[TimeoutManager] = None
+        
+        # Caps agent runs across execute_parallel and run_batch
+        self._parallel_semaphore = asyncio.Semaphore(max(1, SUPERVISOR_MAX_CONCURRENCY))
     
     # ==================== Shared State Methods ====================
     
@@ -2921,7 +3288,22 @@ class SupervisorAgent:
         
         entry = self._shared_state_store.get_entry(key)
         return entry.version if entry else None
-    
+
+    def get_state_changes_since(self, version: int) -> List[SharedStateUpdate]:
+        """
+        Get shared state changes after a store global_version.
+
+        Args:
+            version: Last global_version the caller has seen
+
+        Returns:
+            Updates (including deletions) in global_version order
+        """
+        if not self._shared_state_store:
+            return []
+
+        return self._shared_state_store.get_updates_since(version)
+
     # ==================== Message Passing Methods ====================
     
     def get_message_queue(self) -> Optional[MessageQueue]:
@@ -3011,12 +3393,12 @@ class SupervisorAgent:
         
         return self._message_queue.get_unread_for_agent(agent)
     
-    def mark_message_read(self, message_id: str) -> bool:
-        """Mark a message as read."""
+    def mark_message_read(self, message_id: str, agent: Optional[AgentType] = None) -> bool:
+        """Mark a message as read (for one recipient, or all if agent is not given)."""
         if not self._message_queue:
             return False
         
-        return self._message_queue.mark_as_read(message_id)
+        return self._message_queue.mark_as_read(message_id, agent)
     
     def reply_to_message(
         self,
@@ -5530,6 +5912,139 @@ class SupervisorAgent:
             input_data=input_data,
         )
     
+    # ==================== Scheduling Methods ====================
+    
+    def _effective_timeout(
+        self,
+        agent_type: AgentType,
+        task_type: Optional[TaskType],
+        default: Optional[int] = None,
+    ) -> Optional[int]:
+        """Timeout for an agent run: the TimeoutManager's if initialized, else the default."""
+        if self._timeout_manager:
+            return self._timeout_manager.get_effective_timeout(agent_type, task_type)
+        return default
+    
+    def _record_timeout(
+        self,
+        agent_type: AgentType,
+        task_id: str,
+        task_type: TaskType,
+        started_at: datetime,
+    ) -> None:
+        """Record a timeout event with the TimeoutManager, if initialized."""
+        if self._timeout_manager:
+            self._timeout_manager.handle_timeout(
+                agent_type=agent_type,
+                task_id=task_id,
+                task_type=task_type,
+                elapsed_seconds=(datetime.utcnow() - started_at).total_seconds(),
+            )
+    
+    async def _invoke_agent(
+        self,
+        agent: Any,
+        timeout_seconds: Optional[int],
+        project_id: Optional[str],
+        thread_id: str,
+        initial_state: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Run an agent under a timeout.
+        
+        Agents without a run coroutine have their synchronous execute run in
+        a worker thread, so the timeout applies and siblings keep running.
+        The thread can't be stopped, so on timeout it keeps the caller's
+        concurrency slot until it returns.
+        
+        Args:
+            agent: Agent instance
+            timeout_seconds: Timeout (None for no timeout)
+            project_id: Project identifier
+            thread_id: Thread ID for the agent's checkpoints
+            initial_state: Initial state / input data
+        
+        Returns:
+            The agent's output
+        
+        Raises:
+            TimeoutError: If the agent doesn't finish in time
+        """
+        async with asyncio.timeout(timeout_seconds):
+            if hasattr(agent, 'run'):
+                if initial_state is None:
+                    return await agent.run(project_id=project_id, thread_id=thread_id)
+                return await agent.run(
+                    project_id=project_id,
+                    thread_id=thread_id,
+                    initial_state=initial_state,
+                )
+            context = contextvars.copy_context()
+            future = asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(context.run, agent.execute, initial_state or {})
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                stragglers = _slot_stragglers.get()
+                if stragglers is not None and not future.done():
+                    stragglers.append(future)
+                raise
+    
+    async def _run_scheduled(
+        self,
+        jobs: List[Callable[[], Awaitable[bool]]],
+        fail_fast: bool = False,
+        concurrency: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        Run jobs in a TaskGroup under the supervisor-wide semaphore.
+        
+        Jobs record their own outcome and return whether they succeeded; they
+        are expected not to raise.
+        
+        Args:
+            jobs: Coroutine factories returning True on success
+            fail_fast: Cancel the queued and running jobs after the first failure
+            concurrency: Additional limit for this call (1 runs the jobs in order)
+        
+        Returns:
+            Whether each job ran to completion (False if it was cancelled)
+        """
+        finished = [False] * len(jobs)
+        limit = asyncio.Semaphore(concurrency or max(1, len(jobs)))
+        
+        async def run(index: int, job: Callable[[], Awaitable[bool]]) -> None:
+            async with limit:
+                await self._parallel_semaphore.acquire()
+                stragglers: List[asyncio.Future] = []
+                _slot_stragglers.set(stragglers)
+                try:
+                    ok = await job()
+                finally:
+                    self._release_slot_after(stragglers)
+            finished[index] = True
+            if fail_fast and not ok:
+                raise _FailFast()
+        
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index, job in enumerate(jobs):
+                    group.create_task(run(index, job))
+        except* _FailFast:
+            pass
+        
+        return finished
+    
+    def _release_slot_after(self, stragglers: List[asyncio.Future]) -> None:
+        """Release a scheduler slot once the job's timed-out worker threads finish."""
+        pending = [future for future in stragglers if not future.done()]
+        if not pending:
+            self._parallel_semaphore.release()
+            return
+        waiter = asyncio.gather(*pending, return_exceptions=True)
+        waiter.add_done_callback(lambda _: self._parallel_semaphore.release())
+    
     async def execute_delegation(
         self,
         delegation: TaskDelegation,
@@ -5538,6 +6053,9 @@ class SupervisorAgent:
         """
         Execute a task delegation.
         
+        The run is limited to the TimeoutManager's effective timeout for the
+        agent and task type, if the manager is initialized.
+        
         Args:
             delegation: TaskDelegation to execute
             agent_instances: Dictionary of agent instances
@@ -5554,35 +6072,40 @@ class SupervisorAgent:
         
         delegation.status = TaskDelegationStatus.IN_PROGRESS
         delegation.started_at = datetime.utcnow()
+        timeout_seconds = self._effective_timeout(delegation.agent_type, delegation.task_type)
+        error: Optional[str] = None
         
         try:
-            # Execute the agent with input data
-            if hasattr(agent, 'run'):
-                result = await agent.run(
-                    project_id=delegation.input_data.get("project_id"),
-                    thread_id=delegation.task_id,
-                    initial_state=delegation.input_data,
-                )
-                delegation.output_data = result
-            else:
-                # Simple synchronous execution for agents without run method
-                result = agent.execute(delegation.input_data)
-                delegation.output_data = result
-            
-            delegation.status = TaskDelegationStatus.COMPLETED
-            delegation.completed_at = datetime.utcnow()
-            
+            delegation.output_data = await self._invoke_agent(
+                agent,
+                timeout_seconds,
+                project_id=delegation.input_data.get("project_id"),
+                thread_id=delegation.task_id,
+                initial_state=delegation.input_data,
+            )
+        except TimeoutError:
+            error = f"Agent {delegation.agent_type.value} timed out after {timeout_seconds}s"
+            self._record_timeout(
+                delegation.agent_type,
+                delegation.task_id,
+                delegation.task_type,
+                delegation.started_at,
+            )
         except Exception as e:
-            delegation.error = str(e)
+            error = str(e)
+        
+        if error is None:
+            delegation.status = TaskDelegationStatus.COMPLETED
+        else:
+            delegation.error = error
             delegation.retries += 1
             
             if delegation.retries < delegation.max_retries:
                 delegation.status = TaskDelegationStatus.PENDING
             else:
                 delegation.status = TaskDelegationStatus.FAILED
-            
-            delegation.completed_at = datetime.utcnow()
         
+        delegation.completed_at = datetime.utcnow()
         return delegation
     
     def batch_delegate(
@@ -5606,6 +6129,50 @@ class SupervisorAgent:
         
         return delegations
     
+    async def run_batch(
+        self,
+        delegations: List[TaskDelegation],
+        agent_instances: Dict[AgentType, Any],
+        *,
+        parallel: bool = False,
+        fail_fast: bool = False,
+    ) -> List[TaskDelegation]:
+        """
+        Register batch delegations and execute the pending ones.
+        
+        Args:
+            delegations: List of task delegations
+            agent_instances: Agent instances to execute with
+            parallel: Whether to execute in parallel (otherwise one at a time)
+            fail_fast: Cancel the remaining delegations after the first failure
+        
+        Returns:
+            List of TaskDelegation records, in input order
+        """
+        self.batch_delegate(delegations, parallel=parallel)
+        
+        pending = [d for d in delegations if d.status == TaskDelegationStatus.PENDING]
+        
+        def make_job(delegation: TaskDelegation) -> Callable[[], Awaitable[bool]]:
+            async def job() -> bool:
+                await self.execute_delegation(delegation, agent_instances)
+                return delegation.status == TaskDelegationStatus.COMPLETED
+            return job
+        
+        finished = await self._run_scheduled(
+            [make_job(d) for d in pending],
+            fail_fast=fail_fast,
+            concurrency=None if parallel else 1,
+        )
+        
+        for delegation, done in zip(pending, finished):
+            if not done:
+                delegation.status = TaskDelegationStatus.CANCELLED
+                delegation.error = "Cancelled after another delegation failed"
+                delegation.completed_at = datetime.utcnow()
+        
+        return delegations
+    
     def cancel_delegation(self, delegation_id: str) -> bool:
         """
         Cancel a pending delegation.
@@ -5966,6 +6533,7 @@ class SupervisorAgent:
         task_types: List[TaskType],
         agent_selections: Dict[TaskType, AgentType],
         timeout_seconds: int = 300,
+        failure_policy: ParallelFailurePolicy = ParallelFailurePolicy.CONTINUE,
     ) -> ParallelExecution:
         """
         Create a parallel execution context.
@@ -5974,7 +6542,8 @@ class SupervisorAgent:
             project_id: Project identifier
             task_types: Task types to execute
             agent_selections: Mapping of task type to agent
-            timeout_seconds: Timeout for execution
+            timeout_seconds: Per-task timeout when no TimeoutManager config applies
+            failure_policy: Whether to cancel remaining tasks on the first failure
         
         Returns:
             ParallelExecution instance
@@ -5984,6 +6553,7 @@ class SupervisorAgent:
             task_types=task_types,
             agent_selections=agent_selections,
             timeout_seconds=timeout_seconds,
+            failure_policy=failure_policy,
         )
     
     async def execute_parallel(
@@ -5994,6 +6564,11 @@ class SupervisorAgent:
         """
         Execute multiple agents in parallel.
         
+        Tasks run through the supervisor-wide scheduler, each limited to the
+        TimeoutManager's effective timeout (execution.timeout_seconds without
+        a manager). Under FAIL_FAST the remaining tasks are cancelled after
+        the first failure and recorded as errors.
+        
         Args:
             execution: ParallelExecution to run
             agent_instances: Dictionary of agent instances
@@ -6001,71 +6576,73 @@ class SupervisorAgent:
         Returns:
             Updated ParallelExecution with results
         """
-        import asyncio
-        
         execution.status = ParallelExecutionStatus.IN_PROGRESS
         execution.started_at = datetime.utcnow()
         
-        # Create tasks for each agent
-        async def execute_task(
-            task_type: TaskType,
-            agent_type: AgentType,
-        ) -> tuple[TaskType, bool, Dict[str, Any]]:
-            """Execute a single task."""
-            agent = agent_instances.get(agent_type)
-            
-            if agent is None:
-                return (task_type, False, {"error": f"Agent not found: {agent_type}"})
+        def make_job(task_type: TaskType) -> Callable[[], Awaitable[bool]]:
+            agent_type = execution.agent_selections[task_type]
+            task_id = f"parallel_{execution.execution_id}_{task_type.value}"
             
-            try:
-                if hasattr(agent, 'run'):
-                    result = await agent.run(
+            async def job() -> bool:
+                agent = agent_instances.get(agent_type)
+                
+                if agent is None:
+                    execution.add_error(task_type, f"Agent not found: {agent_type}")
+                    return False
+                
+                timeout_seconds = self._effective_timeout(
+                    agent_type, task_type, execution.timeout_seconds
+                )
+                started_at = datetime.utcnow()
+                
+                try:
+                    result = await self._invoke_agent(
+                        agent,
+                        timeout_seconds,
                         project_id=execution.project_id,
-                        thread_id=f"parallel_{execution.execution_id}",
+                        thread_id=task_id,
                     )
-                else:
-                    result = agent.execute({})
+                except TimeoutError:
+                    self._record_timeout(agent_type, task_id, task_type, started_at)
+                    execution.add_error(
+                        task_type,
+                        f"Agent {agent_type.value} timed out after {timeout_seconds}s",
+                    )
+                    return False
+                except Exception as e:
+                    execution.add_error(task_type, str(e))
+                    return False
                 
-                return (task_type, True, result)
-            except Exception as e:
-                return (task_type, False, {"error": str(e)})
-        
-        # Execute all tasks in parallel
-        tasks = [
-            execute_task(tt, execution.agent_selections[tt])
-            for tt in execution.task_types
-        ]
+                execution.add_result(
+                    task_type,
+                    AgentResult(
+                        agent_type=agent_type,
+                        task_id=task_id,
+                        success=True,
+                        output=result if isinstance(result, dict) else {},
+                        duration_seconds=(datetime.utcnow() - started_at).total_seconds(),
+                    ),
+                )
+                return True
+            
+            return job
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        fail_fast = execution.failure_policy == ParallelFailurePolicy.FAIL_FAST
+        finished = await self._run_scheduled(
+            [make_job(tt) for tt in execution.task_types],
+            fail_fast=fail_fast,
+        )
         
-        # Process results
-        for result in results:
-            if isinstance(result, Exception):
-                # Handle exception
-                for tt in execution.task_types:
-                    if tt not in execution.results and tt not in execution.errors:
-                        execution.add_error(tt, str(result))
-                        break
-            else:
-                task_type, success, data = result
-                
-                if success:
-                    execution.add_result(
-                        task_type,
-                        AgentResult(
-                            agent_type=execution.agent_selections[task_type],
-                            task_id=f"parallel_{execution.execution_id}_{task_type.value}",
-                            success=True,
-                            output=data,
-                        ),
-                    )
-                else:
-                    execution.add_error(task_type, data.get("error", "Unknown error"))
+        for task_type, done in zip(execution.task_types, finished):
+            if not done:
+                execution.add_error(task_type, "Cancelled after another task failed")
         
         execution.completed_at = datetime.utcnow()
         
         if execution.is_successful():
             execution.status = ParallelExecutionStatus.COMPLETED
+        elif fail_fast:
+            execution.status = ParallelExecutionStatus.FAILED
         elif execution.get_failure_count() > 0:
             execution.status = ParallelExecutionStatus.PARTIAL
         else:
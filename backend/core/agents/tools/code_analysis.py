@@ -10730,6 +10730,7 @@ class InferArchitectureTool(BaseTool):
 
         try:
             from backend.core.llm import TaskComplexity, get_llm_client, select_model
+            from backend.core.llm_limiter import LLMPriority
 
             async def _call_llm() -> str:
                 llm = get_llm_client()
@@ -10741,6 +10742,7 @@ class InferArchitectureTool(BaseTool):
                         "Stay factual and avoid speculation."
                     ),
                     model=selection.model_name if hasattr(selection, "model_name") else None,
+                    priority=LLMPriority.BATCH,
                 )
                 return getattr(generation, "text", None) or str(generation)
 
@@ -11568,6 +11570,7 @@ class GenerateC4ModelTool(BaseTool):
 
         try:
             from backend.core.llm import TaskComplexity, get_llm_client, select_model
+            from backend.core.llm_limiter import LLMPriority
 
             async def _call_llm() -> str:
                 llm = get_llm_client()
@@ -11578,6 +11581,7 @@ class GenerateC4ModelTool(BaseTool):
                         "You are a software architect producing strict JSON output."
                     ),
                     model=selection.model_name if hasattr(selection, "model_name") else None,
+                    priority=LLMPriority.BATCH,
                 )
                 return getattr(generation, "text", None) or str(generation)
 
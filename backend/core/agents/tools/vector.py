@@ -15,6 +15,7 @@ from uuid import UUID, uuid4
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from backend.vector.context import count_tokens
 from backend.vector.repository import VectorSearchRepository, get_vector_repo
 
 
@@ -352,6 +353,7 @@ class GetRAGContextTool(BaseTool):
             return {
                 "status": "success",
                 "context": context,
+                "tokens": count_tokens(context),
                 "query": query,
                 "project_id": project_id,
             }
@@ -5,10 +5,15 @@ This module implements the ValidationAgent as a LangGraph StateGraph
 that manages decision and artifact validation, including contradiction detection.
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Callable, Set, Tuple
 from datetime import datetime
 from uuid import uuid4
+import asyncio
+import hashlib
 import json
+import logging
+import os
 
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import CheckpointSaver
@@ -25,6 +30,316 @@ from .state import create_validation_state
 from ..llm import get_llm_client, select_model, TaskComplexity
 
 
+logger = logging.getLogger(__name__)
+
+# Contradiction candidate pairs: "keyword" (inverted index over opposite
+# patterns) or "semantic" (embedding nearest neighbours)
+CONTRADICTION_DETECTION_MODE = os.getenv("CONTRADICTION_DETECTION_MODE", "keyword")
+
+# Semantic mode: neighbours per decision and minimum cosine similarity
+CONTRADICTION_NEIGHBORS = int(os.getenv("CONTRADICTION_NEIGHBORS", "10"))
+CONTRADICTION_MIN_SIMILARITY = float(os.getenv("CONTRADICTION_MIN_SIMILARITY", "0.5"))
+
+# Keep per-project results between runs and re-check only changed decisions
+VALIDATION_INCREMENTAL = os.getenv("VALIDATION_INCREMENTAL", "true").lower() == "true"
+
+# Projects whose validation results are kept (least recently used evicted)
+VALIDATION_CACHE_MAX_PROJECTS = int(os.getenv("VALIDATION_CACHE_MAX_PROJECTS", "256"))
+
+# Terms that contradict each other when found in decisions of different categories
+OPPOSITE_PATTERNS = [
+    ("sql", "nosql"),
+    ("rest", "graphql"),
+    ("monolith", "microservice"),
+    ("synchronous", "asynchronous"),
+    ("centralized", "decentralized"),
+]
+
+_PATTERN_TERMS = frozenset(term for pattern in OPPOSITE_PATTERNS for term in pattern)
+_OPPOSITE_TERMS = {
+    **{first: second for first, second in OPPOSITE_PATTERNS},
+    **{second: first for first, second in OPPOSITE_PATTERNS},
+}
+
+
+def _decision_keywords(decision: Decision) -> Set[str]:
+    """Lowercased answer tokens of a decision."""
+    return set((getattr(decision, "answer_text", "") or "").lower().split())
+
+
+def _match_opposite_pattern(
+    keywords1: Set[str],
+    keywords2: Set[str],
+) -> Optional[Tuple[str, str]]:
+    """First opposite pattern split across the two keyword sets, if any."""
+    for pattern in OPPOSITE_PATTERNS:
+        if (pattern[0] in keywords1 and pattern[1] in keywords2) or (
+            pattern[1] in keywords1 and pattern[0] in keywords2
+        ):
+            return pattern
+    return None
+
+
+def _pair_key(id1: str, id2: str) -> Tuple[str, str]:
+    """Order-independent key for a pair of decisions."""
+    return (id1, id2) if id1 <= id2 else (id2, id1)
+
+
+def _decision_fingerprint(decision: Decision) -> str:
+    """Hash of the decision fields validation depends on."""
+    category = getattr(decision, "category", None)
+    payload = json.dumps(
+        [
+            getattr(category, "value", category),
+            getattr(decision, "answer_text", None),
+            sorted(getattr(decision, "dependencies", None) or ()),
+        ],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _artifact_fingerprint(artifact: Artifact) -> str:
+    """Hash of an artifact's content and the decisions it is based on."""
+    payload = json.dumps(
+        [getattr(artifact, "content", ""), sorted(getattr(artifact, "based_on_decisions", None) or ())],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DecisionKeywordIndex:
+    """
+    Token index over a project's decisions.
+    
+    Holds each decision's keyword set and an inverted index from opposite
+    pattern terms to decision IDs, so contradiction candidates come from
+    the postings lists instead of comparing every pair of decisions.
+    Decisions can be added and removed individually, so the index can be
+    kept across validation runs.
+    """
+    
+    def __init__(self, decisions: Optional[Dict[str, Decision]] = None):
+        """
+        Build the index.
+        
+        Args:
+            decisions: Decisions keyed by decision ID
+        """
+        self.decisions: Dict[str, Decision] = {}
+        self.keywords: Dict[str, Set[str]] = {}
+        # Dicts used as insertion-ordered sets, so removal is O(1)
+        self.postings: Dict[str, Dict[str, None]] = defaultdict(dict)
+        
+        for decision_id, decision in (decisions or {}).items():
+            self.add(decision_id, decision)
+    
+    def add(self, decision_id: str, decision: Decision) -> None:
+        """Index a decision, replacing any earlier version of it."""
+        self.remove(decision_id)
+        keywords = _decision_keywords(decision)
+        self.decisions[decision_id] = decision
+        self.keywords[decision_id] = keywords
+        for term in keywords & _PATTERN_TERMS:
+            self.postings[term][decision_id] = None
+    
+    def remove(self, decision_id: str) -> None:
+        """Drop a decision from the index."""
+        keywords = self.keywords.pop(decision_id, None)
+        self.decisions.pop(decision_id, None)
+        for term in (keywords or set()) & _PATTERN_TERMS:
+            self.postings[term].pop(decision_id, None)
+    
+    def _different_categories(self, id1: str, id2: str) -> bool:
+        return getattr(self.decisions[id1], "category", None) != getattr(
+            self.decisions[id2], "category", None
+        )
+    
+    def match_pair(self, id1: str, id2: str) -> Optional[Tuple[str, str]]:
+        """
+        Match one pair of decisions against the opposite patterns.
+        
+        Args:
+            id1: First decision ID
+            id2: Second decision ID
+        
+        Returns:
+            The first matching opposite pattern, or None
+        """
+        if id1 == id2 or not self._different_categories(id1, id2):
+            return None
+        return _match_opposite_pattern(self.keywords[id1], self.keywords[id2])
+    
+    def matches_for(self, decision_ids: Iterable[str]) -> List[Tuple[str, str, Tuple[str, str]]]:
+        """
+        Find pairs involving the given decisions that contain opposite patterns.
+        
+        Work is proportional to the postings of the opposite terms, not to
+        the number of decisions. Each pair is reported once, with the first
+        pattern (in OPPOSITE_PATTERNS order) it matches.
+        
+        Args:
+            decision_ids: Decisions to find matches for
+        
+        Returns:
+            (decision_id, decision_id, pattern) tuples
+        """
+        matches = []
+        seen = set()
+        
+        for id1 in decision_ids:
+            for term in self.keywords.get(id1, set()) & _PATTERN_TERMS:
+                for id2 in self.postings.get(_OPPOSITE_TERMS[term], ()):
+                    key = _pair_key(id1, id2)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    pattern = self.match_pair(id1, id2)
+                    if pattern is not None:
+                        matches.append((id1, id2, pattern))
+        
+        return matches
+
+
+class ProjectValidationCache:
+    """
+    Validation results kept between runs for one project.
+    
+    Stores a fingerprint per decision and the results derived from it
+    (format checks, contradiction pairs, dependency checks), plus artifact
+    results keyed by artifact fingerprint. A run diffs the fingerprints
+    and re-checks only what the changed decisions touch; fingerprints are
+    committed when the run completes, so a failed run is redone in full.
+    """
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.fingerprints: Dict[str, str] = {}
+        self.index = DecisionKeywordIndex()
+        self.format_results: Dict[str, Dict[str, Any]] = {}
+        self.contradictions: Dict[Tuple[str, str], Contradiction] = {}
+        self.pairs_by_decision: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self.dependency_checks: Dict[str, Dict[str, Any]] = {}
+        self.missing_dependencies: Dict[str, List[str]] = {}
+        self.artifact_validations: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.breaking_changes: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+        self.dependencies: Dict[str, Tuple[str, ...]] = {}
+        self.dependents: Dict[str, Set[str]] = defaultdict(set)
+        self.graph_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self.lock = asyncio.Lock()
+        self._pending: Dict[str, Optional[str]] = {}
+    
+    def diff(self, decisions: Dict[str, Decision]) -> Tuple[List[str], List[str]]:
+        """
+        Compare decisions with the committed fingerprints.
+        
+        Args:
+            decisions: Current decisions keyed by decision ID
+        
+        Returns:
+            Tuple of (changed or new decision IDs, removed decision IDs)
+        """
+        changed = []
+        self._pending = {}
+        for decision_id, decision in decisions.items():
+            fingerprint = _decision_fingerprint(decision)
+            if self.fingerprints.get(decision_id) != fingerprint:
+                changed.append(decision_id)
+                self._pending[decision_id] = fingerprint
+        
+        removed = [decision_id for decision_id in self.fingerprints if decision_id not in decisions]
+        for decision_id in removed:
+            self._pending[decision_id] = None
+        
+        return changed, removed
+    
+    def affected(self, changed: List[str], removed: List[str]) -> List[str]:
+        """
+        Expand changed decisions with the decisions that depend on them.
+        
+        Args:
+            changed: Changed or new decision IDs
+            removed: Removed decision IDs
+        
+        Returns:
+            Decision IDs whose dependency checks must be re-run
+        """
+        affected = dict.fromkeys(changed)
+        for decision_id in (*changed, *removed):
+            for dependent in self.dependents.get(decision_id, ()):
+                affected.setdefault(dependent)
+            for dependent in self.graph_dependents.get(decision_id, ()):
+                affected.setdefault(dependent)
+        return list(affected)
+    
+    def set_dependency_graph(self, edges: Iterable[Any]) -> None:
+        """
+        Replace the stored dependency graph.
+        
+        Args:
+            edges: Dependency rows with source_decision_id (the dependent)
+                and target_decision_id (the prerequisite), e.g. from
+                DecisionDependencyRepository.get_dependency_graph
+        """
+        self.graph_dependents = defaultdict(set)
+        for edge in edges:
+            self.graph_dependents[str(edge.target_decision_id)].add(str(edge.source_decision_id))
+    
+    def drop_pairs(self, decision_ids: Iterable[str]) -> Dict[Tuple[str, str], Contradiction]:
+        """Remove cached contradiction pairs involving the decisions and return them."""
+        dropped = {}
+        for decision_id in decision_ids:
+            for key in self.pairs_by_decision.pop(decision_id, set()):
+                contradiction = self.contradictions.pop(key, None)
+                if contradiction is not None:
+                    dropped[key] = contradiction
+                other = key[1] if key[0] == decision_id else key[0]
+                self.pairs_by_decision.get(other, set()).discard(key)
+        return dropped
+    
+    def add_pair(self, key: Tuple[str, str], contradiction: Contradiction) -> None:
+        """Cache a contradiction for a pair of decisions."""
+        self.contradictions[key] = contradiction
+        self.pairs_by_decision[key[0]].add(key)
+        self.pairs_by_decision[key[1]].add(key)
+    
+    def sync_resolutions(self, contradictions: Dict[str, Contradiction]) -> None:
+        """Copy resolutions from the run state onto the cached contradictions."""
+        resolved = {cid: c for cid, c in contradictions.items() if c.resolved}
+        if not resolved:
+            return
+        for contradiction in self.contradictions.values():
+            source = resolved.get(contradiction.contradiction_id)
+            if source is not None and source is not contradiction:
+                contradiction.resolved = True
+                contradiction.suggested_resolution = source.suggested_resolution
+                contradiction.resolution = source.resolution
+    
+    def clear(self) -> None:
+        """Forget all results, so the next run re-checks everything."""
+        lock = self.lock
+        self.__init__()
+        self.lock = lock
+    
+    def commit(self, decisions: Dict[str, Decision]) -> None:
+        """Record the fingerprints (and dependency edges) of a completed run."""
+        for decision_id, fingerprint in self._pending.items():
+            for dependency in self.dependencies.pop(decision_id, ()):
+                self.dependents[dependency].discard(decision_id)
+            
+            if fingerprint is None:
+                self.fingerprints.pop(decision_id, None)
+                continue
+            
+            self.fingerprints[decision_id] = fingerprint
+            dependencies = tuple(getattr(decisions[decision_id], "dependencies", None) or ())
+            self.dependencies[decision_id] = dependencies
+            for dependency in dependencies:
+                self.dependents[dependency].add(decision_id)
+        
+        self._pending = {}
+
+
 # ==================== Node Names ====================
 
 class ValidationNode:
@@ -59,6 +374,9 @@ class ValidationAgent:
         checkpoint_saver: Optional[CheckpointSaver] = None,
         on_contradiction: Optional[Callable[[Contradiction], None]] = None,
         on_human_review: Optional[Callable[[str], None]] = None,
+        contradiction_mode: str = CONTRADICTION_DETECTION_MODE,
+        vector_repo=None,
+        incremental: bool = VALIDATION_INCREMENTAL,
     ):
         """
         Initialize the Validation Agent.
@@ -67,10 +385,19 @@ class ValidationAgent:
             checkpoint_saver: Checkpoint saver for state persistence
             on_contradiction: Callback when contradiction is detected
             on_human_review: Callback when human review is needed
+            contradiction_mode: "keyword" or "semantic" candidate pair selection
+            vector_repo: VectorSearchRepository for semantic mode
+                (shared repository if not provided)
+            incremental: Keep results per project and re-check only
+                decisions changed since the last run
         """
         self.checkpoint_saver = checkpoint_saver
         self.on_contradiction = on_contradiction
         self.on_human_review = on_human_review
+        self.contradiction_mode = contradiction_mode
+        self.vector_repo = vector_repo
+        self.incremental = incremental
+        self._validation_caches: "OrderedDict[str, ProjectValidationCache]" = OrderedDict()
         self.llm = get_llm_client()
         self.graph = self._build_graph()
     
@@ -136,7 +463,7 @@ class ValidationAgent:
         return builder.compile()
     
     async def _start_node(self, state: ValidationAgentState) -> ValidationAgentState:
-        """Start the validation process."""
+        """Start the validation process and work out which decisions changed."""
         state["messages"] = state.get("messages", [])
         state["messages"].append({
             "role": "system",
@@ -144,19 +471,30 @@ class ValidationAgent:
             "timestamp": datetime.utcnow().isoformat(),
         })
         
+        cache = self._get_project_cache(state["project_id"])
+        changed, removed = cache.diff(state.get("decisions", {}))
+        
+        state["changed_decisions"] = changed
+        state["removed_decisions"] = removed
+        state["affected_decisions"] = cache.affected(changed, removed)
+        
         return state
     
     async def _validate_answer_format_node(
         self,
         state: ValidationAgentState,
     ) -> ValidationAgentState:
-        """Validate the format of answers."""
+        """Validate the format of changed answers."""
         decisions = state.get("decisions", {})
+        cache = self._get_project_cache(state["project_id"])
         
-        validation_results = {}
+        for decision_id in state.get("removed_decisions", []):
+            cache.format_results.pop(decision_id, None)
         
-        for decision_id, decision in decisions.items():
+        for decision_id in state.get("changed_decisions", []):
+            decision = decisions[decision_id]
             if not hasattr(decision, "answer_text"):
+                cache.format_results.pop(decision_id, None)
                 continue
             
             answer = decision.answer_text
@@ -164,9 +502,9 @@ class ValidationAgent:
             # Check format based on category
             category = getattr(decision, "category", None)
             result = self._check_answer_format(answer, category)
-            validation_results[decision_id] = result
+            cache.format_results[decision_id] = result
         
-        state["validation_results"] = validation_results
+        state["validation_results"] = dict(cache.format_results)
         
         return state
     
@@ -174,40 +512,27 @@ class ValidationAgent:
         self,
         state: ValidationAgentState,
     ) -> ValidationAgentState:
-        """Detect contradictions between decisions."""
-        decisions = state.get("decisions", {})
-        decision_list = list(decisions.values())
+        """
+        Detect contradictions between decisions.
         
-        contradictions = {}
-        pending_contradictions = []
+        Only pairs involving changed decisions are evaluated; contradictions
+        between unchanged decisions come from the project cache, keeping
+        their IDs and resolutions. Unresolved contradictions stay pending.
+        """
+        cache = self._get_project_cache(state["project_id"])
         
-        # Compare each pair of decisions
-        for i, d1 in enumerate(decision_list):
-            for d2 in decision_list[i + 1:]:
-                result = self._check_contradiction(d1, d2)
-                
-                if result["is_contradiction"]:
-                    contradiction = Contradiction(
-                        contradiction_id=str(uuid4()),
-                        decision_1_id=getattr(d1, "decision_id", str(i)),
-                        decision_2_id=getattr(d2, "decision_id", str(i + 1)),
-                        decision_1_text=getattr(d1, "answer_text", ""),
-                        decision_2_text=getattr(d2, "answer_text", ""),
-                        similarity_score=result["similarity_score"],
-                        description=result["description"],
-                        suggested_resolution=result.get("resolution"),
-                    )
-                    
-                    cid = contradiction.contradiction_id
-                    contradictions[cid] = contradiction
-                    pending_contradictions.append(cid)
-                    
-                    # Notify callback
-                    if self.on_contradiction:
-                        self.on_contradiction(contradiction)
+        await self._update_contradictions(
+            cache,
+            state.get("decisions", {}),
+            state.get("changed_decisions", []),
+            state.get("removed_decisions", []),
+        )
         
+        contradictions = {c.contradiction_id: c for c in cache.contradictions.values()}
         state["contradictions"] = contradictions
-        state["pending_contradictions"] = pending_contradictions
+        state["pending_contradictions"] = [
+            cid for cid, contradiction in contradictions.items() if not contradiction.resolved
+        ]
         
         return state
     
@@ -215,15 +540,21 @@ class ValidationAgent:
         self,
         state: ValidationAgentState,
     ) -> ValidationAgentState:
-        """Check if all dependencies are satisfied."""
+        """Check dependencies of decisions affected by the changes."""
         decisions = state.get("decisions", {})
+        cache = self._get_project_cache(state["project_id"])
         
-        dependency_checks = {}
-        incomplete_dependencies = []
+        for decision_id in state.get("removed_decisions", []):
+            cache.dependency_checks.pop(decision_id, None)
+            cache.missing_dependencies.pop(decision_id, None)
         
-        for decision_id, decision in decisions.items():
-            deps = getattr(decision, "dependencies", [])
+        for decision_id in state.get("affected_decisions", []):
+            if decision_id not in decisions:
+                continue
+            
+            deps = getattr(decisions[decision_id], "dependencies", [])
             checks = {}
+            missing = []
             
             for dep_id in deps:
                 if dep_id in decisions:
@@ -240,13 +571,18 @@ class ValidationAgent:
                         "answered": False,
                         "answer": None,
                     }
-                    if dep_id not in incomplete_dependencies:
-                        incomplete_dependencies.append(dep_id)
+                    missing.append(dep_id)
             
-            dependency_checks[decision_id] = checks
+            cache.dependency_checks[decision_id] = checks
+            if missing:
+                cache.missing_dependencies[decision_id] = missing
+            else:
+                cache.missing_dependencies.pop(decision_id, None)
         
-        state["dependency_checks"] = dependency_checks
-        state["incomplete_dependencies"] = incomplete_dependencies
+        state["dependency_checks"] = dict(cache.dependency_checks)
+        state["incomplete_dependencies"] = list(dict.fromkeys(
+            dep_id for missing in cache.missing_dependencies.values() for dep_id in missing
+        ))
         
         return state
     
@@ -254,16 +590,34 @@ class ValidationAgent:
         self,
         state: ValidationAgentState,
     ) -> ValidationAgentState:
-        """Validate artifacts against decisions."""
+        """
+        Validate artifacts against decisions.
+        
+        An artifact is re-validated only if its content or decision list
+        changed, or if it is based on a changed or removed decision.
+        """
         artifacts = state.get("artifacts", [])
         decisions = state.get("decisions", {})
+        cache = self._get_project_cache(state["project_id"])
+        touched = set(state.get("changed_decisions", [])) | set(state.get("removed_decisions", []))
         
         artifact_validations = {}
         validation_errors = []
         validation_warnings = []
         
         for artifact in artifacts:
-            validation = self._validate_artifact_against_decisions(artifact, decisions)
+            fingerprint = _artifact_fingerprint(artifact)
+            cached = cache.artifact_validations.get(artifact.artifact_id)
+            
+            if (
+                cached is not None
+                and cached[0] == fingerprint
+                and touched.isdisjoint(getattr(artifact, "based_on_decisions", None) or ())
+            ):
+                validation = cached[1]
+            else:
+                validation = self._validate_artifact_against_decisions(artifact, decisions)
+                cache.artifact_validations[artifact.artifact_id] = (fingerprint, validation)
             artifact_validations[artifact.artifact_id] = validation
             
             if validation["status"] == ValidationStatus.FAILED:
@@ -283,12 +637,22 @@ class ValidationAgent:
     ) -> ValidationAgentState:
         """Detect breaking changes for brownfield projects."""
         artifacts = state.get("artifacts", [])
+        cache = self._get_project_cache(state["project_id"])
         
         breaking_changes = []
         breaking_change_detected = False
         
         for artifact in artifacts:
-            changes = self._detect_breaking_changes(artifact)
+            content_hash = hashlib.sha256(
+                (getattr(artifact, "content", "") or "").encode("utf-8")
+            ).hexdigest()
+            cached = cache.breaking_changes.get(artifact.artifact_id)
+            
+            if cached is not None and cached[0] == content_hash:
+                changes = cached[1]
+            else:
+                changes = self._detect_breaking_changes(artifact)
+                cache.breaking_changes[artifact.artifact_id] = (content_hash, changes)
             breaking_changes.extend(changes)
         
         if breaking_changes:
@@ -344,9 +708,17 @@ class ValidationAgent:
         if not summary:
             summary.append("All validations passed")
         
+        decisions = state.get("decisions", {})
+        cache = self._get_project_cache(state["project_id"])
+        cache.sync_resolutions(state.get("contradictions", {}))
+        cache.commit(decisions)
+        
         state["messages"].append({
             "role": "system",
-            "content": f"Validation complete: {', '.join(summary)}.",
+            "content": (
+                f"Validation complete: {', '.join(summary)} "
+                f"({len(state.get('affected_decisions', []))} of {len(decisions)} decisions re-checked)."
+            ),
             "timestamp": datetime.utcnow().isoformat(),
         })
         
@@ -400,31 +772,169 @@ class ValidationAgent:
         if getattr(d1, "category", None) == getattr(d2, "category", None):
             return {"is_contradiction": False}
         
-        text1 = getattr(d1, "answer_text", "")
-        text2 = getattr(d2, "answer_text", "")
+        pattern = _match_opposite_pattern(_decision_keywords(d1), _decision_keywords(d2))
+        if pattern is None:
+            return {"is_contradiction": False}
+        return self._contradiction_result(pattern)
+    
+    def _contradiction_result(
+        self,
+        pattern: Tuple[str, str],
+        similarity_score: float = 0.8,
+    ) -> Dict[str, Any]:
+        """Describe a contradiction on an opposite pattern."""
+        return {
+            "is_contradiction": True,
+            "similarity_score": similarity_score,
+            "description": f"Decisions contain opposite patterns: {pattern[0]} vs {pattern[1]}",
+            "resolution": f"Choose one: either '{pattern[0]}' or '{pattern[1]}', not both",
+        }
+    
+    def _get_project_cache(self, project_id: str) -> ProjectValidationCache:
+        """Get (or create) the validation cache of a project."""
+        cache = self._validation_caches.get(project_id)
+        if cache is None:
+            cache = ProjectValidationCache()
+            self._validation_caches[project_id] = cache
+            while len(self._validation_caches) > VALIDATION_CACHE_MAX_PROJECTS:
+                self._validation_caches.popitem(last=False)
+        else:
+            self._validation_caches.move_to_end(project_id)
+        return cache
+    
+    async def _update_contradictions(
+        self,
+        cache: ProjectValidationCache,
+        decisions: Dict[str, Decision],
+        changed: List[str],
+        removed: List[str],
+    ) -> List[Contradiction]:
+        """
+        Re-evaluate contradiction pairs involving changed decisions.
         
-        keywords1 = set(text1.lower().split())
-        keywords2 = set(text2.lower().split())
+        Index updates and matching run in a worker thread so large projects
+        don't block the event loop. A pair that still contradicts with the
+        same texts keeps its cached Contradiction (and resolution).
         
-        # Simple heuristic: high overlap but opposite keywords
-        opposite_pairs = [
-            ("sql", "nosql"),
-            ("rest", "graphql"),
-            ("monolith", "microservice"),
-            ("synchronous", "asynchronous"),
-            ("centralized", "decentralized"),
-        ]
+        Args:
+            cache: Project validation cache to update
+            decisions: Current decisions keyed by decision ID
+            changed: Changed or new decision IDs
+            removed: Removed decision IDs
+        
+        Returns:
+            Newly detected contradictions
+        """
+        def update_index() -> None:
+            for decision_id in removed:
+                cache.index.remove(decision_id)
+            for decision_id in changed:
+                cache.index.add(decision_id, decisions[decision_id])
+        
+        await asyncio.to_thread(update_index)
+        stale = cache.drop_pairs([*changed, *removed])
+        
+        if not changed:
+            return []
+        if self.contradiction_mode == "semantic":
+            matches = await self._semantic_contradiction_matches(cache.index, decisions, changed)
+        else:
+            matches = [
+                (id1, id2, pattern, 0.8)
+                for id1, id2, pattern in await asyncio.to_thread(cache.index.matches_for, changed)
+            ]
+        
+        detected = []
+        for id1, id2, pattern, similarity in matches:
+            key = _pair_key(id1, id2)
+            if key in cache.contradictions:
+                continue
+            
+            d1, d2 = decisions[id1], decisions[id2]
+            result = self._contradiction_result(pattern, similarity)
+            previous = stale.get(key)
+            if (
+                previous is not None
+                and previous.description == result["description"]
+                and {previous.decision_1_text, previous.decision_2_text}
+                == {getattr(d1, "answer_text", ""), getattr(d2, "answer_text", "")}
+            ):
+                cache.add_pair(key, previous)
+                continue
+            
+            contradiction = Contradiction(
+                contradiction_id=str(uuid4()),
+                decision_1_id=getattr(d1, "decision_id", id1),
+                decision_2_id=getattr(d2, "decision_id", id2),
+                decision_1_text=getattr(d1, "answer_text", ""),
+                decision_2_text=getattr(d2, "answer_text", ""),
+                similarity_score=result["similarity_score"],
+                description=result["description"],
+                suggested_resolution=result.get("resolution"),
+            )
+            cache.add_pair(key, contradiction)
+            detected.append(contradiction)
+            
+            # Notify callback
+            if self.on_contradiction:
+                self.on_contradiction(contradiction)
+        
+        return detected
+    
+    async def _semantic_contradiction_matches(
+        self,
+        index: DecisionKeywordIndex,
+        decisions: Dict[str, Decision],
+        decision_ids: List[str],
+    ) -> List[Tuple[str, str, Tuple[str, str], float]]:
+        """
+        Match opposite patterns on embedding nearest-neighbour pairs only.
+        
+        Decisions about the same subject sit close in embedding space, so
+        restricting to neighbours drops opposite terms used in unrelated
+        contexts. Falls back to keyword matching if the repository has no
+        embedding client (placeholder vectors have no meaningful neighbours)
+        or the embedding search fails.
+        
+        Args:
+            index: Keyword index of the current decisions
+            decisions: Current decisions keyed by decision ID
+            decision_ids: Decisions whose neighbours are evaluated
         
-        for pair in opposite_pairs:
-            if pair[0] in keywords1 and pair[1] in keywords2:
-                return {
-                    "is_contradiction": True,
-                    "similarity_score": 0.8,
-                    "description": f"Decisions contain opposite patterns: {pair[0]} vs {pair[1]}",
-                    "resolution": f"Choose one: either '{pair[0]}' or '{pair[1]}', not both",
-                }
+        Returns:
+            (decision_id, decision_id, pattern, cosine similarity) tuples
+        """
+        texts = {
+            decision_id: getattr(decision, "answer_text", "") or ""
+            for decision_id, decision in decisions.items()
+        }
         
-        return {"is_contradiction": False}
+        try:
+            if self.vector_repo is None:
+                from backend.vector.repository import get_vector_repo
+                
+                self.vector_repo = get_vector_repo()
+            if getattr(self.vector_repo, "embedding_client", None) is None:
+                raise RuntimeError("vector repository has no embedding client")
+            pairs = await self.vector_repo.find_nearest_decision_pairs(
+                texts,
+                k=CONTRADICTION_NEIGHBORS,
+                min_similarity=CONTRADICTION_MIN_SIMILARITY,
+                query_ids=decision_ids,
+            )
+        except Exception as e:
+            logger.warning(f"Semantic contradiction search failed, using keyword index: {e}")
+            return [
+                (id1, id2, pattern, 0.8)
+                for id1, id2, pattern in await asyncio.to_thread(index.matches_for, decision_ids)
+            ]
+        
+        matches = []
+        for id1, id2, similarity in pairs:
+            pattern = index.match_pair(id1, id2)
+            if pattern is not None:
+                matches.append((id1, id2, pattern, similarity))
+        return matches
     
     async def _generate_resolution(
         self,
@@ -533,15 +1043,25 @@ class ValidationAgent:
         decisions: Dict[str, Decision],
         artifacts: Optional[List[Artifact]] = None,
         thread_id: Optional[str] = None,
+        dependency_graph: Optional[List[Any]] = None,
+        full: bool = False,
     ) -> ValidationAgentState:
         """
-        Run full validation.
+        Run validation.
+        
+        With incremental validation, only decisions whose fingerprint changed
+        since the last run for the project (plus the decisions depending on
+        them) are re-checked; the rest of the results come from the cache.
         
         Args:
             project_id: Project identifier
             decisions: Dictionary of decisions
             artifacts: Optional list of artifacts
             thread_id: Thread identifier
+            dependency_graph: Dependency rows from
+                DecisionDependencyRepository.get_dependency_graph, used to
+                find decisions affected by a change (last graph kept if not provided)
+            full: Discard cached results and re-check everything
         
         Returns:
             Validation state with results
@@ -558,7 +1078,17 @@ class ValidationAgent:
             }
         }
         
-        return await self.graph.ainvoke(state, config=config)
+        cache = self._get_project_cache(project_id)
+        async with cache.lock:
+            if full or not self.incremental:
+                cache.clear()
+            if dependency_graph is not None:
+                cache.set_dependency_graph(dependency_graph)
+            return await self.graph.ainvoke(state, config=config)
+    
+    def invalidate_project(self, project_id: str) -> None:
+        """Drop the cached validation results of a project."""
+        self._validation_caches.pop(project_id, None)
     
     async def detect_contradictions(
         self,
@@ -573,15 +1103,10 @@ class ValidationAgent:
         Returns:
             List of detected contradictions
         """
-        state = {
-            "decisions": decisions,
-            "contradictions": {},
-            "pending_contradictions": [],
-        }
-        
-        await self._detect_contradictions_node(state)
+        cache = ProjectValidationCache()
+        await self._update_contradictions(cache, decisions, list(decisions), [])
         
-        return list(state["contradictions"].values())
+        return list(cache.contradictions.values())
     
     async def get_state(self, thread_id: str) -> Optional[ValidationAgentState]:
         """Get the current state for a thread."""
@@ -602,6 +1127,8 @@ class ValidationAgent:
 def create_validation_agent(
     checkpoint_saver: Optional[CheckpointSaver] = None,
     redis_url: Optional[str] = None,
+    contradiction_mode: str = CONTRADICTION_DETECTION_MODE,
+    incremental: bool = VALIDATION_INCREMENTAL,
 ) -> ValidationAgent:
     """
     Create a Validation Agent instance.
@@ -609,6 +1136,8 @@ def create_validation_agent(
     Args:
         checkpoint_saver: Optional checkpoint saver
         redis_url: Redis URL for default checkpointing
+        contradiction_mode: "keyword" or "semantic" contradiction detection
+        incremental: Re-check only decisions changed since the last run
     
     Returns:
         Configured ValidationAgent instance
@@ -618,4 +1147,8 @@ def create_validation_agent(
     if checkpoint_saver is None and redis_url:
         checkpoint_saver = get_checkpoint_saver(redis_url=redis_url)
     
-    return ValidationAgent(checkpoint_saver=checkpoint_saver)
+    return ValidationAgent(
+        checkpoint_saver=checkpoint_saver,
+        contradiction_mode=contradiction_mode,
+        incremental=incremental,
+    )
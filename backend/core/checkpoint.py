@@ -6,11 +6,14 @@ for LangGraph agents, enabling state recovery and conversation resumption.
 """
 
 import json
+import os
+import time
 import asyncio
-from typing import Any, Dict, List, Optional, Callable
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
-import redis.asyncio as redis
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
@@ -24,45 +27,209 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
+from ..cache.codec import ValueCodec
+from ..cache.connection import REDIS_URL, get_redis_registry
 from ..core.exceptions import CheckpointError
 
 
 # ==================== Redis Serializer ====================
 
+def _load_legacy_checkpoint_value(value: bytes) -> Any:
+    """Load a payload written before values were type-tagged."""
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return load_python(value)
+
+
+def _dump_checkpoint_python(value: Any) -> bytes:
+    """Serialize values JSON/msgpack can't hold; containers keep the historical stringification."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str).encode("utf-8")
+    return dump_python(value)
+
+
 class RedisSerializer(SerializerProtocol):
-    """Custom serializer for Redis checkpoint storage."""
+    """
+    Custom serializer for Redis checkpoint storage.
+    
+    Values are encoded with the shared tagged codec (orjson, msgpack, zstd
+    above a size threshold), so loads dispatches on the tag byte instead of
+    trial-parsing. Untagged payloads from the previous format still load.
+    """
+    
+    def __init__(self, codec: Optional[ValueCodec] = None):
+        """
+        Initialize the serializer.
+        
+        Args:
+            codec: Optional value codec
+        """
+        self.codec = codec or ValueCodec(
+            python_dumps=_dump_checkpoint_python,
+            python_loads=_load_legacy_checkpoint_value,
+            legacy_loads=_load_legacy_checkpoint_value,
+        )
     
     def dumps(self, value: Serializable) -> bytes:
         """Serialize a value to bytes for Redis storage."""
-        if isinstance(value, bytes):
-            return value
-        if isinstance(value, str):
-            return value.encode("utf-8")
-        if isinstance(value, dict):
-            return json.dumps(value, default=str).encode("utf-8")
-        if isinstance(value, list):
-            return json.dumps(value, default=str).encode("utf-8")
-        # For complex objects, use dump_python from langgraph
-        return dump_python(value)
+        return self.codec.encode(value)
     
     def loads(self, value: bytes) -> Any:
         """Deserialize bytes from Redis storage."""
-        try:
-            # Try JSON first for simple types
-            return json.loads(value.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            # Fall back to langgraph's load_python
-            return load_python(value)
+        return self.codec.decode(value)
 
 
 # ==================== Redis Checkpoint Saver ====================
 
+# Keys per MGET when listing or re-indexing checkpoints
+CHECKPOINT_BATCH_SIZE = 500
+
+# Per-thread key suffixes that are not checkpoints
+_THREAD_KEY_SUFFIXES = {"meta", "index", "count"}
+
+# Checkpoints stored as channel deltas between full snapshots (0 disables deltas)
+CHECKPOINT_SNAPSHOT_INTERVAL = int(os.getenv("CHECKPOINT_SNAPSHOT_INTERVAL", "10"))
+
+# Threads whose latest snapshot fingerprint is kept in process for delta writes
+DELTA_STATE_MAX_THREADS = 1000
+
+# Marker key of a stored delta record
+DELTA_MARKER = "__checkpoint_delta__"
+
+# Stores one checkpoint, as a delta only if the thread's stored base (in the
+# meta hash) is still the expected snapshot, the snapshot key exists and the
+# chain is shorter than the snapshot interval; otherwise as the full snapshot.
+# KEYS: checkpoint, checkpoint metadata, thread meta, index, base snapshot, base deps
+# ARGV: checkpoint ID, full data, delta data ('' for none), base snapshot ID,
+#       metadata, timestamp, index score, TTL (0 for none), snapshot interval,
+#       '1' to record the checkpoint as the thread's base when stored in full
+# Returns {1 if stored as a delta, snapshot depth}
+_PUT_SCRIPT = """
+local ttl = tonumber(ARGV[8])
+local delta = false
+local depth = 0
+if ARGV[3] ~= '' then
+    local base = redis.call('HMGET', KEYS[3], 'snapshot_id', 'snapshot_depth')
+    local base_depth = tonumber(base[2]) or 0
+    if base[1] == ARGV[4] and base_depth < tonumber(ARGV[9]) - 1
+        and redis.call('EXISTS', KEYS[5]) == 1 then
+        delta = true
+        depth = base_depth + 1
+    end
+end
+local data = ARGV[2]
+if delta then
+    data = ARGV[3]
+    -- The snapshot must outlive every delta based on it
+    redis.call('SADD', KEYS[6], ARGV[1])
+    if ttl > 0 then
+        redis.call('EXPIRE', KEYS[5], ttl)
+        redis.call('EXPIRE', KEYS[6], ttl)
+    end
+    redis.call('HSET', KEYS[3], 'snapshot_depth', depth)
+elseif ARGV[10] == '1' then
+    redis.call('HSET', KEYS[3], 'snapshot_id', ARGV[1], 'snapshot_depth', 0)
+end
+if ttl > 0 then
+    redis.call('SET', KEYS[1], data, 'EX', ttl)
+    redis.call('SET', KEYS[2], ARGV[5], 'EX', ttl)
+else
+    redis.call('SET', KEYS[1], data)
+    redis.call('SET', KEYS[2], ARGV[5])
+end
+redis.call('HSET', KEYS[3], 'last_checkpoint_id', ARGV[1], 'last_updated', ARGV[6])
+redis.call('HINCRBY', KEYS[3], 'checkpoint_count', 1)
+-- The index lives at least as long as its newest member
+redis.call('ZADD', KEYS[4], ARGV[7], ARGV[1])
+if ttl > 0 then
+    redis.call('EXPIRE', KEYS[4], ttl, 'NX')
+    redis.call('EXPIRE', KEYS[4], ttl, 'GT')
+end
+if delta then
+    return {1, depth}
+end
+return {0, 0}
+"""
+
+# Clears a thread's delta base if it is the given snapshot, so no new delta
+# can be written against a snapshot that is being deleted or rebased
+_RELEASE_SNAPSHOT_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'snapshot_id') == ARGV[1] then
+    return redis.call('HDEL', KEYS[1], 'snapshot_id', 'snapshot_depth')
+end
+return 0
+"""
+
+
+def _is_delta(record: Any) -> bool:
+    """Check whether a stored record is a channel delta rather than a full checkpoint."""
+    return isinstance(record, dict) and DELTA_MARKER in record
+
+
+def _diff_channels(
+    base_values: Dict[str, Any],
+    values: Dict[str, Any],
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Compare two materialized channel maps, returning (changed, removed)."""
+    changed = {
+        channel: value for channel, value in values.items()
+        if channel not in base_values or base_values[channel] != value
+    }
+    removed = [channel for channel in base_values if channel not in values]
+    return changed, removed
+
+
+def _apply_delta(delta: Dict[str, Any], base: Checkpoint) -> Checkpoint:
+    """Rebuild a full checkpoint from a delta record and its base snapshot."""
+    removed = set(delta.get("removed", []))
+    channel_values = {
+        channel: value for channel, value in base.get("channel_values", {}).items()
+        if channel not in removed
+    }
+    channel_values.update(delta.get("changed", {}))
+    return {**delta["checkpoint"], "channel_values": channel_values}
+
+
+def _checkpoint_score(checkpoint: Checkpoint, checkpoint_id: str) -> float:
+    """Get the sort score of a checkpoint: its timestamp, else a numeric ID, else now."""
+    if _is_delta(checkpoint):
+        checkpoint = checkpoint["checkpoint"]
+    ts = checkpoint.get("ts") if isinstance(checkpoint, dict) else None
+    if ts:
+        try:
+            return datetime.fromisoformat(str(ts)).timestamp()
+        except ValueError:
+            pass
+    try:
+        return float(checkpoint_id)
+    except (TypeError, ValueError):
+        return time.time()
+
+
+def _decode(value: Any) -> Any:
+    """Decode a bytes reply from the non-decoding client."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
 class RedisCheckpointSaver(BaseCheckpointSaver):
     """
     Redis-backed checkpoint saver for LangGraph.
     
     Provides persistent storage for agent state, enabling
     conversation resumption and recovery after failures.
+    
+    Between full snapshots, checkpoints are stored as channel-level deltas
+    against the thread's latest snapshot: only channels whose version (or,
+    without versions, serialized digest) changed are written. Every
+    snapshot_interval-th checkpoint is a full snapshot, so reconstruction
+    reads at most two keys.
+    
+    The delta base (snapshot ID and depth) lives in the thread's meta hash
+    and is checked by the same script that writes the checkpoint, so
+    concurrent writers, deletes and compaction never leave a delta pointing
+    at a missing snapshot; when the base can't be confirmed the full
+    snapshot sent alongside the delta is stored instead.
     """
     
     def __init__(
@@ -72,6 +239,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         key_prefix: str = "checkpoint:",
         ttl_seconds: Optional[int] = None,
         thread_id_prefix: str = "",
+        snapshot_interval: Optional[int] = CHECKPOINT_SNAPSHOT_INTERVAL,
     ):
         """
         Initialize the Redis checkpoint saver.
@@ -82,26 +250,85 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
             key_prefix: Prefix for checkpoint keys in Redis
             ttl_seconds: Time-to-live for checkpoints (None = no expiration)
             thread_id_prefix: Prefix for thread IDs
+            snapshot_interval: Checkpoints per full snapshot (0/None stores every checkpoint in full)
         """
         super().__init__(serde=RedisSerializer())
         self.redis_client = redis_client
-        self.redis_url = redis_url or "redis://localhost:6379/0"
+        self.redis_url = redis_url or REDIS_URL
         self.key_prefix = key_prefix
         self.ttl_seconds = ttl_seconds
         self.thread_id_prefix = thread_id_prefix
         self._own_client = redis_client is None
+        self.snapshot_interval = snapshot_interval or 0
+        self._round_trips: Dict[str, int] = {}
+        self._operations: Dict[str, int] = {}
+        # thread_id -> {"snapshot_id", "fingerprints", "depth"} of the latest snapshot
+        # this process wrote; Redis confirms the base before a delta is stored
+        self._delta_state: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._storage = {
+            "full": {"count": 0, "bytes": 0},
+            "delta": {"count": 0, "bytes": 0},
+        }
+        self._reconstruct = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+    
+    def _record(self, operation: str, round_trips: int = 1, count: int = 1) -> None:
+        """Record Redis round trips spent on an operation."""
+        self._round_trips[operation] = self._round_trips.get(operation, 0) + round_trips
+        self._operations[operation] = self._operations.get(operation, 0) + count
+    
+    def _record_storage(self, kind: str, size: int) -> None:
+        """Record bytes written for a full snapshot or a delta."""
+        self._storage[kind]["count"] += 1
+        self._storage[kind]["bytes"] += size
+    
+    def _record_reconstruct(self, started: float) -> None:
+        """Record the latency of rebuilding one checkpoint from a delta."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._reconstruct["count"] += 1
+        self._reconstruct["total_ms"] += elapsed_ms
+        self._reconstruct["max_ms"] = max(self._reconstruct["max_ms"], elapsed_ms)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get Redis round-trip, storage and reconstruction metrics.
+        
+        Returns:
+            Dictionary with per-operation round trips, bytes written per
+            snapshot/delta and delta reconstruction latency
+        """
+        operations = {}
+        for operation, count in self._operations.items():
+            round_trips = self._round_trips.get(operation, 0)
+            operations[operation] = {
+                "count": count,
+                "round_trips": round_trips,
+                "round_trips_per_op": round_trips / count if count else 0.0,
+            }
+        storage = {kind: dict(stats) for kind, stats in self._storage.items()}
+        for stats in storage.values():
+            stats["avg_bytes"] = stats["bytes"] / stats["count"] if stats["count"] else 0.0
+        full_avg = storage["full"]["avg_bytes"]
+        storage["delta_ratio"] = storage["delta"]["avg_bytes"] / full_avg if full_avg else 0.0
+        
+        reconstruct_count = self._reconstruct["count"]
+        return {
+            "round_trips": sum(self._round_trips.values()),
+            "operations": operations,
+            "storage": storage,
+            "reconstruct": {
+                "count": reconstruct_count,
+                "avg_ms": self._reconstruct["total_ms"] / reconstruct_count if reconstruct_count else 0.0,
+                "max_ms": self._reconstruct["max_ms"],
+            },
+        }
     
     @asynccontextmanager
     async def client(self):
-        """Get a Redis client, creating one if needed."""
+        """Get a Redis client, from the shared connection registry if none was provided."""
         if self.redis_client:
             yield self.redis_client
         else:
-            client = redis.from_url(self.redis_url, decode_responses=False)
-            try:
-                yield client
-            finally:
-                await client.close()
+            yield get_redis_registry().get_client(self.redis_url, decode_responses=False)
     
     def _make_key(self, thread_id: str, checkpoint_id: str) -> str:
         """Generate a Redis key for a checkpoint."""
@@ -111,6 +338,100 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         """Generate a Redis key for thread metadata."""
         return f"{self.key_prefix}{self.thread_id_prefix}{thread_id}:meta"
     
+    def _make_index_key(self, thread_id: str) -> str:
+        """Generate a Redis key for a thread's checkpoint index (ZSET of id by timestamp)."""
+        return f"{self.key_prefix}{self.thread_id_prefix}{thread_id}:index"
+    
+    def _make_deps_key(self, thread_id: str, checkpoint_id: str) -> str:
+        """Generate a Redis key for the set of deltas based on a snapshot."""
+        return f"{self._make_key(thread_id, checkpoint_id)}:deps"
+    
+    def _channel_fingerprints(self, checkpoint: Checkpoint) -> Dict[str, Any]:
+        """Fingerprint each channel by its version, or by a digest of its value."""
+        versions = checkpoint.get("channel_versions") or {}
+        fingerprints = {}
+        for channel, value in checkpoint.get("channel_values", {}).items():
+            if channel in versions:
+                fingerprints[channel] = ("v", versions[channel])
+            else:
+                fingerprints[channel] = ("d", hashlib.blake2b(self.serde.dumps(value), digest_size=16).digest())
+        return fingerprints
+    
+    def _remember_snapshot(self, thread_id: str, base: Optional[Dict[str, Any]]) -> None:
+        """Track the latest snapshot of a thread once its write succeeded."""
+        if base is None:
+            self._delta_state.pop(thread_id, None)
+            return
+        self._delta_state[thread_id] = base
+        self._delta_state.move_to_end(thread_id)
+        while len(self._delta_state) > DELTA_STATE_MAX_THREADS:
+            self._delta_state.popitem(last=False)
+    
+    async def _write_checkpoints(
+        self,
+        client: Redis,
+        items: Sequence[Tuple[str, Checkpoint, CheckpointMetadata]],
+    ) -> List[str]:
+        """
+        Store checkpoints in one MULTI/EXEC round trip.
+        
+        Each checkpoint goes through _PUT_SCRIPT, which writes the delta only
+        if Redis still holds the base it was computed against and the full
+        snapshot otherwise, so no separate base read is needed.
+        
+        Args:
+            client: Redis client
+            items: (thread_id, checkpoint, metadata) tuples
+        
+        Returns:
+            Checkpoint IDs in input order
+        """
+        pipe = client.pipeline(transaction=True)
+        bases = {}
+        planned = []
+        for thread_id, checkpoint, metadata in items:
+            if thread_id not in bases:
+                bases[thread_id] = self._delta_state.get(thread_id)
+            checkpoint_id, plan = self._queue_put(
+                pipe, thread_id, checkpoint, metadata, bases[thread_id],
+            )
+            # Later checkpoints of the same thread in this batch build on this one
+            if plan["fingerprints"] is None:
+                bases[thread_id] = None
+            elif plan["delta_size"] is not None:
+                bases[thread_id] = {**bases[thread_id], "depth": bases[thread_id]["depth"] + 1}
+            else:
+                bases[thread_id] = {
+                    "snapshot_id": checkpoint_id,
+                    "fingerprints": plan["fingerprints"],
+                    "depth": 0,
+                }
+            planned.append((thread_id, checkpoint_id, plan))
+        
+        results = await pipe.execute()
+        
+        checkpoint_ids = []
+        for (thread_id, checkpoint_id, plan), (stored_delta, depth) in zip(planned, results):
+            checkpoint_ids.append(checkpoint_id)
+            if stored_delta:
+                self._record_storage("delta", plan["delta_size"])
+                self._remember_snapshot(thread_id, {**self._delta_state[thread_id], "depth": int(depth)})
+                continue
+            self._record_storage("full", plan["full_size"])
+            if plan["fingerprints"] is None:
+                self._remember_snapshot(thread_id, None)
+            else:
+                self._remember_snapshot(thread_id, {
+                    "snapshot_id": checkpoint_id,
+                    "fingerprints": plan["fingerprints"],
+                    "depth": 0,
+                })
+        return checkpoint_ids
+    
+    async def _release_snapshot(self, client: Redis, thread_id: str, snapshot_id: str) -> None:
+        """Stop new deltas from being based on a snapshot that is going away."""
+        await client.eval(_RELEASE_SNAPSHOT_SCRIPT, 1, self._make_thread_key(thread_id), snapshot_id)
+    
     async def aput(
         self,
         config: Dict[str, Any],
@@ -136,41 +457,12 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
                 message="thread_id is required in config",
             )
         
-        checkpoint_id = checkpoint.get("id", str(datetime.utcnow().timestamp()))
-        
         async with self.client() as client:
             try:
-                # Serialize checkpoint
-                checkpoint_data = self.serde.dumps(checkpoint)
-                
-                # Serialize metadata
-                metadata_data = self.serde.dumps({
-                    "metadata": metadata,
-                    "thread_id": thread_id,
-                    "checkpoint_id": checkpoint_id,
-                    "created_at": datetime.utcnow().isoformat(),
-                })
-                
-                # Create composite key
-                key = self._make_key(thread_id, checkpoint_id)
-                
-                # Store checkpoint and metadata
-                await client.set(key, checkpoint_data)
-                await client.set(f"{key}:meta", metadata_data)
-                
-                # Update thread metadata
-                thread_key = self._make_thread_key(thread_id)
-                thread_data = {
-                    "last_checkpoint_id": checkpoint_id,
-                    "last_updated": datetime.utcnow().isoformat(),
-                    "checkpoint_count": await client.incr(f"{thread_key}:count"),
-                }
-                await client.hset(thread_key, mapping=thread_data)
-                
-                # Set TTL if configured
-                if self.ttl_seconds:
-                    await client.expire(key, self.ttl_seconds)
-                    await client.expire(f"{key}:meta", self.ttl_seconds)
+                (checkpoint_id,) = await self._write_checkpoints(
+                    client, [(thread_id, checkpoint, metadata)],
+                )
+                self._record("put")
                 
                 return {
                     "configurable": {
@@ -180,6 +472,182 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
                     }
                 }
             
+            except RedisError as e:
+                raise CheckpointError(
+                    operation="save",
+                    thread_id=thread_id,
+                    checkpoint_id=checkpoint.get("id"),
+                    original_error=e,
+                )
+    
+    def _queue_put(
+        self,
+        pipe,
+        thread_id: str,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        base: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Queue the script call that stores one checkpoint on a pipeline.
+        
+        Args:
+            pipe: Redis pipeline
+            thread_id: Thread identifier
+            checkpoint: Checkpoint data to save
+            metadata: Checkpoint metadata
+            base: Expected delta base ({"snapshot_id", "depth", "fingerprints"});
+                only the full snapshot is sent without one
+        
+        Returns:
+            (checkpoint ID, {"fingerprints", "full_size", "delta_size"}), where
+            delta_size is None if no delta was sent and fingerprints is None
+            if the checkpoint can't serve as a delta base
+        """
+        checkpoint_id = checkpoint.get("id", str(datetime.utcnow().timestamp()))
+        now = datetime.utcnow().isoformat()
+        key = self._make_key(thread_id, checkpoint_id)
+        
+        fingerprints = None
+        delta_data = b""
+        base_id = ""
+        if self.snapshot_interval and isinstance(checkpoint.get("channel_values"), dict):
+            fingerprints = self._channel_fingerprints(checkpoint)
+            if base and base["depth"] < self.snapshot_interval - 1 and base["snapshot_id"] != checkpoint_id:
+                base_id = base["snapshot_id"]
+                base_fingerprints = base["fingerprints"]
+                values = checkpoint["channel_values"]
+                delta_data = self.serde.dumps({
+                    DELTA_MARKER: 1,
+                    "base": base_id,
+                    "checkpoint": {k: v for k, v in checkpoint.items() if k != "channel_values"},
+                    "changed": {
+                        channel: values[channel] for channel, fp in fingerprints.items()
+                        if base_fingerprints.get(channel) != fp
+                    },
+                    "removed": [channel for channel in base_fingerprints if channel not in fingerprints],
+                })
+        
+        checkpoint_data = self.serde.dumps(checkpoint)
+        metadata_data = self.serde.dumps({
+            "metadata": metadata,
+            "thread_id": thread_id,
+            "checkpoint_id": checkpoint_id,
+            "created_at": now,
+        })
+        base_key = self._make_key(thread_id, base_id or checkpoint_id)
+        pipe.eval(
+            _PUT_SCRIPT,
+            6,
+            key,
+            f"{key}:meta",
+            self._make_thread_key(thread_id),
+            self._make_index_key(thread_id),
+            base_key,
+            f"{base_key}:deps",
+            checkpoint_id,
+            checkpoint_data,
+            delta_data,
+            base_id,
+            metadata_data,
+            now,
+            _checkpoint_score(checkpoint, checkpoint_id),
+            self.ttl_seconds or 0,
+            self.snapshot_interval,
+            "1" if fingerprints is not None else "0",
+        )
+        
+        return checkpoint_id, {
+            "fingerprints": fingerprints,
+            "full_size": len(checkpoint_data),
+            "delta_size": len(delta_data) if delta_data else None,
+        }
+    
+    async def aput_many(
+        self,
+        items: Sequence[Tuple[Dict[str, Any], Checkpoint, CheckpointMetadata]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Save several checkpoints in a single MULTI/EXEC.
+        
+        Checkpoints of the same thread are stored in order, each as a delta
+        against the snapshot the previous one left.
+        
+        Args:
+            items: (config, checkpoint, metadata) tuples
+        
+        Returns:
+            Updated configurations, in input order
+        """
+        if not items:
+            return []
+        
+        for config, _, _ in items:
+            if not config.get("configurable", {}).get("thread_id"):
+                raise CheckpointError(
+                    operation="save",
+                    thread_id="unknown",
+                    message="thread_id is required in config",
+                )
+        
+        async with self.client() as client:
+            try:
+                checkpoint_ids = await self._write_checkpoints(client, [
+                    (config["configurable"]["thread_id"], checkpoint, metadata)
+                    for config, checkpoint, metadata in items
+                ])
+                self._record("put_many", count=len(items))
+                return [
+                    {
+                        "configurable": {
+                            **config["configurable"],
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    }
+                    for (config, _, _), checkpoint_id in zip(items, checkpoint_ids)
+                ]
+            
+            except RedisError as e:
+                raise CheckpointError(
+                    operation="save",
+                    thread_id=items[0][0]["configurable"]["thread_id"],
+                    original_error=e,
+                )
+    
+    async def aput_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        """
+        Store pending channel writes for a checkpoint in one round trip.
+        
+        Args:
+            config: Runnable configuration with thread_id and checkpoint_id
+            writes: (channel, value) pairs
+            task_id: Task that produced the writes
+        """
+        thread_id = config.get("configurable", {}).get("thread_id")
+        checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
+        if not thread_id or not checkpoint_id or not writes:
+            return
+        
+        writes_key = f"{self._make_key(thread_id, checkpoint_id)}:writes"
+        mapping = {
+            f"{task_id}:{idx}": self.serde.dumps({"channel": channel, "value": value})
+            for idx, (channel, value) in enumerate(writes)
+        }
+        
+        async with self.client() as client:
+            try:
+                pipe = client.pipeline(transaction=True)
+                pipe.hset(writes_key, mapping=mapping)
+                if self.ttl_seconds:
+                    pipe.expire(writes_key, self.ttl_seconds)
+                await pipe.execute()
+                self._record("put_writes")
+            
             except RedisError as e:
                 raise CheckpointError(
                     operation="save",
@@ -188,6 +656,49 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
                     original_error=e,
                 )
     
+    async def _resolve(
+        self,
+        client: Redis,
+        thread_id: str,
+        records: Dict[str, Any],
+    ) -> Tuple[Dict[str, Checkpoint], int]:
+        """
+        Materialize loaded records, fetching delta bases with one MGET.
+        
+        Args:
+            client: Redis client
+            thread_id: Thread identifier
+            records: Loaded records by checkpoint ID
+        
+        Returns:
+            (full checkpoints by ID, round trips used); deltas whose snapshot
+            is missing are left out
+        """
+        bases = {}
+        base_ids = sorted({
+            record["base"] for record in records.values()
+            if _is_delta(record) and record["base"] not in records
+        })
+        round_trips = 0
+        if base_ids:
+            values = await client.mget([self._make_key(thread_id, cid) for cid in base_ids])
+            round_trips = 1
+            bases = {cid: self.serde.loads(data) for cid, data in zip(base_ids, values) if data}
+        
+        resolved = {}
+        for checkpoint_id, record in records.items():
+            if not _is_delta(record):
+                resolved[checkpoint_id] = record
+                continue
+            base = records.get(record["base"]) or bases.get(record["base"])
+            if base is None or _is_delta(base):
+                continue
+            started = time.perf_counter()
+            resolved[checkpoint_id] = _apply_delta(record, base)
+            self._record_reconstruct(started)
+        
+        return resolved, round_trips
+    
     async def aget(
         self,
         config: Dict[str, Any],
@@ -209,22 +720,32 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         
         async with self.client() as client:
             try:
-                if checkpoint_id:
-                    key = self._make_key(thread_id, checkpoint_id)
-                    data = await client.get(key)
-                    if data:
-                        return self.serde.loads(data)
-                else:
+                round_trips = 1
+                if not checkpoint_id:
                     # Get latest checkpoint
                     thread_key = self._make_thread_key(thread_id)
-                    last_id = await client.hget(thread_key, "last_checkpoint_id")
-                    if last_id:
-                        key = self._make_key(thread_id, last_id)
-                        data = await client.get(key)
-                        if data:
-                            return self.serde.loads(data)
+                    checkpoint_id = _decode(await client.hget(thread_key, "last_checkpoint_id"))
+                    round_trips += 1
                 
-                return None
+                data = None
+                if checkpoint_id:
+                    data = await client.get(self._make_key(thread_id, checkpoint_id))
+                if not data:
+                    self._record("get", round_trips=round_trips)
+                    return None
+                
+                resolved, extra = await self._resolve(
+                    client, thread_id, {checkpoint_id: self.serde.loads(data)},
+                )
+                self._record("get", round_trips=round_trips + extra)
+                if checkpoint_id not in resolved:
+                    raise CheckpointError(
+                        operation="load",
+                        thread_id=thread_id,
+                        checkpoint_id=checkpoint_id,
+                        details={"reason": "delta base snapshot is missing"},
+                    )
+                return resolved[checkpoint_id]
             
             except RedisError as e:
                 raise CheckpointError(
@@ -263,7 +784,7 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         after: Optional[str] = None,
     ) -> List[Checkpoint]:
         """
-        List checkpoints for a thread.
+        List checkpoints for a thread, newest first.
         
         Args:
             config: Runnable configuration with thread_id
@@ -274,30 +795,96 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         Returns:
             List of checkpoints
         """
+        checkpoints, _ = await self.alist_page(config, limit=limit, before=before, after=after)
+        return checkpoints
+    
+    async def alist_page(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        *,
+        limit: int = 10,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Checkpoint], Optional[str]]:
+        """
+        List one page of checkpoints for a thread, newest first.
+        
+        Pass the returned cursor as ``before`` to fetch the next page.
+        
+        Args:
+            config: Runnable configuration with thread_id
+            limit: Maximum number of checkpoints to return
+            before: Return checkpoints older than this ID
+            after: Return checkpoints newer than this ID
+        
+        Returns:
+            (checkpoints, next cursor or None when there are no more)
+        """
         thread_id = config.get("configurable", {}).get("thread_id") if config else None
         
-        if not thread_id:
-            return []
+        if not thread_id or limit <= 0:
+            return [], None
+        
+        index_key = self._make_index_key(thread_id)
         
         async with self.client() as client:
             try:
-                pattern = f"{self.key_prefix}{self.thread_id_prefix}{thread_id}:*"
-                keys = []
-                async for key in client.scan_iter(match=pattern, count=100):
-                    if not key.endswith(":meta"):
-                        keys.append(key)
+                pipe = client.pipeline(transaction=False)
+                pipe.exists(index_key)
+                if before:
+                    pipe.zscore(index_key, before)
+                if after:
+                    pipe.zscore(index_key, after)
+                results = await pipe.execute()
+                exists = results[0]
+                before_score = results[1] if before else None
+                after_score = results[-1] if after else None
+                round_trips = 1
                 
-                checkpoints = []
-                for key in keys[:limit]:
-                    data = await client.get(key)
-                    if data:
-                        checkpoint = self.serde.loads(data)
-                        checkpoints.append(checkpoint)
+                if not exists:
+                    # New, empty or expired thread (legacy threads are indexed by amigrate_indexes)
+                    self._record("list", round_trips=round_trips)
+                    return [], None
                 
-                # Sort by checkpoint ID (timestamp-based)
-                checkpoints.sort(key=lambda x: x.get("id", ""), reverse=True)
+                if (before and before_score is None) or (after and after_score is None):
+                    # Unknown cursor: nothing can be ordered relative to it
+                    self._record("list", round_trips=round_trips)
+                    return [], None
                 
-                return checkpoints[:limit]
+                max_score = f"({before_score}" if before else "+inf"
+                min_score = f"({after_score}" if after else "-inf"
+                
+                # Over-fetch one to know whether another page exists
+                ids = await client.zrevrangebyscore(
+                    index_key, max_score, min_score, start=0, num=limit + 1,
+                )
+                ids = [_decode(cid) for cid in ids]
+                round_trips += 1
+                has_more = len(ids) > limit
+                ids = ids[:limit]
+                
+                records = {}
+                stale = []
+                if ids:
+                    values = await client.mget([self._make_key(thread_id, cid) for cid in ids])
+                    round_trips += 1
+                    for cid, data in zip(ids, values):
+                        if data:
+                            records[cid] = self.serde.loads(data)
+                        else:
+                            stale.append(cid)
+                
+                resolved, extra = await self._resolve(client, thread_id, records)
+                round_trips += extra
+                checkpoints = [resolved[cid] for cid in ids if cid in resolved]
+                
+                if stale:
+                    # Checkpoints expired or deleted without the index; prune them
+                    await client.zrem(index_key, *stale)
+                    round_trips += 1
+                
+                self._record("list", round_trips=round_trips)
+                return checkpoints, (ids[-1] if has_more else None)
             
             except RedisError as e:
                 raise CheckpointError(
@@ -306,6 +893,120 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
                     original_error=e,
                 )
     
+    async def rebuild_index(self, thread_id: str, client: Optional[Redis] = None) -> int:
+        """
+        Rebuild a thread's checkpoint index from its keys.
+        
+        This SCANs the keyspace for the thread's key pattern; use
+        amigrate_indexes to index every legacy thread in one pass.
+        
+        Args:
+            thread_id: Thread identifier
+            client: Redis client to use (a new one if not provided)
+        
+        Returns:
+            Number of checkpoints indexed
+        """
+        if client is None:
+            async with self.client() as client:
+                return await self.rebuild_index(thread_id, client=client)
+        
+        base = f"{self.key_prefix}{self.thread_id_prefix}{thread_id}:"
+        index_key = self._make_index_key(thread_id)
+        
+        keys = []
+        async for key in client.scan_iter(match=f"{base}*", count=1000):
+            suffix = _decode(key)[len(base):]
+            if ":" not in suffix and suffix not in _THREAD_KEY_SUFFIXES:
+                keys.append(key)
+        
+        indexed = 0
+        for i in range(0, len(keys), CHECKPOINT_BATCH_SIZE):
+            batch = keys[i:i + CHECKPOINT_BATCH_SIZE]
+            scores = {}
+            for key, data in zip(batch, await client.mget(batch)):
+                if data:
+                    checkpoint_id = _decode(key)[len(base):]
+                    scores[checkpoint_id] = _checkpoint_score(self.serde.loads(data), checkpoint_id)
+            if scores:
+                await client.zadd(index_key, scores)
+                indexed += len(scores)
+        
+        if indexed and self.ttl_seconds:
+            await client.expire(index_key, self.ttl_seconds)
+        
+        self._record("rebuild_index", round_trips=len(keys) // CHECKPOINT_BATCH_SIZE + 1)
+        return indexed
+    
+    async def amigrate_indexes(self, force: bool = False) -> Dict[str, int]:
+        """
+        Index every thread written before checkpoint indexes existed.
+        
+        Run once after upgrading (listing never falls back to scanning). A
+        marker key records that the migration ran, so later calls return
+        immediately unless force is set.
+        
+        Args:
+            force: Run again even if the marker is set
+        
+        Returns:
+            Dictionary with threads and checkpoints indexed
+        """
+        base = f"{self.key_prefix}{self.thread_id_prefix}"
+        marker_key = f"{base}__index_migrated__"
+        
+        async with self.client() as client:
+            try:
+                if not force and await client.exists(marker_key):
+                    return {"threads": 0, "checkpoints": 0}
+                
+                # Thread IDs come from the thread meta hashes; checkpoint
+                # keys are "<thread>:<checkpoint id>"
+                keys = [_decode(key) async for key in client.scan_iter(match=f"{base}*", count=1000)]
+                meta_keys = [key for key in keys if key.endswith(":meta")]
+                thread_ids = set()
+                for i in range(0, len(meta_keys), CHECKPOINT_BATCH_SIZE):
+                    batch = meta_keys[i:i + CHECKPOINT_BATCH_SIZE]
+                    pipe = client.pipeline(transaction=False)
+                    for key in batch:
+                        pipe.type(key)
+                    for key, key_type in zip(batch, await pipe.execute()):
+                        if _decode(key_type) == "hash":
+                            thread_ids.add(key[len(base):-len(":meta")])
+                
+                by_thread: Dict[str, List[str]] = {}
+                for key in keys:
+                    head, _, checkpoint_id = key[len(base):].rpartition(":")
+                    if head in thread_ids and checkpoint_id not in _THREAD_KEY_SUFFIXES:
+                        by_thread.setdefault(head, []).append(checkpoint_id)
+                
+                indexed = 0
+                for thread_id, checkpoint_ids in by_thread.items():
+                    index_key = self._make_index_key(thread_id)
+                    for i in range(0, len(checkpoint_ids), CHECKPOINT_BATCH_SIZE):
+                        batch = checkpoint_ids[i:i + CHECKPOINT_BATCH_SIZE]
+                        values = await client.mget([self._make_key(thread_id, cid) for cid in batch])
+                        scores = {
+                            cid: _checkpoint_score(self.serde.loads(data), cid)
+                            for cid, data in zip(batch, values) if data
+                        }
+                        if scores:
+                            await client.zadd(index_key, scores)
+                            indexed += len(scores)
+                    if self.ttl_seconds:
+                        await client.expire(index_key, self.ttl_seconds)
+                
+                await client.set(marker_key, datetime.utcnow().isoformat())
+                self._record("migrate_indexes", round_trips=len(keys) // CHECKPOINT_BATCH_SIZE + 1)
+                return {"threads": len(by_thread), "checkpoints": indexed}
+            
+            except RedisError as e:
+                raise CheckpointError(
+                    operation="migrate",
+                    thread_id="*",
+                    original_error=e,
+                )
+    
     async def adelete(
         self,
         config: Dict[str, Any],
@@ -328,8 +1029,33 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         async with self.client() as client:
             try:
                 key = self._make_key(thread_id, checkpoint_id)
-                deleted = await client.delete(key)
-                await client.delete(f"{key}:meta")
+                deps_key = self._make_deps_key(thread_id, checkpoint_id)
+                pipe = client.pipeline(transaction=False)
+                # Released first, so the dependents read next are complete
+                pipe.eval(_RELEASE_SNAPSHOT_SCRIPT, 1, self._make_thread_key(thread_id), checkpoint_id)
+                pipe.get(key)
+                pipe.smembers(deps_key)
+                _, data, dependents = await pipe.execute()
+                round_trips = 1
+                if not data:
+                    self._record("delete", round_trips=round_trips)
+                    return False
+                
+                record = self.serde.loads(data)
+                dependents = [_decode(cid) for cid in dependents]
+                if dependents:
+                    # Deltas based on this snapshot need a new base first
+                    _, extra = await self._rebase(client, thread_id, checkpoint_id, record, dependents)
+                    round_trips += extra
+                
+                pipe = client.pipeline(transaction=True)
+                pipe.delete(key)
+                pipe.delete(f"{key}:meta", f"{key}:writes", deps_key)
+                pipe.zrem(self._make_index_key(thread_id), checkpoint_id)
+                if _is_delta(record):
+                    pipe.srem(self._make_deps_key(thread_id, record["base"]), checkpoint_id)
+                deleted = (await pipe.execute())[0]
+                self._record("delete", round_trips=round_trips + 1)
                 return deleted > 0
             
             except RedisError as e:
@@ -340,6 +1066,195 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
                     original_error=e,
                 )
     
+    async def _rebase(
+        self,
+        client: Redis,
+        thread_id: str,
+        snapshot_id: str,
+        snapshot: Checkpoint,
+        dependents: List[str],
+    ) -> Tuple[int, int]:
+        """
+        Fold a snapshot's deltas onto a new snapshot so the old one can go.
+        
+        The oldest dependent is rewritten as a full snapshot and the others
+        as deltas against it. Callers release the old snapshot as the thread's
+        delta base (_release_snapshot) before reading its dependents.
+        
+        Args:
+            client: Redis client
+            thread_id: Thread identifier
+            snapshot_id: Snapshot being removed
+            snapshot: Loaded snapshot record
+            dependents: IDs of deltas based on the snapshot
+        
+        Returns:
+            (checkpoints rewritten, round trips used)
+        """
+        values = await client.mget([self._make_key(thread_id, cid) for cid in dependents])
+        records = {
+            cid: self.serde.loads(data)
+            for cid, data in zip(dependents, values) if data
+        }
+        records[snapshot_id] = snapshot
+        resolved, _ = await self._resolve(client, thread_id, records)
+        resolved.pop(snapshot_id, None)
+        if not resolved:
+            return 0, 1
+        
+        ordered = sorted(resolved, key=lambda cid: _checkpoint_score(resolved[cid], cid))
+        new_snapshot_id = ordered[0]
+        new_snapshot = resolved[new_snapshot_id]
+        
+        pipe = client.pipeline(transaction=True)
+        data = self.serde.dumps(new_snapshot)
+        pipe.set(self._make_key(thread_id, new_snapshot_id), data, keepttl=True)
+        self._record_storage("full", len(data))
+        
+        new_deps_key = self._make_deps_key(thread_id, new_snapshot_id)
+        for cid in ordered[1:]:
+            checkpoint = resolved[cid]
+            changed, removed = _diff_channels(
+                new_snapshot.get("channel_values", {}),
+                checkpoint.get("channel_values", {}),
+            )
+            data = self.serde.dumps({
+                DELTA_MARKER: 1,
+                "base": new_snapshot_id,
+                "checkpoint": {k: v for k, v in checkpoint.items() if k != "channel_values"},
+                "changed": changed,
+                "removed": removed,
+            })
+            pipe.set(self._make_key(thread_id, cid), data, keepttl=True)
+            pipe.sadd(new_deps_key, cid)
+            self._record_storage("delta", len(data))
+        if self.ttl_seconds:
+            # The new snapshot is the oldest of the group; it must outlive the rest
+            pipe.expire(self._make_key(thread_id, new_snapshot_id), self.ttl_seconds)
+            if len(ordered) > 1:
+                pipe.expire(new_deps_key, self.ttl_seconds)
+        await pipe.execute()
+        return len(ordered), 2
+    
+    async def acompact(self, thread_id: str, keep_last: int = 50) -> Dict[str, int]:
+        """
+        Drop a thread's older checkpoints, folding surviving deltas onto new snapshots.
+        
+        Args:
+            thread_id: Thread identifier
+            keep_last: Number of most recent checkpoints to keep
+        
+        Returns:
+            Dictionary with deleted and rewritten counts
+        """
+        index_key = self._make_index_key(thread_id)
+        
+        async with self.client() as client:
+            try:
+                ids = [_decode(cid) for cid in await client.zrevrange(index_key, 0, -1)]
+                round_trips = 1
+                dropped = ids[max(keep_last, 0):]
+                if not dropped:
+                    self._record("compact", round_trips=round_trips)
+                    return {"deleted": 0, "rewritten": 0}
+                
+                dropped_set = set(dropped)
+                snapshot_id = _decode(await client.hget(self._make_thread_key(thread_id), "snapshot_id"))
+                round_trips += 1
+                if snapshot_id in dropped_set:
+                    await self._release_snapshot(client, thread_id, snapshot_id)
+                    round_trips += 1
+                
+                # Surviving deltas (including any written since the index was
+                # read) whose snapshot is about to be dropped
+                orphans: Dict[str, List[str]] = {}
+                for i in range(0, len(dropped), CHECKPOINT_BATCH_SIZE):
+                    batch = dropped[i:i + CHECKPOINT_BATCH_SIZE]
+                    pipe = client.pipeline(transaction=False)
+                    for cid in batch:
+                        pipe.smembers(self._make_deps_key(thread_id, cid))
+                    round_trips += 1
+                    for cid, members in zip(batch, await pipe.execute()):
+                        dependents = [d for d in map(_decode, members) if d not in dropped_set]
+                        if dependents:
+                            orphans[cid] = dependents
+                
+                rewritten = 0
+                for snapshot_id, dependents in orphans.items():
+                    data = await client.get(self._make_key(thread_id, snapshot_id))
+                    round_trips += 1
+                    if data:
+                        count, extra = await self._rebase(
+                            client, thread_id, snapshot_id, self.serde.loads(data), dependents,
+                        )
+                        rewritten += count
+                        round_trips += extra
+                
+                deleted = 0
+                for i in range(0, len(dropped), CHECKPOINT_BATCH_SIZE):
+                    batch = dropped[i:i + CHECKPOINT_BATCH_SIZE]
+                    pipe = client.pipeline(transaction=False)
+                    for cid in batch:
+                        key = self._make_key(thread_id, cid)
+                        pipe.unlink(key)
+                        pipe.unlink(f"{key}:meta", f"{key}:writes", f"{key}:deps")
+                    pipe.zrem(index_key, *batch)
+                    results = await pipe.execute()
+                    deleted += sum(1 for n in results[:-1:2] if n)
+                    round_trips += 1
+                
+                self._record("compact", round_trips=round_trips)
+                return {"deleted": deleted, "rewritten": rewritten}
+            
+            except RedisError as e:
+                raise CheckpointError(
+                    operation="compact",
+                    thread_id=thread_id,
+                    original_error=e,
+                )
+    
+    async def adelete_thread(self, thread_id: str) -> int:
+        """
+        Delete all checkpoints of a thread using its index.
+        
+        Args:
+            thread_id: Thread identifier
+        
+        Returns:
+            Number of checkpoints deleted
+        """
+        index_key = self._make_index_key(thread_id)
+        
+        async with self.client() as client:
+            try:
+                if not await client.exists(index_key):
+                    await self.rebuild_index(thread_id, client=client)
+                
+                ids = [_decode(cid) for cid in await client.zrange(index_key, 0, -1)]
+                round_trips = 2
+                deleted = 0
+                for i in range(0, len(ids), CHECKPOINT_BATCH_SIZE):
+                    pipe = client.pipeline(transaction=False)
+                    for cid in ids[i:i + CHECKPOINT_BATCH_SIZE]:
+                        key = self._make_key(thread_id, cid)
+                        pipe.unlink(key)
+                        pipe.unlink(f"{key}:meta", f"{key}:writes", f"{key}:deps")
+                    results = await pipe.execute()
+                    deleted += sum(1 for n in results[::2] if n)
+                    round_trips += 1
+                
+                await client.unlink(index_key, self._make_thread_key(thread_id))
+                self._delta_state.pop(thread_id, None)
+                self._record("delete_thread", round_trips=round_trips + 1)
+                return deleted
+            
+            except RedisError as e:
+                raise CheckpointError(
+                    operation="delete",
+                    thread_id=thread_id,
+                    original_error=e,
+                )
+    
     async def aclose(self):
         """Close the Redis client if we own it."""
         if self._own_client and self.redis_client:
@@ -360,6 +1275,7 @@ class CheckpointManager:
         redis_url: Optional[str] = None,
         key_prefix: str = "specgen:checkpoint:",
         ttl_hours: int = 24,
+        snapshot_interval: Optional[int] = CHECKPOINT_SNAPSHOT_INTERVAL,
     ):
         """
         Initialize the checkpoint manager.
@@ -368,10 +1284,12 @@ class CheckpointManager:
             redis_url: Redis connection URL
             key_prefix: Prefix for checkpoint keys
             ttl_hours: Default TTL for checkpoints in hours
+            snapshot_interval: Checkpoints per full snapshot (0/None disables deltas)
         """
-        self.redis_url = redis_url or "redis://localhost:6379/0"
+        self.redis_url = redis_url or REDIS_URL
         self.key_prefix = key_prefix
         self.ttl_seconds = ttl_hours * 3600
+        self.snapshot_interval = snapshot_interval
         self._saver: Optional[RedisCheckpointSaver] = None
     
     @property
@@ -382,6 +1300,7 @@ class CheckpointManager:
                 redis_url=self.redis_url,
                 key_prefix=self.key_prefix,
                 ttl_seconds=self.ttl_seconds,
+                snapshot_interval=self.snapshot_interval,
             )
         return self._saver
     
@@ -490,17 +1409,36 @@ class CheckpointManager:
         Returns:
             Number of checkpoints deleted
         """
-        checkpoints = await self.list_checkpoints(thread_id, limit=1000)
-        deleted = 0
+        return await self.saver.adelete_thread(thread_id)
+    
+    async def compact_thread(
+        self,
+        thread_id: str,
+        keep_last: int = 50,
+    ) -> Dict[str, int]:
+        """
+        Drop all but a thread's most recent checkpoints.
         
-        for checkpoint in checkpoints:
-            cid = checkpoint.get("id")
-            if cid:
-                success = await self.delete_checkpoint(thread_id, cid)
-                if success:
-                    deleted += 1
+        Args:
+            thread_id: Unique thread identifier
+            keep_last: Number of most recent checkpoints to keep
         
-        return deleted
+        Returns:
+            Dictionary with deleted and rewritten counts
+        """
+        return await self.saver.acompact(thread_id, keep_last=keep_last)
+    
+    async def migrate_indexes(self, force: bool = False) -> Dict[str, int]:
+        """
+        Index checkpoints written before per-thread indexes existed.
+        
+        Args:
+            force: Run again even if the migration already ran
+        
+        Returns:
+            Dictionary with threads and checkpoints indexed
+        """
+        return await self.saver.amigrate_indexes(force=force)
     
     async def get_thread_info(
         self,
@@ -547,6 +1485,7 @@ def get_checkpoint_saver(
     redis_url: Optional[str] = None,
     key_prefix: str = "specgen:checkpoint:",
     ttl_seconds: Optional[int] = None,
+    snapshot_interval: Optional[int] = CHECKPOINT_SNAPSHOT_INTERVAL,
 ) -> RedisCheckpointSaver:
     """
     Factory function to create a Redis checkpoint saver.
@@ -555,6 +1494,7 @@ def get_checkpoint_saver(
         redis_url: Redis connection URL
         key_prefix: Prefix for checkpoint keys
         ttl_seconds: Optional TTL for checkpoints
+        snapshot_interval: Checkpoints per full snapshot (0/None disables deltas)
     
     Returns:
         Configured RedisCheckpointSaver instance
@@ -563,6 +1503,7 @@ def get_checkpoint_saver(
         redis_url=redis_url,
         key_prefix=key_prefix,
         ttl_seconds=ttl_seconds,
+        snapshot_interval=snapshot_interval,
     )
 
 
@@ -6,12 +6,14 @@ support for multiple providers, model selection, and retry logic.
 """
 
 import os
+import random
 import time
-from typing import Any, Dict, List, Optional, Callable, Union
-from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, List, Optional, Callable, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from datetime import datetime
 from functools import wraps, lru_cache
+from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
@@ -30,6 +32,15 @@ from .exceptions import (
     LLMTimeoutError,
     LLMRateLimitError,
 )
+from .llm_cache import LLMResponseCache, get_llm_response_cache, llm_cache_key
+from .prompts import build_messages, cached_token_ratio
+from .llm_limiter import (
+    LLM_OUTPUT_TOKEN_ESTIMATE,
+    AdaptiveConcurrency,
+    LLMPriority,
+    LLMRateLimiter,
+    estimate_tokens,
+)
 
 
 # ==================== Provider Types ====================
@@ -154,6 +165,8 @@ class LLMClient:
         openai_api_key: Optional[str] = None,
         default_model: Optional[ModelConfig] = None,
         callback_handler: Optional[LLMCallbackHandler] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         """
         Initialize the LLM client.
@@ -163,17 +176,32 @@ class LLMClient:
             openai_api_key: OpenAI API key
             default_model: Default model configuration
             callback_handler: Optional callback handler
+            response_cache: Optional response cache (disabled if None)
+            rate_limiter: Optional rate limiter (unlimited if None)
         """
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.default_model = default_model or DEFAULT_ANTHROPIC_MODEL
         self.callback_handler = callback_handler
-        self._clients: Dict[LLMProvider, BaseChatModel] = {}
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self._prompt_cache_stats = {
+            "calls": 0,
+            "input_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_creation_tokens": 0,
+        }
+        self._clients: Dict[tuple, BaseChatModel] = {}
+    
+    def _client_key(self, model: ModelConfig) -> tuple:
+        """Key chat model instances by every setting they are built with."""
+        return (model.provider, model.model_name, model.max_tokens, model.temperature, model.streaming)
     
     def _get_anthropic_client(self, model: ModelConfig) -> ChatAnthropic:
         """Get or create Anthropic client."""
-        if LLMProvider.ANTHROPIC not in self._clients:
-            self._clients[LLMProvider.ANTHROPIC] = ChatAnthropic(
+        key = self._client_key(model)
+        if key not in self._clients:
+            self._clients[key] = ChatAnthropic(
                 model=model.model_name,
                 max_tokens=model.max_tokens,
                 temperature=model.temperature,
@@ -181,12 +209,13 @@ class LLMClient:
                 callbacks=[self.callback_handler] if self.callback_handler else [],
                 streaming=model.streaming,
             )
-        return self._clients[LLMProvider.ANTHROPIC]
+        return self._clients[key]
     
     def _get_openai_client(self, model: ModelConfig) -> ChatOpenAI:
         """Get or create OpenAI client."""
-        if LLMProvider.OPENAI not in self._clients:
-            self._clients[LLMProvider.OPENAI] = ChatOpenAI(
+        key = self._client_key(model)
+        if key not in self._clients:
+            self._clients[key] = ChatOpenAI(
                 model=model.model_name,
                 max_tokens=model.max_tokens,
                 temperature=model.temperature,
@@ -194,22 +223,37 @@ class LLMClient:
                 callbacks=[self.callback_handler] if self.callback_handler else [],
                 streaming=model.streaming,
             )
-        return self._clients[LLMProvider.OPENAI]
+        return self._clients[key]
+    
+    def _resolve_model(self, model: Optional[Union[ModelConfig, str]]) -> ModelConfig:
+        """Resolve a model configuration, a bare model name or None (default)."""
+        if model is None:
+            return self.default_model
+        if isinstance(model, ModelConfig):
+            return model
+        
+        if model.startswith(("gpt", "o1", "o3")):
+            base = DEFAULT_OPENAI_MODEL
+        elif model.startswith("claude"):
+            base = DEFAULT_ANTHROPIC_MODEL
+        else:
+            base = self.default_model
+        return replace(base, model_name=model)
     
     def get_client(
         self,
-        model: Optional[ModelConfig] = None,
+        model: Optional[Union[ModelConfig, str]] = None,
     ) -> BaseChatModel:
         """
         Get an LLM client for the specified model.
         
         Args:
-            model: Model configuration (uses default if not specified)
+            model: Model configuration or name (uses default if not specified)
         
         Returns:
             LangChain chat model instance
         """
-        model = model or self.default_model
+        model = self._resolve_model(model)
         
         if model.provider == LLMProvider.ANTHROPIC:
             return self._get_anthropic_client(model)
@@ -218,81 +262,264 @@ class LLMClient:
         else:
             raise ValueError(f"Unknown provider: {model.provider}")
     
+    def _cache_key(
+        self,
+        messages: List[BaseMessage],
+        model: ModelConfig,
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Hash model, messages and parameters into a response cache key."""
+        return llm_cache_key(
+            f"{model.provider.value}:{model.model_name}",
+            [{"role": msg.type, "content": msg.content} for msg in messages],
+            {
+                "max_tokens": model.max_tokens,
+                "temperature": model.temperature,
+                "top_p": model.top_p,
+                **kwargs,
+            },
+        )
+    
+    async def _cache_lookup(
+        self,
+        messages: List[BaseMessage],
+        model: ModelConfig,
+        kwargs: Dict[str, Any],
+        use_cache: bool,
+    ) -> tuple:
+        """
+        Look up a cached response.
+        
+        Returns:
+            (cache key or None when the cache is not used, cached entry or None)
+        """
+        if self.response_cache is None:
+            return None, None
+        if not use_cache and not self.response_cache.replay:
+            self.response_cache.record_bypass()
+            return None, None
+        
+        key = self._cache_key(messages, model, kwargs)
+        entry = await self.response_cache.get(key)
+        if entry is None and self.response_cache.replay:
+            raise LLMGenerationError(
+                message="No cached response for this request in replay mode",
+                provider=model.provider.value,
+                model=model.model_name,
+            )
+        return key, entry
+    
+    def _estimate_tokens(self, messages: List[BaseMessage], model: ModelConfig) -> int:
+        """Estimate input plus reserved output tokens for rate budgeting."""
+        input_tokens = sum(estimate_tokens(str(msg.content)) for msg in messages)
+        return input_tokens + min(model.max_tokens, LLM_OUTPUT_TOKEN_ESTIMATE)
+    
+    @asynccontextmanager
+    async def _rate_limited(
+        self,
+        model: ModelConfig,
+        tokens: int,
+        priority: int,
+    ):
+        """Hold a rate-limiter slot for one call; yields None when unlimited."""
+        if self.rate_limiter is None:
+            yield None
+            return
+        
+        async with self.rate_limiter.slot(
+            model.provider.value, model.model_name, tokens, priority,
+        ) as limiter:
+            try:
+                yield limiter
+            except LLMRateLimitError:
+                limiter.on_rate_limited()
+                raise
+    
+    async def _record_success(
+        self,
+        limiter: Optional[AdaptiveConcurrency],
+        model: ModelConfig,
+        estimated: int,
+        actual: Optional[int],
+        latency: Optional[float],
+        kind: str,
+    ) -> None:
+        """Feed a completed call back into the concurrency limit and token bucket."""
+        if limiter is None:
+            return
+        limiter.on_success(latency, kind=kind)
+        await self.rate_limiter.settle(model.provider.value, model.model_name, estimated, actual)
+    
+    def _record_prompt_cache(self, usage: Optional[Dict[str, Any]]) -> float:
+        """Accumulate provider prompt-cache usage and return the call's cached-token ratio."""
+        if not usage or not usage.get("input_tokens"):
+            return 0.0
+        details = usage.get("input_token_details") or {}
+        stats = self._prompt_cache_stats
+        stats["calls"] += 1
+        stats["input_tokens"] += usage["input_tokens"]
+        stats["cache_read_tokens"] += details.get("cache_read", 0)
+        stats["cache_creation_tokens"] += details.get("cache_creation", 0)
+        return cached_token_ratio(usage)
+    
+    def _process_messages(self, messages: List[Union[BaseMessage, str]]) -> List[BaseMessage]:
+        """Convert strings to messages."""
+        processed_messages = []
+        for msg in messages:
+            if isinstance(msg, str):
+                processed_messages.append(HumanMessage(content=msg))
+            else:
+                processed_messages.append(msg)
+        return processed_messages
+    
     async def ainvoke(
         self,
         messages: List[Union[BaseMessage, str]],
-        model: Optional[ModelConfig] = None,
+        model: Optional[Union[ModelConfig, str]] = None,
+        use_cache: bool = True,
+        priority: int = LLMPriority.DEFAULT,
         **kwargs,
-    ) -> ChatResult:
+    ) -> AIMessage:
         """
         Invoke the LLM with messages (non-streaming).
         
         Args:
             messages: List of messages
-            model: Model configuration
+            model: Model configuration or name
+            use_cache: Use the response cache if one is configured
+            priority: Rate-limiter queueing priority
             **kwargs: Additional arguments
         
         Returns:
-            ChatResult from the LLM
+            AI message from the LLM (or the response cache)
         """
+        model = self._resolve_model(model)
+        processed_messages = self._process_messages(messages)
+        
+        key, entry = await self._cache_lookup(processed_messages, model, kwargs, use_cache)
+        if entry is not None:
+            return _message_from_cache(entry)
+        
         client = self.get_client(model)
+        estimated = self._estimate_tokens(processed_messages, model)
         
-        # Convert strings to messages
-        processed_messages = []
-        for msg in messages:
-            if isinstance(msg, str):
-                processed_messages.append(HumanMessage(content=msg))
-            else:
-                processed_messages.append(msg)
+        async with self._rate_limited(model, estimated, priority) as limiter:
+            started = time.monotonic()
+            try:
+                result = await client.ainvoke(processed_messages, **kwargs)
+            except Exception as e:
+                self._handle_error(e, model)
+            
+            # Latency per thousand output tokens, so long answers don't read as congestion
+            usage = getattr(result, "usage_metadata", None) or {}
+            output_tokens = usage.get("output_tokens")
+            latency = (
+                (time.monotonic() - started) / max(1.0, output_tokens / 1000)
+                if output_tokens else None
+            )
+            await self._record_success(
+                limiter, model, estimated, usage.get("total_tokens"), latency, "invoke",
+            )
+        
+        ratio = self._record_prompt_cache(usage)
+        if getattr(result, "response_metadata", None) is not None:
+            result.response_metadata["cached_token_ratio"] = ratio
         
-        try:
-            return await client.ainvoke(processed_messages, **kwargs)
-        except Exception as e:
-            self._handle_error(e, model)
+        if key is not None:
+            await self.response_cache.set(key, _cache_entry(result, model))
+        return result
     
     async def astream(
         self,
         messages: List[Union[BaseMessage, str]],
-        model: Optional[ModelConfig] = None,
+        model: Optional[Union[ModelConfig, str]] = None,
         on_token: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True,
+        priority: int = LLMPriority.DEFAULT,
+        on_usage: Optional[Callable[[Dict[str, Any]], None]] = None,
         **kwargs,
     ) -> AsyncGenerator[str, None]:
         """
         Stream tokens from the LLM.
         
+        A cached response is yielded as a single chunk; a streamed response
+        is cached once it completes.
+        
         Args:
             messages: List of messages
-            model: Model configuration
+            model: Model configuration or name
             on_token: Callback for each token
+            use_cache: Use the response cache if one is configured
+            priority: Rate-limiter queueing priority
+            on_usage: Called after the stream with the token usage,
+                including "cached_token_ratio"
             **kwargs: Additional arguments
         
         Yields:
             Token strings from the LLM
         """
-        client = self.get_client(model)
+        model = self._resolve_model(model)
+        processed_messages = self._process_messages(messages)
         
-        # Convert strings to messages
-        processed_messages = []
-        for msg in messages:
-            if isinstance(msg, str):
-                processed_messages.append(HumanMessage(content=msg))
-            else:
-                processed_messages.append(msg)
+        key, entry = await self._cache_lookup(processed_messages, model, kwargs, use_cache)
+        if entry is not None:
+            if entry["content"]:
+                yield entry["content"]
+            return
         
+        client = self.get_client(model)
         callback = LLMCallbackHandler(on_token=on_token)
+        chunks: List[str] = []
+        estimated = self._estimate_tokens(processed_messages, model)
         
-        try:
-            async for chunk in client.astream(processed_messages, **kwargs):
-                if chunk.content:
-                    yield chunk.content
-        except Exception as e:
-            self._handle_error(e, model)
+        async with self._rate_limited(model, estimated, priority) as limiter:
+            started = time.monotonic()
+            first_token_latency = None
+            output_chars = 0
+            usage: Dict[str, Any] = {}
+            
+            try:
+                async for chunk in client.astream(processed_messages, **kwargs):
+                    if getattr(chunk, "usage_metadata", None):
+                        usage = _add_usage(usage, chunk.usage_metadata)
+                    if chunk.content:
+                        if first_token_latency is None:
+                            first_token_latency = time.monotonic() - started
+                        output_chars += len(chunk.content)
+                        if key is not None:
+                            chunks.append(chunk.content)
+                        yield chunk.content
+            except Exception as e:
+                self._handle_error(e, model)
+            
+            actual = usage.get("total_tokens") or (
+                estimated - min(model.max_tokens, LLM_OUTPUT_TOKEN_ESTIMATE)
+                + output_chars // 4 + 1
+            )
+            await self._record_success(
+                limiter, model, estimated, actual, first_token_latency, "first_token",
+            )
+        
+        ratio = self._record_prompt_cache(usage)
+        if on_usage is not None:
+            on_usage({**usage, "cached_token_ratio": ratio})
+        
+        if key is not None:
+            await self.response_cache.set(key, {
+                "content": "".join(chunks),
+                "response_metadata": {},
+                "usage_metadata": usage or None,
+                "model": model.model_name,
+            })
     
     async def agenerate(
         self,
         prompt: str,
         system_message: Optional[str] = None,
-        model: Optional[ModelConfig] = None,
+        model: Optional[Union[ModelConfig, str]] = None,
+        use_cache: bool = True,
+        priority: int = LLMPriority.DEFAULT,
+        shared_context: Optional[str] = None,
         **kwargs,
     ) -> ChatGeneration:
         """
@@ -301,37 +528,83 @@ class LLMClient:
         Args:
             prompt: User prompt
             system_message: Optional system message
-            model: Model configuration
+            model: Model configuration or name
+            use_cache: Use the response cache if one is configured
+            priority: Rate-limiter queueing priority
+            shared_context: Context shared across calls, sent as a stable
+                prompt prefix marked for provider caching
             **kwargs: Additional arguments
         
         Returns:
             ChatGeneration with the response
         """
-        messages = []
+        model = self._resolve_model(model)
+        messages = build_messages(
+            prompt,
+            system_message=system_message,
+            shared_context=shared_context,
+            provider=model.provider.value,
+        )
+        
+        result = await self.ainvoke(
+            messages, model, use_cache=use_cache, priority=priority, **kwargs,
+        )
         
-        if system_message:
-            messages.append(SystemMessage(content=system_message))
+        if isinstance(result, BaseMessage):
+            return ChatGeneration(message=result)
+        if getattr(result, "generations", None):
+            return result.generations[0]
+        raise LLMGenerationError(
+            message="No generations returned",
+            provider=model.provider.value,
+            model=model.model_name,
+        )
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache metrics.
         
-        messages.append(HumanMessage(content=prompt))
+        Returns:
+            Hit/miss/bypass counts, hit ratio and estimated savings
+            (empty if no cache is configured)
+        """
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.get_stats()
+    
+    def get_prompt_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get provider prompt-cache metrics.
         
-        result = await self.ainvoke(messages, model, **kwargs)
+        Returns:
+            Input, cache-read and cache-write token totals and the overall
+            cached-token ratio
+        """
+        stats = dict(self._prompt_cache_stats)
+        stats["cached_token_ratio"] = (
+            stats["cache_read_tokens"] / stats["input_tokens"] if stats["input_tokens"] else 0.0
+        )
+        return stats
+    
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """
+        Get rate limiter metrics.
         
-        if result.generations:
-            return result.generations[0]
-        else:
-            raise LLMGenerationError(
-                message="No generations returned",
-                provider=model.provider if model else self.default_model.provider,
-                model=model.model_name if model else self.default_model.model_name,
-            )
+        Returns:
+            Per-model concurrency limits, queue depth and throttling
+            (empty if no rate limiter is configured)
+        """
+        if self.rate_limiter is None:
+            return {}
+        return self.rate_limiter.get_stats()
     
     def _handle_error(
         self,
         error: Exception,
-        model: Optional[ModelConfig],
+        model: Optional[Union[ModelConfig, str]],
     ) -> None:
         """Handle LLM errors with appropriate exception types."""
-        model_config = model or self.default_model
+        model_config = self._resolve_model(model)
         provider = model_config.provider.value
         model_name = model_config.model_name
         
@@ -356,6 +629,40 @@ class LLMClient:
             )
 
 
+def _add_usage(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Sum usage metadata from streamed chunks, including input token details."""
+    merged = dict(left)
+    for field_name in ("input_tokens", "output_tokens", "total_tokens"):
+        merged[field_name] = merged.get(field_name, 0) + (right.get(field_name) or 0)
+    details = dict(merged.get("input_token_details") or {})
+    for name, value in (right.get("input_token_details") or {}).items():
+        details[name] = details.get(name, 0) + (value or 0)
+    if details:
+        merged["input_token_details"] = details
+    return merged
+
+
+def _cache_entry(message: BaseMessage, model: ModelConfig) -> Dict[str, Any]:
+    """Serialize an AI message for the response cache."""
+    return {
+        "content": message.content,
+        "response_metadata": getattr(message, "response_metadata", {}) or {},
+        "usage_metadata": getattr(message, "usage_metadata", None),
+        "model": model.model_name,
+    }
+
+
+def _message_from_cache(entry: Dict[str, Any]) -> AIMessage:
+    """Rebuild an AI message from a response cache entry."""
+    fields = {
+        "content": entry["content"],
+        "response_metadata": {**entry.get("response_metadata", {}), "cached": True},
+    }
+    if entry.get("usage_metadata"):
+        fields["usage_metadata"] = entry["usage_metadata"]
+    return AIMessage(**fields)
+
+
 # ==================== Embedding Client ====================
 
 class EmbeddingClient:
@@ -538,6 +845,7 @@ def with_retry(
     initial_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2.0,
+    jitter: bool = True,
 ):
     """
     Decorator for retry logic with exponential backoff.
@@ -547,10 +855,16 @@ def with_retry(
         initial_delay: Initial delay between retries
         max_delay: Maximum delay between retries
         exponential_base: Base for exponential backoff
+        jitter: Sleep a random time up to the backoff delay ("full jitter")
+            so workers throttled together don't retry in lockstep
     
     Returns:
         Decorated function
     """
+    def backoff(attempt: int) -> float:
+        delay = min(initial_delay * (exponential_base ** attempt), max_delay)
+        return random.uniform(0, delay) if jitter else delay
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -561,12 +875,10 @@ def with_retry(
                     return await func(*args, **kwargs)
                 except LLMRateLimitError as e:
                     last_exception = e
-                    delay = min(initial_delay * (exponential_base ** attempt), max_delay)
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(backoff(attempt))
                 except LLMTimeoutError as e:
                     last_exception = e
-                    delay = min(initial_delay * (exponential_base ** attempt), max_delay)
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(backoff(attempt))
                 except Exception as e:
                     # Don't retry on other errors
                     raise
@@ -597,6 +909,8 @@ def get_llm_client(
     return LLMClient(
         anthropic_api_key=anthropic_api_key,
         openai_api_key=openai_api_key,
+        response_cache=get_llm_response_cache(),
+        rate_limiter=LLMRateLimiter(),
     )
 
 
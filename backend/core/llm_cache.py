@@ -0,0 +1,266 @@
+"""
+LLM response cache keyed by request hash.
+
+Provides:
+- Stable cache keys from (model, messages, parameters)
+- Redis backend with a TTL
+- Local disk backend for development and offline benchmarks
+- Exact-match replay mode that never calls the provider
+- Hit/miss/bypass counts and estimated cost saved
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Backend selection: "redis", "disk" or "none" (caching is opt-in)
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "none")
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+
+# Replay mode: serve only cached responses and fail on a miss (development only)
+LLM_CACHE_REPLAY = os.getenv("LLM_CACHE_REPLAY", "false").lower() == "true"
+
+# USD per million (input, output) tokens, used for cost-saved metrics
+MODEL_PRICING: Dict[str, tuple] = {
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+
+
+def llm_cache_key(model: str, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+    """
+    Hash a request into a cache key.
+
+    Args:
+        model: Provider-qualified model name
+        messages: Messages as role/content dictionaries
+        params: Sampling and call parameters
+
+    Returns:
+        Hex digest identifying the exact request
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def estimate_cost(model: str, usage: Optional[Dict[str, Any]]) -> float:
+    """Estimate the USD cost of a call from its token usage."""
+    pricing = MODEL_PRICING.get(model)
+    if not pricing or not usage:
+        return 0.0
+    input_price, output_price = pricing
+    return (
+        usage.get("input_tokens", 0) * input_price
+        + usage.get("output_tokens", 0) * output_price
+    ) / 1_000_000
+
+
+class LLMResponseCache:
+    """Base LLM response cache; stores nothing."""
+
+    def __init__(self, ttl: Optional[int] = None, replay: bool = LLM_CACHE_REPLAY):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Entry TTL in seconds (None or 0 keeps entries until evicted)
+            replay: Serve only cached responses; entries never expire
+        """
+        self.ttl = ttl
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.cost_saved = 0.0
+        self.tokens_saved = 0
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    async def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        return None
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        if self.replay or not self.ttl:
+            return False
+        return time.time() - entry.get("cached_at", 0) > self.ttl
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from llm_cache_key
+
+        Returns:
+            Cached entry (content, metadata, usage, model) or None
+        """
+        try:
+            entry = await self._get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            entry = None
+
+        if entry is None or self._expired(entry):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        usage = entry.get("usage_metadata") or {}
+        self.tokens_saved += usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        self.cost_saved += estimate_cost(entry.get("model", ""), usage)
+        return entry
+
+    async def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from llm_cache_key
+            entry: Response content, metadata, usage and model
+        """
+        entry = {**entry, "cached_at": time.time()}
+        try:
+            await self._set(key, entry)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def record_bypass(self) -> None:
+        """Count a call that skipped the cache."""
+        self.bypassed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/bypass counts, hit ratio and estimated savings."""
+        total = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "replay": self.replay,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "tokens_saved": self.tokens_saved,
+            "cost_saved_usd": round(self.cost_saved, 6),
+        }
+
+
+class RedisLLMResponseCache(LLMResponseCache):
+    """LLM response cache in Redis, one JSON document per key."""
+
+    def __init__(self, redis_client=None, ttl: Optional[int] = None, replay: bool = LLM_CACHE_REPLAY):
+        """
+        Initialize the Redis cache.
+
+        Args:
+            redis_client: Async Redis client (shared pool if not provided)
+            ttl: Entry TTL in seconds (LLM_CACHE_TTL if not provided)
+            replay: Serve only cached responses; entries never expire
+        """
+        from backend.cache.connection import LLM_CACHE_TTL, LLM_RESPONSE_PREFIX
+
+        super().__init__(ttl=ttl if ttl is not None else LLM_CACHE_TTL, replay=replay)
+        self.redis = redis_client
+        self.prefix = LLM_RESPONSE_PREFIX
+
+    async def _get_client(self):
+        if self.redis is None:
+            from backend.cache.connection import init_redis
+            self.redis = await init_redis()
+        return self.redis
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = await self._get_client()
+        value = await client.get(f"{self.prefix}{key}")
+        return json.loads(value) if value else None
+
+    async def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        client = await self._get_client()
+        ttl = None if self.replay else (self.ttl or None)
+        await client.set(f"{self.prefix}{key}", json.dumps(entry, default=str), ex=ttl)
+
+
+class DiskLLMResponseCache(LLMResponseCache):
+    """LLM response cache on local disk, one JSON file per key."""
+
+    def __init__(
+        self,
+        directory: str = LLM_CACHE_DIR,
+        ttl: Optional[int] = None,
+        replay: bool = LLM_CACHE_REPLAY,
+    ):
+        """
+        Initialize the disk cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            ttl: Entry TTL in seconds (entries kept indefinitely if not provided)
+            replay: Serve only cached responses; entries never expire
+        """
+        super().__init__(ttl=ttl, replay=replay)
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entry, default=str), encoding="utf-8")
+        tmp.replace(path)
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, key, entry)
+
+
+def get_llm_response_cache(backend: Optional[str] = None) -> Optional[LLMResponseCache]:
+    """
+    Create an LLM response cache from configuration.
+
+    Args:
+        backend: "redis", "disk" or "none" (LLM_CACHE_BACKEND if not provided)
+
+    Returns:
+        LLMResponseCache instance, or None when caching is disabled
+
+    Raises:
+        ValueError: For an unknown backend, or replay enabled without a cache
+    """
+    backend = backend or LLM_CACHE_BACKEND
+    if LLM_CACHE_REPLAY and os.getenv("APP_ENV", "development") == "production":
+        raise ValueError("LLM_CACHE_REPLAY is for development only")
+
+    if backend == "redis":
+        return RedisLLMResponseCache()
+    elif backend == "disk":
+        return DiskLLMResponseCache()
+    elif backend == "none":
+        if LLM_CACHE_REPLAY:
+            # Replay without a cache would silently call the live provider
+            raise ValueError("LLM_CACHE_REPLAY requires LLM_CACHE_BACKEND to be redis or disk")
+        return None
+    else:
+        raise ValueError(f"Unknown LLM cache backend: {backend}")
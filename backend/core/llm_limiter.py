@@ -0,0 +1,525 @@
+"""
+Client-side rate limiting for LLM calls.
+
+Provides:
+- Token buckets per provider/model for requests/min and tokens/min,
+  shared across workers through Redis (in-process fallback)
+- AIMD concurrency limits driven by 429s and latency
+- Priority queueing so interactive calls run before batch work
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bucket backend: "redis" (shared, falls back to local on errors), "local" or "none"
+LLM_RATE_LIMITER_BACKEND = os.getenv("LLM_RATE_LIMITER_BACKEND", "redis")
+
+# Default per-model limits; LLM_RATE_LIMITS overrides as JSON {"model": [rpm, tpm]}
+LLM_DEFAULT_RPM = int(os.getenv("LLM_DEFAULT_RPM", "500"))
+LLM_DEFAULT_TPM = int(os.getenv("LLM_DEFAULT_TPM", "200000"))
+MODEL_RATE_LIMITS: Dict[str, Tuple[int, int]] = {
+    "claude-sonnet-4-20250514": (50, 40000),
+    "gpt-4o": (500, 30000),
+    "gpt-4o-mini": (500, 200000),
+}
+MODEL_RATE_LIMITS.update({
+    model: tuple(limits)
+    for model, limits in json.loads(os.getenv("LLM_RATE_LIMITS", "{}")).items()
+})
+
+# Adaptive concurrency per provider/model
+LLM_INITIAL_CONCURRENCY = int(os.getenv("LLM_INITIAL_CONCURRENCY", "8"))
+LLM_MIN_CONCURRENCY = int(os.getenv("LLM_MIN_CONCURRENCY", "1"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+# Latency above this multiple of the baseline counts as congestion
+LLM_LATENCY_BACKOFF_FACTOR = float(os.getenv("LLM_LATENCY_BACKOFF_FACTOR", "2.0"))
+
+# Output tokens reserved up front when the caller gives no estimate
+LLM_OUTPUT_TOKEN_ESTIMATE = int(os.getenv("LLM_OUTPUT_TOKEN_ESTIMATE", "1024"))
+
+# Seconds an idle bucket is kept in Redis
+_BUCKET_TTL = 120
+
+# Seconds to use local buckets after a Redis failure before retrying Redis
+_REDIS_RETRY_SECONDS = 30.0
+
+# Takes one request and N tokens from both buckets, or returns the wait in seconds.
+# Uses the Redis clock so every worker refills against the same time source.
+_ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local function level(key, capacity)
+    local bucket = redis.call('HMGET', key, 'level', 'ts')
+    local current = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    return math.min(capacity, current + (now - ts) * capacity / 60)
+end
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local need = math.min(tonumber(ARGV[3]), tpm)
+local requests = level(KEYS[1], rpm)
+local tokens = level(KEYS[2], tpm)
+local wait = 0
+if requests < 1 then wait = math.max(wait, (1 - requests) * 60 / rpm) end
+if tokens < need then wait = math.max(wait, (need - tokens) * 60 / tpm) end
+if wait == 0 then
+    requests = requests - 1
+    tokens = tokens - need
+end
+redis.call('HSET', KEYS[1], 'level', requests, 'ts', now)
+redis.call('HSET', KEYS[2], 'level', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return tostring(wait)
+"""
+
+# Adds refunds (or charges) to refilled buckets, clamped to capacity, so a
+# bucket that expired during a long call is not recreated without a TTL.
+# ARGV: TTL, then capacity and amount for each key.
+_ADJUST_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local bucket = redis.call('HMGET', key, 'level', 'ts')
+    local current = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    local level = math.min(capacity, current + (now - ts) * capacity / 60)
+    level = math.min(capacity, level + tonumber(ARGV[i * 2 + 1]))
+    redis.call('HSET', key, 'level', level, 'ts', now)
+    redis.call('EXPIRE', key, ARGV[1])
+end
+return 1
+"""
+
+
+class LLMPriority(IntEnum):
+    """Queueing priority for LLM calls (lower runs first)."""
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BATCH = 2
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budget reservation (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class _LocalBuckets:
+    """In-process request and token buckets for one model."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
+
+    def try_acquire(self, tokens: int) -> float:
+        """Take one request and tokens, or return the seconds to wait."""
+        self._refill()
+        need = min(tokens, self.tpm)
+        wait = 0.0
+        if self.requests < 1:
+            wait = max(wait, (1 - self.requests) * 60 / self.rpm)
+        if self.tokens < need:
+            wait = max(wait, (need - self.tokens) * 60 / self.tpm)
+        if wait == 0:
+            self.requests -= 1
+            self.tokens -= need
+        return wait
+
+    def adjust(self, tokens: int, requests: int = 0) -> None:
+        """Return (positive) or charge (negative) tokens and requests."""
+        self._refill()
+        self.tokens = min(self.tpm, self.tokens + tokens)
+        self.requests = min(self.rpm, self.requests + requests)
+
+
+class _PriorityQueue:
+    """Counting slots with a priority-ordered wait queue (lower priority values first)."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _has_capacity(self) -> bool:
+        raise NotImplementedError
+
+    async def acquire(self, priority: int = LLMPriority.DEFAULT) -> None:
+        """Wait for a slot; higher-priority waiters are served first."""
+        with self._lock:
+            if self._has_capacity() and not self._waiters:
+                self.in_flight += 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            entry = (int(priority), next(self._sequence), future)
+            heapq.heappush(self._waiters, entry)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = future.done() and not future.cancelled()
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+            if granted:
+                # Slot was granted just before cancellation; hand it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot and wake waiters that now fit."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake()
+
+    def _wake(self) -> None:
+        """Grant slots to queued waiters (caller holds the lock)."""
+        while self._waiters and self._has_capacity():
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self.in_flight += 1
+            # Callers may run on other event loops (sync tool wrappers use
+            # per-thread loops), so resolve on the waiter's own loop
+            future.get_loop().call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future) -> None:
+        if future.done():
+            # Waiter was cancelled after its slot was reserved
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class _BudgetQueue(_PriorityQueue):
+    """Lets one caller at a time wait on a model's buckets, in priority order."""
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < 1
+
+
+class AdaptiveConcurrency(_PriorityQueue):
+    """
+    AIMD concurrency limit with a priority-ordered wait queue.
+
+    The limit grows by about one slot per limit's worth of successful calls
+    and is halved on a 429 (or cut by 10% when latency exceeds the
+    baseline by LLM_LATENCY_BACKOFF_FACTOR), at most once per cooldown.
+    """
+
+    def __init__(
+        self,
+        initial: int = LLM_INITIAL_CONCURRENCY,
+        minimum: int = LLM_MIN_CONCURRENCY,
+        maximum: int = LLM_MAX_CONCURRENCY,
+        backoff_factor: float = LLM_LATENCY_BACKOFF_FACTOR,
+        decrease_cooldown: float = 5.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest limit after decreases
+            maximum: Highest limit after increases
+            backoff_factor: Latency multiple of the baseline treated as congestion
+            decrease_cooldown: Minimum seconds between two decreases
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.backoff_factor = backoff_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.rate_limited = 0
+        self.congested = 0
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        super().__init__()
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _decrease(self, factor: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_cooldown:
+                return
+            self._last_decrease = now
+            self.limit = max(self.minimum, self.limit * factor)
+
+    def on_success(self, latency: Optional[float] = None, kind: str = "invoke") -> None:
+        """
+        Record a successful call.
+
+        Args:
+            latency: Latency sample in seconds (None skips the latency signal)
+            kind: Sample kind; each kind keeps its own baseline
+        """
+        if latency is not None:
+            baseline = self._baselines.get(kind, latency)
+            # Track the baseline slowly so a lasting slowdown becomes the new normal
+            self._baselines[kind] = baseline * 0.95 + latency * 0.05
+            if latency > baseline * self.backoff_factor:
+                self.congested += 1
+                self._decrease(0.9)
+                return
+
+        with self._lock:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def on_rate_limited(self) -> None:
+        """Record a 429 from the provider."""
+        self.rate_limited += 1
+        self._decrease(0.5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current limit, in-flight and queued calls and backoff counts."""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rate_limited": self.rate_limited,
+            "congested": self.congested,
+            "latency_baselines": {k: round(v, 3) for k, v in self._baselines.items()},
+        }
+
+
+class LLMRateLimiter:
+    """
+    Rate limiter for LLM calls, keyed by provider and model.
+
+    Request/token buckets are shared across workers through Redis when the
+    backend is "redis"; concurrency limits and priority queues are per
+    process. Callers wait for budget one at a time per model in priority
+    order, then queue for a concurrency slot.
+    """
+
+    def __init__(
+        self,
+        backend: str = LLM_RATE_LIMITER_BACKEND,
+        redis_client=None,
+        limits: Optional[Dict[str, Tuple[int, int]]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            backend: "redis", "local" or "none" (buckets disabled)
+            redis_client: Async Redis client (shared pool if not provided)
+            limits: Per-model (rpm, tpm) overrides (MODEL_RATE_LIMITS if not provided)
+        """
+        self.backend = backend
+        self.redis = redis_client
+        self.limits = limits if limits is not None else MODEL_RATE_LIMITS
+        self._script = None
+        self._adjust_script = None
+        self._redis_retry_at = 0.0
+        self._local: Dict[str, _LocalBuckets] = {}
+        self._concurrency: Dict[str, AdaptiveConcurrency] = {}
+        self._budget_queues: Dict[str, _BudgetQueue] = {}
+        self._throttled: Dict[str, int] = {}
+        self._throttle_seconds: Dict[str, float] = {}
+
+    def _key(self, provider: str, model: str) -> str:
+        return f"{provider}:{model}"
+
+    def _limits_for(self, model: str) -> Tuple[int, int]:
+        return self.limits.get(model, (LLM_DEFAULT_RPM, LLM_DEFAULT_TPM))
+
+    def concurrency(self, provider: str, model: str) -> AdaptiveConcurrency:
+        """Get the concurrency limiter for a provider/model."""
+        key = self._key(provider, model)
+        if key not in self._concurrency:
+            self._concurrency[key] = AdaptiveConcurrency()
+        return self._concurrency[key]
+
+    def _local_buckets(self, key: str, model: str) -> _LocalBuckets:
+        if key not in self._local:
+            self._local[key] = _LocalBuckets(*self._limits_for(model))
+        return self._local[key]
+
+    async def _redis_acquire(self, key: str, model: str, tokens: int) -> float:
+        from backend.cache.connection import RATE_LIMIT_PREFIX
+
+        if self.redis is None:
+            from backend.cache.connection import init_redis
+            self.redis = await init_redis()
+        if self._script is None:
+            self._script = self.redis.register_script(_ACQUIRE_SCRIPT)
+
+        rpm, tpm = self._limits_for(model)
+        prefix = f"{RATE_LIMIT_PREFIX}llm:{key}"
+        wait = await self._script(
+            keys=[f"{prefix}:requests", f"{prefix}:tokens"],
+            args=[rpm, tpm, tokens, _BUCKET_TTL],
+        )
+        return float(wait)
+
+    async def _try_acquire(self, key: str, model: str, tokens: int) -> float:
+        if self.backend == "redis" and time.monotonic() >= self._redis_retry_at:
+            try:
+                return await self._redis_acquire(key, model, tokens)
+            except Exception as e:
+                self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+                logger.warning(f"Shared LLM rate limiter unavailable, using local buckets: {e}")
+        return self._local_buckets(key, model).try_acquire(tokens)
+
+    async def acquire_budget(
+        self,
+        provider: str,
+        model: str,
+        tokens: int,
+        priority: int = LLMPriority.DEFAULT,
+    ) -> float:
+        """
+        Wait until one request and tokens are available in the model's buckets.
+
+        Only the highest-priority waiter polls the buckets; the others queue
+        behind it, so interactive calls get budget before batch calls.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            tokens: Estimated tokens for the call
+            priority: Queueing priority
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.backend == "none":
+            return 0.0
+
+        key = self._key(provider, model)
+        if key not in self._budget_queues:
+            self._budget_queues[key] = _BudgetQueue()
+        queue = self._budget_queues[key]
+
+        started = time.monotonic()
+        await queue.acquire(priority)
+        try:
+            while True:
+                wait = await self._try_acquire(key, model, tokens)
+                if wait <= 0:
+                    break
+                self._throttled[key] = self._throttled.get(key, 0) + 1
+                await asyncio.sleep(wait)
+        finally:
+            queue.release()
+        waited = time.monotonic() - started
+        self._throttle_seconds[key] = self._throttle_seconds.get(key, 0.0) + waited
+        return waited
+
+    async def _adjust_buckets(self, key: str, model: str, tokens: int, requests: int = 0) -> None:
+        """Return (positive) or charge (negative) tokens and requests to a model's buckets."""
+        if self.backend == "redis" and self.redis is not None and time.monotonic() >= self._redis_retry_at:
+            try:
+                from backend.cache.connection import RATE_LIMIT_PREFIX
+                if self._adjust_script is None:
+                    self._adjust_script = self.redis.register_script(_ADJUST_SCRIPT)
+                rpm, tpm = self._limits_for(model)
+                prefix = f"{RATE_LIMIT_PREFIX}llm:{key}"
+                await self._adjust_script(
+                    keys=[f"{prefix}:requests", f"{prefix}:tokens"],
+                    args=[_BUCKET_TTL, rpm, requests, tpm, tokens],
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Failed to adjust shared LLM rate buckets: {e}")
+        self._local_buckets(key, model).adjust(tokens, requests)
+
+    async def settle(self, provider: str, model: str, estimated: int, actual: Optional[int]) -> None:
+        """Correct the token bucket once the actual usage of a call is known."""
+        if self.backend == "none" or actual is None or actual == estimated:
+            return
+
+        await self._adjust_buckets(self._key(provider, model), model, estimated - actual)
+
+    async def refund_budget(self, provider: str, model: str, tokens: int) -> None:
+        """Return the request and tokens taken by acquire_budget for a call that never ran."""
+        if self.backend == "none":
+            return
+
+        _, tpm = self._limits_for(model)
+        await self._adjust_buckets(self._key(provider, model), model, min(tokens, tpm), requests=1)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        model: str,
+        tokens: int,
+        priority: int = LLMPriority.DEFAULT,
+    ) -> AsyncIterator[AdaptiveConcurrency]:
+        """
+        Hold a concurrency slot and rate budget for one call.
+
+        The budget is taken (in priority order) before queueing for a slot,
+        so calls throttled by the buckets do not hold slots that
+        higher-priority calls could use. The budget is refunded if the slot
+        wait is cancelled.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            tokens: Estimated tokens for the call
+            priority: Queueing priority
+
+        Yields:
+            The concurrency limiter, for reporting success/latency/429s
+        """
+        limiter = self.concurrency(provider, model)
+        await self.acquire_budget(provider, model, tokens, priority)
+        try:
+            await limiter.acquire(priority)
+        except asyncio.CancelledError:
+            await self.refund_budget(provider, model, tokens)
+            raise
+        try:
+            yield limiter
+        finally:
+            limiter.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter metrics per provider/model.
+
+        Returns:
+            Dictionary with backend and per-model concurrency and throttling stats
+        """
+        keys = set(self._concurrency) | set(self._throttled)
+        models = {}
+        for key in sorted(keys):
+            stats = self._concurrency[key].get_stats() if key in self._concurrency else {}
+            stats["throttled"] = self._throttled.get(key, 0)
+            stats["budget_queued"] = self._budget_queues[key].queued if key in self._budget_queues else 0
+            stats["throttle_seconds"] = round(self._throttle_seconds.get(key, 0.0), 3)
+            models[key] = stats
+        return {"backend": self.backend, "models": models}
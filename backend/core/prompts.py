@@ -0,0 +1,118 @@
+"""
+Prompt assembly with a stable, cacheable prefix.
+
+Provides:
+- Deterministic rendering of shared project context (decisions, retrieved context)
+- Message layout that puts the shared context first and per-call text after it
+- Provider prompt-cache markers (Anthropic cache_control; OpenAI caches
+  long prefixes automatically)
+- Cached-token ratio from usage metadata
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+# Mark the shared prefix for provider prompt caching
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "true").lower() == "true"
+
+# Prefixes shorter than this (estimated tokens) are not marked; providers
+# don't cache them and Anthropic would still bill the cache write
+PROMPT_CACHE_MIN_TOKENS = int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "1024"))
+
+SHARED_CONTEXT_HEADER = "Project context shared by every task in this session:"
+
+
+def render_decisions(decisions: Dict[str, Any]) -> str:
+    """
+    Render decisions in a stable order.
+
+    The output is byte-identical for the same decisions regardless of dict
+    order, so it can serve as a cached prompt prefix.
+
+    Args:
+        decisions: Decisions keyed by decision ID
+
+    Returns:
+        Markdown list of decisions
+    """
+    lines = []
+    for decision_id in sorted(decisions):
+        decision = decisions[decision_id]
+        category = getattr(decision, "category", None)
+        category = getattr(category, "value", category) or "general"
+        answer = getattr(decision, "answer_text", None) or str(decision)
+        lines.append(f"- [{decision_id}] **{category}**: {answer}")
+    return "\n".join(lines)
+
+
+def render_context(items: Iterable[Any]) -> str:
+    """Render retrieved context items deterministically (sorted keys, one per line)."""
+    return "\n".join(
+        json.dumps(item, sort_keys=True, default=str) if isinstance(item, dict) else str(item)
+        for item in items
+    )
+
+
+def build_messages(
+    prompt: str,
+    system_message: Optional[str] = None,
+    shared_context: Optional[str] = None,
+    provider: Optional[str] = None,
+) -> List[BaseMessage]:
+    """
+    Build messages with the shared context as a stable leading prefix.
+
+    The shared context opens the system prompt, ahead of the per-call system
+    message, so calls with different roles still share the cached prefix.
+
+    Args:
+        prompt: Per-call user prompt
+        system_message: Per-call system instructions
+        shared_context: Context shared across calls (e.g. rendered decisions)
+        provider: Provider name ("anthropic" adds a cache_control marker)
+
+    Returns:
+        List of messages
+    """
+    messages: List[BaseMessage] = []
+
+    if shared_context:
+        prefix = f"{SHARED_CONTEXT_HEADER}\n\n{shared_context.strip()}"
+        cacheable = PROMPT_CACHE_ENABLED and len(prefix) // 4 >= PROMPT_CACHE_MIN_TOKENS
+
+        if provider == "anthropic" and cacheable:
+            blocks = [{
+                "type": "text",
+                "text": prefix,
+                "cache_control": {"type": "ephemeral"},
+            }]
+            if system_message:
+                blocks.append({"type": "text", "text": system_message})
+            messages.append(SystemMessage(content=blocks))
+        else:
+            text = f"{prefix}\n\n{system_message}" if system_message else prefix
+            messages.append(SystemMessage(content=text))
+    elif system_message:
+        messages.append(SystemMessage(content=system_message))
+
+    messages.append(HumanMessage(content=prompt))
+    return messages
+
+
+def cached_token_ratio(usage: Optional[Dict[str, Any]]) -> float:
+    """
+    Fraction of input tokens served from the provider's prompt cache.
+
+    Args:
+        usage: usage_metadata from a LangChain AI message
+
+    Returns:
+        Cache-read input tokens over all input tokens (0.0 if unknown)
+    """
+    if not usage or not usage.get("input_tokens"):
+        return 0.0
+    details = usage.get("input_token_details") or {}
+    return details.get("cache_read", 0) / usage["input_tokens"]
@@ -9,8 +9,9 @@ This module provides:
 """
 
 import os
+import ssl
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Union
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import (
@@ -68,6 +69,33 @@ def _get_ssl_kwargs() -> dict:
     return ssl_kwargs
 
 
+def get_asyncpg_ssl() -> Optional[Union[ssl.SSLContext, str]]:
+    """
+    Build the ssl argument for asyncpg.connect / asyncpg.create_pool.
+
+    Returns:
+        An SSLContext when certificates are configured or the server must be
+        verified, otherwise the sslmode string (None for an unknown mode)
+    """
+    mode = POSTGRES_SSL_MODE
+    if mode in ("verify-ca", "verify-full"):
+        context = ssl.create_default_context(cafile=POSTGRES_SSL_ROOT_CERT or None)
+        context.check_hostname = mode == "verify-full"
+    elif mode == "require" and POSTGRES_SSL_CERT and POSTGRES_SSL_KEY:
+        # Encrypt and present a client certificate without verifying the server
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif mode in ("disable", "allow", "prefer", "require"):
+        return mode
+    else:
+        return None
+
+    if POSTGRES_SSL_CERT and POSTGRES_SSL_KEY:
+        context.load_cert_chain(POSTGRES_SSL_CERT, POSTGRES_SSL_KEY)
+    return context
+
+
 # Async engine for production use
 async_engine = create_async_engine(
     DATABASE_URL,
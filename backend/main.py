@@ -9,11 +9,18 @@ import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+except ImportError:
+    CONTENT_TYPE_LATEST = None
+    generate_latest = None
+
 from backend.api.endpoints import auth_router, workspace_router, project_router, artifact_router, comment_router, codebase_router
 from backend.db.connection import init_db, close_db
+from backend.cache.connection import close_redis, get_redis_registry
 from backend.db.health import get_db_health
 from backend.api.schemas.common import HealthResponse
 
@@ -33,17 +40,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan handler.
 
-    Sets up and tears down database connections.
+    Sets up and tears down database connections and the cross-worker
+    interrupt relay.
     """
     # Startup
     logger.info("Starting up SpecGen API...")
     await init_db()
     logger.info("Database initialized")
+    interrupt_manager = None
+    try:
+        from backend.api.websocket_manager import manager as websocket_manager
+        from backend.core.agents.interrupt_websocket import get_websocket_interrupt_manager
+
+        async def send_interrupt_message(connection_id: str, message: dict) -> None:
+            await websocket_manager.send_personal_message(message, connection_id)
+
+        interrupt_manager = get_websocket_interrupt_manager()
+        await interrupt_manager.start_relay(send_interrupt_message)
+        logger.info("Interrupt relay started")
+    except Exception as e:
+        logger.warning(f"Interrupt relay not started: {e}")
     yield
     # Shutdown
     logger.info("Shutting down SpecGen API...")
+    if interrupt_manager is not None:
+        await interrupt_manager.stop_relay()
+        logger.info("Interrupt relay stopped")
     await close_db()
     logger.info("Database connections closed")
+    await close_redis()
+    logger.info("Redis connections closed")
 
 
 # Create FastAPI application
@@ -100,16 +126,43 @@ async def health_check() -> HealthResponse:
     Returns the status of the API and its dependencies.
     """
     db_health = await get_db_health()
+    cache_healthy = all((await get_redis_registry().health_check()).values())
 
     return HealthResponse(
-        status="healthy" if db_health["healthy"] else "degraded",
+        status="healthy" if db_health["healthy"] and cache_healthy else "degraded",
         version="0.1.0",
         database=db_health["status"],
-        cache="healthy",  # TODO: Implement cache health check
+        cache="healthy" if cache_healthy else "unhealthy",
         timestamp=db_health["timestamp"],
     )
 
 
+# Prometheus metrics endpoint
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    summary="Prometheus metrics",
+    description="Expose process and Redis pool metrics in Prometheus text format.",
+    include_in_schema=False,
+)
+async def metrics() -> Response:
+    """
+    Prometheus scrape endpoint.
+
+    Responds 503 when prometheus_client is not installed.
+    """
+    if generate_latest is None:
+        return Response(
+            content="prometheus_client is not installed\n",
+            status_code=503,
+            media_type="text/plain",
+        )
+
+    # Ensures the Redis pool collector is registered before the first scrape
+    get_redis_registry()
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Root endpoint
 @app.get(
     "/",
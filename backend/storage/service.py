@@ -236,6 +236,72 @@ class StorageService:
 
         return deleted
 
+    def _partial_key(self, project_id: UUID, partial_id: str) -> str:
+        """Generate the fixed storage key for an in-progress artifact."""
+        return f"projects/{project_id}/partials/{partial_id}.part"
+
+    async def save_partial_artifact(
+        self,
+        project_id: UUID,
+        partial_id: str,
+        content: str,
+    ) -> str:
+        """
+        Checkpoint in-progress artifact content, replacing any earlier checkpoint.
+
+        Args:
+            project_id: Project UUID
+            partial_id: Stable identifier of the generation (e.g. thread/node)
+            content: Content generated so far
+
+        Returns:
+            Storage key of the checkpoint
+        """
+        key = self._partial_key(project_id, partial_id)
+        await self.client.upload_file(
+            key=key,
+            data=content.encode("utf-8"),
+            content_type="text/plain",
+            metadata={
+                "project_id": str(project_id),
+                "partial_id": partial_id,
+                "saved_at": datetime.utcnow().isoformat(),
+            },
+        )
+        return key
+
+    async def load_partial_artifact(
+        self,
+        project_id: UUID,
+        partial_id: str,
+    ) -> Optional[str]:
+        """
+        Load checkpointed in-progress artifact content.
+
+        Args:
+            project_id: Project UUID
+            partial_id: Stable identifier of the generation
+
+        Returns:
+            Checkpointed content, or None if there is no checkpoint
+        """
+        key = self._partial_key(project_id, partial_id)
+        # List the parent prefix: local storage walks directories, not keys
+        files = await self.client.list_files(prefix=key.rsplit("/", 1)[0] + "/")
+        if not any(f["key"] == key for f in files):
+            return None
+
+        data = await self.client.download_file(key)
+        return data.decode("utf-8")
+
+    async def delete_partial_artifact(
+        self,
+        project_id: UUID,
+        partial_id: str,
+    ) -> bool:
+        """Delete the checkpoint for an in-progress artifact."""
+        return await self.client.delete_file(self._partial_key(project_id, partial_id))
+
     async def list_project_files(
         self,
         project_id: UUID,
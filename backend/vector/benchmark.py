@@ -0,0 +1,167 @@
+"""
+PGVector ANN benchmark.
+
+Measures recall@k and latency of indexed search against an exact scan,
+across HNSW ef_search (or IVFFlat probes) settings.
+
+Usage:
+    python -m backend.vector.benchmark --rows 20000 --dimension 768 --queries 100
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.vector.client import PGVectorClient, PGVectorIndexSpec
+
+
+def _random_unit_vector(rng: random.Random, dimension: int) -> List[float]:
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dimension)]
+    norm = sum(x * x for x in vector) ** 0.5
+    return [x / norm for x in vector]
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run_recall_benchmark(
+    client: PGVectorClient,
+    collection_name: str,
+    queries: Sequence[List[float]],
+    limit: int = 10,
+    ef_search_values: Sequence[int] = (40, 80, 160, 320),
+    probes_values: Sequence[int] = (),
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compare indexed search with an exact scan.
+
+    Args:
+        client: Connected PGVector client
+        collection_name: Collection to query
+        queries: Query vectors
+        limit: k for recall@k
+        ef_search_values: HNSW ef_search settings to try
+        probes_values: IVFFlat probes settings to try
+        filters: Optional metadata filter applied to every query
+
+    Returns:
+        One row per setting with recall@k and p50/p95 latency in ms
+    """
+    exact = []
+    exact_latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        results = await client.search(collection_name, query, limit=limit, filters=filters, exact=True)
+        exact_latencies.append((time.perf_counter() - started) * 1000)
+        exact.append({r["id"] for r in results})
+
+    report = [{
+        "setting": "exact",
+        "recall": 1.0,
+        "p50_ms": _percentile(exact_latencies, 50),
+        "p95_ms": _percentile(exact_latencies, 95),
+    }]
+
+    settings = [("ef_search", value) for value in ef_search_values]
+    settings += [("probes", value) for value in probes_values]
+    for name, value in settings:
+        latencies = []
+        hits = 0
+        expected = 0
+        for query, truth in zip(queries, exact):
+            started = time.perf_counter()
+            results = await client.search(
+                collection_name, query, limit=limit, filters=filters, **{name: value},
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            hits += len(truth & {r["id"] for r in results})
+            expected += len(truth)
+        report.append({
+            "setting": f"{name}={value}",
+            "recall": hits / expected if expected else 0.0,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+        })
+
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    client = PGVectorClient(connection_string=args.dsn)
+    collection = args.collection
+    index = PGVectorIndexSpec(
+        method=args.method,
+        m=args.m,
+        ef_construction=args.ef_construction,
+        lists=args.lists,
+    )
+
+    await client.connect()
+    try:
+        await client.delete_collection(collection)
+        # IVFFlat trains its lists on existing rows, so build it after loading
+        initial_index = index if args.method == "hnsw" else PGVectorIndexSpec(method="none")
+        await client.create_collection(collection, args.dimension, metric=args.metric, index=initial_index)
+
+        projects = [f"project-{i}" for i in range(args.projects)]
+        batch = []
+        for i in range(args.rows):
+            batch.append((
+                f"v{i}",
+                _random_unit_vector(rng, args.dimension),
+                {"project_id": rng.choice(projects)},
+            ))
+            if len(batch) >= 5000:
+                await client.upsert(collection, batch)
+                batch = []
+        await client.upsert(collection, batch)
+        if args.method == "ivfflat":
+            await client.create_collection(collection, args.dimension, metric=args.metric, index=index)
+
+        queries = [_random_unit_vector(rng, args.dimension) for _ in range(args.queries)]
+        filters = {"project_id": projects[0]} if args.filtered else None
+        report = await run_recall_benchmark(
+            client,
+            collection,
+            queries,
+            limit=args.k,
+            ef_search_values=args.ef_search if args.method == "hnsw" else (),
+            probes_values=args.probes if args.method == "ivfflat" else (),
+            filters=filters,
+        )
+
+        print(f"{'setting':<16}{'recall@' + str(args.k):>12}{'p50 ms':>10}{'p95 ms':>10}")
+        for row in report:
+            print(f"{row['setting']:<16}{row['recall']:>12.3f}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}")
+    finally:
+        if not args.keep:
+            await client.delete_collection(collection)
+        await client.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PGVector recall/latency benchmark")
+    parser.add_argument("--dsn", default=None, help="PostgreSQL URL (DATABASE_URL if omitted)")
+    parser.add_argument("--collection", default="bench_vectors")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--metric", default="cosine", choices=["cosine", "l2", "ip"])
+    parser.add_argument("--method", default="hnsw", choices=["hnsw", "ivfflat"])
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 80, 160, 320])
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--projects", type=int, default=20, help="Distinct project_id values")
+    parser.add_argument("--filtered", action="store_true", help="Filter every query by one project_id")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark table")
+    asyncio.run(_main(parser.parse_args()))
@@ -7,8 +7,11 @@ Supports multiple vector database providers:
 - PGVector (PostgreSQL extension)
 """
 
+import json
 import os
+import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -336,85 +339,256 @@ class WeaviateClient(VectorDBClient):
         return response.json()
 
 
+# PGVector bulk-write settings
+PGVECTOR_COPY_THRESHOLD = int(os.getenv("PGVECTOR_COPY_THRESHOLD", "500"))
+PGVECTOR_POOL_MIN_SIZE = int(os.getenv("PGVECTOR_POOL_MIN_SIZE", "1"))
+PGVECTOR_POOL_MAX_SIZE = int(os.getenv("PGVECTOR_POOL_MAX_SIZE", "10"))
+# PgBouncer in transaction mode can't keep prepared statements per client
+PGVECTOR_STATEMENT_CACHE_SIZE = int(os.getenv("PGVECTOR_STATEMENT_CACHE_SIZE", "0"))
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,62}$")
+
+
+def _identifier(name: str) -> str:
+    """Validate a table name before it is interpolated into SQL."""
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid collection name: {name!r}")
+    return name
+
+
+def _vector_literal(vector: List[float]) -> str:
+    """Format a vector as a pgvector text literal."""
+    return "[" + ",".join(repr(float(x)) for x in vector) + "]"
+
+
+# metric -> (distance operator, operator class)
+PGVECTOR_METRICS = {
+    "cosine": ("<=>", "vector_cosine_ops"),
+    "l2": ("<->", "vector_l2_ops"),
+    "ip": ("<#>", "vector_ip_ops"),
+}
+
+
+# Table comment recording a collection's metric, e.g. "pgvector:metric=l2"
+_METRIC_COMMENT_PREFIX = "pgvector:metric="
+
+
+def _metric_from_catalog(indexdef: Optional[str], comment: Optional[str]) -> Optional[str]:
+    """Read a collection's metric from its ANN index opclass, else its table comment."""
+    if indexdef:
+        for metric, (_, opclass) in PGVECTOR_METRICS.items():
+            if opclass in indexdef:
+                return metric
+    if comment and comment.startswith(_METRIC_COMMENT_PREFIX):
+        metric = comment[len(_METRIC_COMMENT_PREFIX):]
+        if metric in PGVECTOR_METRICS:
+            return metric
+    return None
+
+
+def _distance_to_score(metric: str, distance: float) -> float:
+    """Convert an operator distance to a higher-is-better similarity."""
+    if metric == "cosine":
+        return 1 - distance
+    if metric == "ip":
+        return -distance  # <#> returns the negative inner product
+    return 1 / (1 + distance)
+
+
+@dataclass
+class PGVectorIndexSpec:
+    """ANN index settings for a PGVector collection."""
+    method: str = "hnsw"  # "hnsw", "ivfflat" or "none"
+    m: int = 16
+    ef_construction: int = 64
+    lists: int = 100
+    metadata_gin: bool = True
+
+
 class PGVectorClient(VectorDBClient):
-    """PGVector PostgreSQL extension client."""
+    """
+    PGVector PostgreSQL extension client on an asyncpg pool.
+
+    Small upserts use executemany; batches of copy_threshold or more rows are
+    COPYed into a transaction-scoped staging table and merged with a single
+    INSERT ... SELECT ... ON CONFLICT. Deletes use one ``id = ANY($1)``.
+
+    Search selects and orders by the same distance operator as the
+    collection's ANN index, and metadata filters use JSONB containment so a
+    GIN index on metadata can serve them. The metric is stored as a table
+    comment and read back from the catalog (index opclass first), so it
+    survives restarts and is shared by every worker.
+    """
 
     def __init__(
         self,
         connection_string: str = None,
+        min_pool_size: int = PGVECTOR_POOL_MIN_SIZE,
+        max_pool_size: int = PGVECTOR_POOL_MAX_SIZE,
+        copy_threshold: int = PGVECTOR_COPY_THRESHOLD,
     ):
-        from backend.db.connection import DATABASE_URL_SYNC
+        """
+        Initialize the client.
+
+        Args:
+            connection_string: PostgreSQL URL (DATABASE_URL if not provided)
+            min_pool_size: Minimum pooled connections
+            max_pool_size: Maximum pooled connections
+            copy_threshold: Row count from which upserts go through COPY
+        """
+        from backend.db.connection import DATABASE_URL
 
-        self.connection_string = connection_string or DATABASE_URL_SYNC
-        self._engine = None
-        self._conn = None
+        # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+        self.connection_string = re.sub(
+            r"^postgresql\+\w+://", "postgresql://", connection_string or DATABASE_URL
+        )
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self.copy_threshold = copy_threshold
+        self._pool = None
+        self._collection_metrics: Dict[str, str] = {}
 
     async def connect(self) -> None:
         """Connect to PostgreSQL with PGVector."""
-        from sqlalchemy import create_engine, text
-
-        self._engine = create_engine(self.connection_string)
-        self._conn = self._engine.connect()
+        if self._pool is not None:
+            return
+
+        import asyncpg
+        from backend.db.connection import get_asyncpg_ssl
+
+        self._pool = await asyncpg.create_pool(
+            self.connection_string,
+            min_size=self.min_pool_size,
+            max_size=self.max_pool_size,
+            statement_cache_size=PGVECTOR_STATEMENT_CACHE_SIZE,
+            ssl=get_asyncpg_ssl(),
+        )
 
         # Enable vector extension
-        self._conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-        self._conn.commit()
+        async with self._pool.acquire() as conn:
+            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
     async def disconnect(self) -> None:
         """Disconnect from PostgreSQL."""
-        if self._conn:
-            self._conn.close()
-        if self._engine:
-            self._engine.dispose()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def _get_pool(self):
+        """Get the connection pool, connecting on first use."""
+        if self._pool is None:
+            await self.connect()
+        return self._pool
 
     async def create_collection(
         self,
         name: str,
         dimension: int,
         metric: str = "cosine",
+        index: Optional[PGVectorIndexSpec] = None,
         **kwargs,
     ) -> None:
-        """Create a PGVector table."""
-        from sqlalchemy import text
+        """
+        Create a PGVector table with its ANN and metadata indexes.
+
+        Args:
+            name: Table name
+            dimension: Embedding dimension
+            metric: "cosine", "l2" or "ip"
+            index: ANN index settings (HNSW, m=16, ef_construction=64 if not provided)
+        """
+        name = _identifier(name)
+        if metric not in PGVECTOR_METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        index = index or PGVectorIndexSpec()
+        pool = await self._get_pool()
 
         # Create table with vector column
         create_sql = f"""
         CREATE TABLE IF NOT EXISTS {name} (
             id VARCHAR(64) PRIMARY KEY,
-            embedding vector({dimension}),
+            embedding vector({int(dimension)}),
             metadata JSONB DEFAULT '{{}}',
             text TEXT,
             created_at TIMESTAMP DEFAULT NOW()
         )
         """
-        self._conn.execute(text(create_sql))
-        self._conn.commit()
 
         # Create index for vector similarity search
-        if metric == "cosine":
-            index_type = "vector_cosine_ops"
-        elif metric == "l2":
-            index_type = "vector_l2_ops"
-        else:
-            index_type = "vector_inner_product_ops"
-
-        index_sql = f"""
-        CREATE INDEX IF NOT EXISTS {name}_embedding_idx
-        ON {name} USING ivfflat (embedding {index_type})
+        _, opclass = PGVECTOR_METRICS[metric]
+        index_sqls = []
+        if index.method == "hnsw":
+            index_sqls.append(f"""
+            CREATE INDEX IF NOT EXISTS {name}_embedding_hnsw_idx
+            ON {name} USING hnsw (embedding {opclass})
+            WITH (m = {int(index.m)}, ef_construction = {int(index.ef_construction)})
+            """)
+        elif index.method == "ivfflat":
+            index_sqls.append(f"""
+            CREATE INDEX IF NOT EXISTS {name}_embedding_ivfflat_idx
+            ON {name} USING ivfflat (embedding {opclass})
+            WITH (lists = {int(index.lists)})
+            """)
+        elif index.method != "none":
+            raise ValueError(f"Unknown index method: {index.method}")
+
+        if index.metadata_gin:
+            index_sqls.append(f"""
+            CREATE INDEX IF NOT EXISTS {name}_metadata_gin_idx
+            ON {name} USING gin (metadata jsonb_path_ops)
+            """)
+
+        async with pool.acquire() as conn:
+            await conn.execute(create_sql)
+            for index_sql in index_sqls:
+                await conn.execute(index_sql)
+            await conn.execute(
+                f"COMMENT ON TABLE {name} IS '{_METRIC_COMMENT_PREFIX}{metric}'"
+            )
+
+        self._collection_metrics[name] = metric
+
+    async def get_collection_metric(self, name: str) -> str:
         """
-        try:
-            self._conn.execute(text(index_sql))
-            self._conn.commit()
-        except Exception:
-            # IVFFLAT index might need data first
-            pass
+        Get the distance metric a collection was created with.
+
+        Args:
+            name: Table name
+
+        Returns:
+            "cosine", "l2" or "ip" (cosine for tables with no index or comment)
+        """
+        table = _identifier(name)
+        metric = self._collection_metrics.get(table)
+        if metric is not None:
+            return metric
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT
+                    (SELECT indexdef FROM pg_indexes
+                     WHERE schemaname = current_schema() AND tablename = lower($1)
+                       AND indexdef ~ 'vector_(cosine|l2|ip)_ops'
+                     LIMIT 1) AS indexdef,
+                    obj_description(to_regclass($1), 'pg_class') AS comment
+                """,
+                table,
+            )
+
+        metric = _metric_from_catalog(row["indexdef"], row["comment"]) if row else None
+        if metric is None:
+            return "cosine"
+        self._collection_metrics[table] = metric
+        return metric
 
     async def delete_collection(self, name: str) -> None:
         """Delete a PGVector table."""
-        from sqlalchemy import text
-
-        self._conn.execute(text(f"DROP TABLE IF EXISTS {name} CASCADE"))
-        self._conn.commit()
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(f"DROP TABLE IF EXISTS {_identifier(name)} CASCADE")
+        self._collection_metrics.pop(name, None)
 
     async def upsert(
         self,
@@ -422,28 +596,88 @@ class PGVectorClient(VectorDBClient):
         vectors: List[Tuple[str, List[float], Dict[str, Any]]],
     ) -> None:
         """Upsert vectors to PGVector."""
-        from sqlalchemy import text
+        if not vectors:
+            return
+
+        table = _identifier(collection_name)
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                if len(vectors) >= self.copy_threshold:
+                    await self._copy_upsert(conn, table, vectors)
+                else:
+                    await conn.executemany(
+                        f"""
+                        INSERT INTO {table} (id, embedding, metadata, text)
+                        VALUES ($1, $2::vector, $3::jsonb, $4)
+                        ON CONFLICT (id) DO UPDATE SET
+                            embedding = EXCLUDED.embedding,
+                            metadata = EXCLUDED.metadata,
+                            text = EXCLUDED.text,
+                            created_at = NOW()
+                        """,
+                        [
+                            (
+                                id,
+                                _vector_literal(vector),
+                                json.dumps(metadata, default=str),
+                                metadata.get("text", ""),
+                            )
+                            for id, vector, metadata in vectors
+                        ],
+                    )
+
+    async def _copy_upsert(
+        self,
+        conn,
+        table: str,
+        vectors: List[Tuple[str, List[float], Dict[str, Any]]],
+    ) -> None:
+        """
+        Bulk upsert through COPY into a staging table and one merge statement.
 
-        for id, vector, metadata in vectors:
-            upsert_sql = f"""
-            INSERT INTO {collection_name} (id, embedding, metadata, text)
-            VALUES (:id, :embedding, :metadata, :text)
+        Must run inside a transaction; the staging table is dropped on commit.
+        """
+        staging = f"_{table}_staging"
+        await conn.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {staging} (
+                seq INTEGER,
+                id VARCHAR(64),
+                embedding REAL[],
+                metadata TEXT,
+                text TEXT
+            ) ON COMMIT DROP
+            """
+        )
+        await conn.copy_records_to_table(
+            staging,
+            records=[
+                (
+                    seq,
+                    id,
+                    [float(x) for x in vector],
+                    json.dumps(metadata, default=str),
+                    metadata.get("text", ""),
+                )
+                for seq, (id, vector, metadata) in enumerate(vectors)
+            ],
+            columns=["seq", "id", "embedding", "metadata", "text"],
+        )
+        # Last write wins for ids repeated within the batch
+        await conn.execute(
+            f"""
+            INSERT INTO {table} (id, embedding, metadata, text)
+            SELECT DISTINCT ON (id) id, embedding::vector, metadata::jsonb, text
+            FROM {staging}
+            ORDER BY id, seq DESC
             ON CONFLICT (id) DO UPDATE SET
                 embedding = EXCLUDED.embedding,
                 metadata = EXCLUDED.metadata,
                 text = EXCLUDED.text,
                 created_at = NOW()
             """
-            self._conn.execute(
-                text(upsert_sql),
-                {
-                    "id": id,
-                    "embedding": vector,
-                    "metadata": metadata,
-                    "text": metadata.get("text", ""),
-                },
-            )
-        self._conn.commit()
+        )
 
     async def search(
         self,
@@ -451,71 +685,96 @@ class PGVectorClient(VectorDBClient):
         query_vector: List[float],
         limit: int = 10,
         filters: Dict[str, Any] = None,
+        metric: Optional[str] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Search for similar vectors in PGVector."""
-        from sqlalchemy import text
-        import numpy as np
+        """
+        Search for similar vectors in PGVector.
+
+        Args:
+            collection_name: Table name
+            query_vector: Query embedding
+            limit: Maximum results
+            filters: Metadata key/value pairs that must all match
+            metric: Distance metric (the collection's stored metric if not provided)
+            ef_search: HNSW candidate list size for this query
+            probes: IVFFlat lists probed for this query
+            exact: Skip the ANN index (exact scan, for recall baselines)
+
+        Returns:
+            Matches with id, similarity score, metadata and text
+        """
+        table = _identifier(collection_name)
+        metric = metric or await self.get_collection_metric(table)
+        operator, _ = PGVECTOR_METRICS[metric]
+        pool = await self._get_pool()
 
-        # Calculate similarity
+        params: List[Any] = [_vector_literal(query_vector), limit]
+        where_clause = ""
         if filters:
-            # Basic filtering support
-            where_clause = "WHERE " + " AND ".join(
-                f"metadata->>'{k}' = :{k}" for k in filters.keys()
-            )
-        else:
-            where_clause = ""
+            params.append(json.dumps(filters, default=str))
+            where_clause = "WHERE metadata @> $3::jsonb"
 
         search_sql = f"""
-        SELECT id, embedding <-> :query_vector as distance,
+        SELECT id, embedding {operator} $1::vector AS distance,
                metadata, text
-        FROM {collection_name}
+        FROM {table}
         {where_clause}
-        ORDER BY embedding <=> :query_vector
-        LIMIT :limit
+        ORDER BY distance
+        LIMIT $2
         """
 
-        params = {"query_vector": query_vector, "limit": limit}
-        params.update(filters or {})
-
-        result = self._conn.execute(text(search_sql), params)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # SET LOCAL keeps per-query tuning inside this transaction
+                if exact:
+                    await conn.execute("SET LOCAL enable_indexscan = off")
+                if ef_search:
+                    await conn.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+                if probes:
+                    await conn.execute(f"SET LOCAL ivfflat.probes = {int(probes)}")
+                rows = await conn.fetch(search_sql, *params)
 
         return [
             {
-                "id": row[0],
-                "score": 1 - float(row[1]) if row[1] else 0,  # Convert distance to similarity
-                "metadata": row[2] or {},
-                "text": row[3],
+                "id": row["id"],
+                "score": _distance_to_score(metric, float(row["distance"])),
+                "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+                "text": row["text"],
             }
-            for row in result.fetchall()
+            for row in rows
         ]
 
     async def delete(self, collection_name: str, ids: List[str]) -> None:
         """Delete vectors by ID."""
-        from sqlalchemy import text
-
-        for id in ids:
-            self._conn.execute(
-                text(f"DELETE FROM {collection_name} WHERE id = :id"),
-                {"id": id},
+        if not ids:
+            return
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(
+                f"DELETE FROM {_identifier(collection_name)} WHERE id = ANY($1::varchar[])",
+                list(ids),
             )
-        self._conn.commit()
 
     async def get_collection_info(self, name: str) -> Dict[str, Any]:
         """Get PGVector table information."""
-        from sqlalchemy import text
-
-        result = self._conn.execute(
-            text(f"""
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
                 SELECT column_name, data_type
                 FROM information_schema.columns
-                WHERE table_name = :name
-            """),
-            {"name": name},
-        )
+                WHERE table_name = $1
+                """,
+                name,
+            )
 
         return {
             "name": name,
-            "columns": [dict(row._mapping) for row in result.fetchall()],
+            "columns": [dict(row) for row in rows],
         }
 
 
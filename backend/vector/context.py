@@ -0,0 +1,239 @@
+"""
+Token-budgeted RAG context assembly.
+
+Provides:
+- Token counting with tiktoken (character heuristic if unavailable)
+- Near-duplicate removal across retrieved decisions and artifacts
+- Greedy score-per-token packing that never exceeds the budget
+"""
+
+import asyncio
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List
+from uuid import UUID
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+RAG_TOKENIZER_ENCODING = os.getenv("RAG_TOKENIZER_ENCODING", "cl100k_base")
+
+# Block separator in the assembled context
+CONTEXT_SEPARATOR = "\n\n"
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    if tiktoken is None:
+        return None
+    return tiktoken.get_encoding(RAG_TOKENIZER_ENCODING)
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text (about 4 characters per token without tiktoken)."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+@dataclass
+class ContextBlock:
+    """One retrieved item formatted for the prompt."""
+    kind: str
+    id: str
+    score: float
+    text: str
+    tokens: int = 0
+    words: frozenset = field(default_factory=frozenset)
+
+    @property
+    def density(self) -> float:
+        return self.score / max(self.tokens, 1)
+
+
+@dataclass
+class RAGContext:
+    """Assembled context and what went into it."""
+    text: str
+    tokens: int
+    max_tokens: int
+    included: List[Dict[str, Any]]
+    dropped_duplicates: int = 0
+    dropped_budget: int = 0
+
+
+class RAGContextAssembler:
+    """
+    Builds a prompt context from decisions and artifacts within a token budget.
+
+    Candidates are de-duplicated (word-set Jaccard similarity), then packed
+    greedily by score per token. The packing is compared with the single
+    best-scoring block that fits, and the better of the two is kept.
+    """
+
+    def __init__(
+        self,
+        repo,
+        decision_limit: int = 30,
+        artifact_limit: int = 10,
+        artifact_weight: float = 1.0,
+        max_artifact_share: float = 0.5,
+        duplicate_threshold: float = 0.9,
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            repo: VectorSearchRepository to retrieve from
+            decision_limit: Decisions retrieved as candidates
+            artifact_limit: Artifacts retrieved as candidates (0 disables artifacts)
+            artifact_weight: Multiplier on artifact scores relative to decisions
+            max_artifact_share: Largest fraction of the budget one artifact may take
+            duplicate_threshold: Jaccard similarity at which blocks count as duplicates
+        """
+        self.repo = repo
+        self.decision_limit = decision_limit
+        self.artifact_limit = artifact_limit
+        self.artifact_weight = artifact_weight
+        self.max_artifact_share = max_artifact_share
+        self.duplicate_threshold = duplicate_threshold
+
+    def _block(self, kind: str, result: Dict[str, Any], text: str, score: float) -> ContextBlock:
+        return ContextBlock(
+            kind=kind,
+            id=str(result.get("id", "")),
+            score=score,
+            text=text,
+            tokens=count_tokens(text),
+            words=frozenset(w.lower() for w in _WORD_RE.findall(text.split("\n", 1)[-1])),
+        )
+
+    def _decision_block(self, result: Dict[str, Any]) -> ContextBlock:
+        metadata = result.get("metadata", {})
+        text = (
+            f"Decision (score: {result['score']:.2f}):\n"
+            f"Question: {metadata.get('question', '')}\n"
+            f"Answer: {metadata.get('answer', '')}\n"
+        )
+        return self._block("decision", result, text, result["score"])
+
+    def _artifact_block(self, result: Dict[str, Any], max_tokens: int) -> ContextBlock:
+        metadata = result.get("metadata", {})
+        header = (
+            f"Artifact: {metadata.get('title', '')} "
+            f"({metadata.get('type', 'artifact')}, score: {result['score']:.2f}):\n"
+        )
+        content = truncate_to_tokens(
+            metadata.get("content", ""),
+            max(0, int(max_tokens * self.max_artifact_share) - count_tokens(header)),
+        )
+        return self._block("artifact", result, header + content, result["score"] * self.artifact_weight)
+
+    def _deduplicate(self, blocks: List[ContextBlock]) -> List[ContextBlock]:
+        """Keep the highest-scoring block of each near-duplicate group."""
+        kept: List[ContextBlock] = []
+        for block in sorted(blocks, key=lambda b: b.score, reverse=True):
+            duplicate = False
+            for other in kept:
+                union = len(block.words | other.words)
+                if union and len(block.words & other.words) / union >= self.duplicate_threshold:
+                    duplicate = True
+                    break
+            if not duplicate:
+                kept.append(block)
+        return kept
+
+    @staticmethod
+    def _pack(blocks: List[ContextBlock], budget: int) -> List[ContextBlock]:
+        """Greedy score-per-token knapsack, compared against the best single block."""
+        separator = count_tokens(CONTEXT_SEPARATOR)
+        chosen: List[ContextBlock] = []
+        used = 0
+        for block in sorted(blocks, key=lambda b: b.density, reverse=True):
+            cost = block.tokens + (separator if chosen else 0)
+            if used + cost <= budget:
+                chosen.append(block)
+                used += cost
+
+        fitting = [b for b in blocks if b.tokens <= budget]
+        if fitting:
+            best = max(fitting, key=lambda b: b.score)
+            if best.score > sum(b.score for b in chosen):
+                chosen = [best]
+
+        # Present the most relevant first
+        return sorted(chosen, key=lambda b: b.score, reverse=True)
+
+    async def assemble(
+        self,
+        query: str,
+        project_id: UUID,
+        max_tokens: int = 4000,
+    ) -> RAGContext:
+        """
+        Retrieve and pack context for a query.
+
+        Args:
+            query: User query
+            project_id: Project context
+            max_tokens: Token budget for the returned text
+
+        Returns:
+            RAGContext whose text is at most max_tokens tokens
+        """
+        searches = [
+            self.repo.search_decisions(query=query, project_id=project_id, limit=self.decision_limit)
+        ]
+        if self.artifact_limit > 0:
+            searches.append(
+                self.repo.search_artifacts(query=query, project_id=project_id, limit=self.artifact_limit)
+            )
+        results = await asyncio.gather(*searches)
+
+        blocks = [self._decision_block(r) for r in results[0]]
+        if len(results) > 1:
+            blocks += [self._artifact_block(r, max_tokens) for r in results[1]]
+
+        unique = self._deduplicate(blocks)
+        chosen = self._pack(unique, max_tokens)
+
+        # Tokens can merge across block boundaries; re-check the joined text
+        text = CONTEXT_SEPARATOR.join(b.text for b in chosen)
+        tokens = count_tokens(text)
+        while chosen and tokens > max_tokens:
+            chosen.remove(min(chosen, key=lambda b: b.density))
+            text = CONTEXT_SEPARATOR.join(b.text for b in chosen)
+            tokens = count_tokens(text)
+
+        return RAGContext(
+            text=text,
+            tokens=tokens,
+            max_tokens=max_tokens,
+            included=[
+                {"kind": b.kind, "id": b.id, "score": b.score, "tokens": b.tokens}
+                for b in chosen
+            ],
+            dropped_duplicates=len(blocks) - len(unique),
+            dropped_budget=len(unique) - len(chosen),
+        )
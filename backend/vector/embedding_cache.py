@@ -0,0 +1,196 @@
+"""
+Embedding cache keyed by content hash.
+
+Provides:
+- Stable cache keys from (model, text)
+- Redis backend storing float32 vectors with a TTL
+- Local disk backend for development and single-node deployments
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Backend selection: "redis", "disk" or "none"
+EMBEDDING_CACHE_BACKEND = os.getenv("EMBEDDING_CACHE_BACKEND", "redis")
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", ".cache/embeddings")
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Content-hash key for an embedding of text under a model."""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(data: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Base embedding cache; stores nothing."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        return {}
+
+    async def _set_many(self, vectors: Dict[str, List[float]]) -> None:
+        return None
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            keys: Cache keys from embedding_cache_key
+
+        Returns:
+            Dictionary of found keys to vectors
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            found = await self._get_many(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            found = {}
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """
+        Store embeddings.
+
+        Args:
+            vectors: Dictionary of cache key to vector
+        """
+        if not vectors:
+            return
+        try:
+            await self._set_many(vectors)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss counts and hit ratio."""
+        total = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    """Embedding cache in Redis, one float32 blob per key."""
+
+    def __init__(self, redis_client=None, ttl: Optional[int] = None):
+        """
+        Initialize the Redis cache.
+
+        Args:
+            redis_client: Binary (non-decoding) async Redis client (shared pool if not provided)
+            ttl: Entry TTL in seconds (EMBEDDING_CACHE_TTL if not provided)
+        """
+        from backend.cache.connection import EMBEDDING_CACHE_TTL, EMBEDDING_PREFIX
+
+        super().__init__()
+        self.redis = redis_client
+        self.ttl = ttl if ttl is not None else EMBEDDING_CACHE_TTL
+        self.prefix = EMBEDDING_PREFIX
+
+    async def _get_client(self):
+        if self.redis is None:
+            from backend.cache.connection import init_redis_binary
+            self.redis = await init_redis_binary()
+        return self.redis
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        client = await self._get_client()
+        values = await client.mget([f"{self.prefix}{key}" for key in keys])
+        return {key: _unpack(value) for key, value in zip(keys, values) if value}
+
+    async def _set_many(self, vectors: Dict[str, List[float]]) -> None:
+        client = await self._get_client()
+        pipe = client.pipeline(transaction=False)
+        for key, vector in vectors.items():
+            pipe.set(f"{self.prefix}{key}", _pack(vector), ex=self.ttl or None)
+        await pipe.execute()
+
+
+class DiskEmbeddingCache(EmbeddingCache):
+    """Embedding cache on local disk, one file per key."""
+
+    def __init__(self, directory: str = EMBEDDING_CACHE_DIR):
+        """
+        Initialize the disk cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+        """
+        super().__init__()
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.f32"
+
+    def _read(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        for key in keys:
+            try:
+                found[key] = _unpack(self._path(key).read_bytes())
+            except FileNotFoundError:
+                continue
+        return found
+
+    def _write(self, vectors: Dict[str, List[float]]) -> None:
+        for key, vector in vectors.items():
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp.write_bytes(_pack(vector))
+            tmp.replace(path)
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        return await asyncio.to_thread(self._read, keys)
+
+    async def _set_many(self, vectors: Dict[str, List[float]]) -> None:
+        await asyncio.to_thread(self._write, vectors)
+
+
+def get_embedding_cache(backend: Optional[str] = None) -> EmbeddingCache:
+    """
+    Create an embedding cache from configuration.
+
+    Args:
+        backend: "redis", "disk" or "none" (EMBEDDING_CACHE_BACKEND if not provided)
+
+    Returns:
+        EmbeddingCache instance
+    """
+    backend = backend or EMBEDDING_CACHE_BACKEND
+    if backend == "redis":
+        return RedisEmbeddingCache()
+    elif backend == "disk":
+        return DiskEmbeddingCache()
+    elif backend == "none":
+        return EmbeddingCache()
+    else:
+        raise ValueError(f"Unknown embedding cache backend: {backend}")
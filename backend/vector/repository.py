@@ -8,12 +8,26 @@ Provides high-level operations for:
 - RAG (Retrieval-Augmented Generation) support
 """
 
+import asyncio
+import hashlib
 import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from backend.vector.client import VectorDBClient, get_vector_client
+from backend.vector.context import RAGContextAssembler
+from backend.vector.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+
+# Texts per embedding API call and concurrent calls while indexing
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))
 
 
 class VectorSearchRepository:
@@ -25,6 +39,10 @@ class VectorSearchRepository:
     - Storing decisions with their embeddings
     - Semantic similarity search
     - Context retrieval for RAG
+
+    Embeddings are cached by a hash of (model, text), so re-indexing only
+    embeds text that changed. Cache misses are embedded in chunks of
+    batch_size with at most max_concurrency calls in flight.
     """
 
     # Collection names
@@ -32,14 +50,30 @@ class VectorSearchRepository:
     ARTIFACTS_COLLECTION = "artifacts"
     CONVERSATIONS_COLLECTION = "conversations"
 
-    def __init__(self, client: VectorDBClient = None):
+    def __init__(
+        self,
+        client: VectorDBClient = None,
+        embedding_client=None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+    ):
         """
         Initialize repository.
 
         Args:
             client: Vector database client (auto-initialized if not provided)
+            embedding_client: EmbeddingClient for real embeddings (deterministic placeholders if not provided)
+            embedding_cache: Embedding cache (EMBEDDING_CACHE_BACKEND if not provided)
+            batch_size: Maximum texts per embedding call
+            max_concurrency: Maximum concurrent embedding calls
         """
         self.client = client or get_vector_client()
+        self.embedding_client = embedding_client
+        self.embedding_cache = embedding_cache or get_embedding_cache()
+        self.batch_size = max(1, batch_size)
+        self._embed_semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._embedding_stats = {"embedded": 0, "batches": 0}
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -99,33 +133,60 @@ class VectorSearchRepository:
             project_id: Project UUID
             metadata: Additional metadata
         """
+        await self.index_decisions([
+            {
+                "decision_id": decision_id,
+                "question_text": question_text,
+                "answer_text": answer_text,
+                "category": category,
+                "project_id": project_id,
+                "metadata": metadata,
+            }
+        ])
+
+    async def index_decisions(self, decisions: List[Dict[str, Any]]) -> int:
+        """
+        Index many decisions with batched embedding and one upsert.
+
+        Args:
+            decisions: Dicts with the arguments of index_decision
+
+        Returns:
+            Number of decisions indexed
+        """
+        if not decisions:
+            return 0
         if not self._initialized:
             await self.initialize()
 
         # Combine question and answer for embedding
-        text = f"Question: {question_text}\n\nAnswer: {answer_text}"
-
-        # Create embedding (in production, use actual embedding model)
-        embedding = await self._generate_embedding(text)
+        texts = [
+            f"Question: {d['question_text']}\n\nAnswer: {d['answer_text']}"
+            for d in decisions
+        ]
+        embeddings = await self._generate_embeddings(texts)
+        indexed_at = datetime.utcnow().isoformat()
 
         await self.client.upsert(
             collection_name=self.DECISIONS_COLLECTION,
             vectors=[
                 (
-                    str(decision_id),
+                    str(d["decision_id"]),
                     embedding,
                     {
-                        "question": question_text,
-                        "answer": answer_text,
-                        "category": category,
-                        "project_id": str(project_id),
+                        "question": d["question_text"],
+                        "answer": d["answer_text"],
+                        "category": d["category"],
+                        "project_id": str(d["project_id"]),
                         "text": text,
-                        "indexed_at": datetime.utcnow().isoformat(),
-                        **(metadata or {}),
+                        "indexed_at": indexed_at,
+                        **(d.get("metadata") or {}),
                     },
                 )
+                for d, text, embedding in zip(decisions, texts, embeddings)
             ],
         )
+        return len(decisions)
 
     async def search_decisions(
         self,
@@ -192,6 +253,46 @@ class VectorSearchRepository:
         # This is a simplified implementation
         return []
 
+    async def find_nearest_decision_pairs(
+        self,
+        decision_texts: Dict[str, str],
+        k: int = 5,
+        min_similarity: float = 0.0,
+        query_ids: Optional[List[str]] = None,
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Find pairs of decisions that are embedding nearest neighbours.
+
+        Embeddings come from the embedding cache where possible; the
+        similarity search runs in a worker thread, in row blocks, so the
+        event loop is not blocked and memory stays bounded.
+
+        Args:
+            decision_texts: Decision text keyed by decision ID
+            k: Neighbours considered per decision
+            min_similarity: Minimum cosine similarity for a pair
+            query_ids: Only find neighbours of these decisions (all if not provided)
+
+        Returns:
+            Unique (decision_id, decision_id, similarity) pairs, most similar first
+        """
+        ids = list(decision_texts)
+        if len(ids) < 2 or k < 1:
+            return []
+
+        positions = {decision_id: i for i, decision_id in enumerate(ids)}
+        query_rows = (
+            [positions[i] for i in query_ids if i in positions]
+            if query_ids is not None else list(range(len(ids)))
+        )
+        if not query_rows:
+            return []
+
+        embeddings = await self._generate_embeddings([decision_texts[i] for i in ids])
+        return await asyncio.to_thread(
+            _nearest_pairs, ids, embeddings, query_rows, min(k, len(ids) - 1), min_similarity,
+        )
+
     async def delete_decision(self, decision_id: UUID) -> None:
         """Delete a decision from the index."""
         if not self._initialized:
@@ -217,26 +318,15 @@ class VectorSearchRepository:
             max_tokens: Maximum context tokens
 
         Returns:
-            Formatted context string
+            Formatted context string of at most max_tokens tokens, packed
+            from relevant decisions and artifacts
         """
-        # Search for relevant decisions
-        results = await self.search_decisions(
+        context = await RAGContextAssembler(self).assemble(
             query=query,
             project_id=project_id,
-            limit=10,
+            max_tokens=max_tokens,
         )
-
-        # Format context from results
-        context_parts = []
-        for result in results:
-            metadata = result.get("metadata", {})
-            context_parts.append(
-                f"Decision (score: {result['score']:.2f}):\n"
-                f"Question: {metadata.get('question', '')}\n"
-                f"Answer: {metadata.get('answer', '')}\n"
-            )
-
-        return "\n\n".join(context_parts)
+        return context.text
 
     async def index_artifact(
         self,
@@ -258,28 +348,56 @@ class VectorSearchRepository:
             project_id: Project UUID
             metadata: Additional metadata
         """
+        await self.index_artifacts([
+            {
+                "artifact_id": artifact_id,
+                "title": title,
+                "content": content,
+                "artifact_type": artifact_type,
+                "project_id": project_id,
+                "metadata": metadata,
+            }
+        ])
+
+    async def index_artifacts(self, artifacts: List[Dict[str, Any]]) -> int:
+        """
+        Index many artifacts with batched embedding and one upsert.
+
+        Args:
+            artifacts: Dicts with the arguments of index_artifact
+
+        Returns:
+            Number of artifacts indexed
+        """
+        if not artifacts:
+            return 0
         if not self._initialized:
             await self.initialize()
 
-        embedding = await self._generate_embedding(f"{title}\n\n{content}")
+        embeddings = await self._generate_embeddings(
+            [f"{a['title']}\n\n{a['content']}" for a in artifacts]
+        )
+        indexed_at = datetime.utcnow().isoformat()
 
         await self.client.upsert(
             collection_name=self.ARTIFACTS_COLLECTION,
             vectors=[
                 (
-                    str(artifact_id),
+                    str(a["artifact_id"]),
                     embedding,
                     {
-                        "title": title,
-                        "content": content,
-                        "type": artifact_type,
-                        "project_id": str(project_id),
-                        "indexed_at": datetime.utcnow().isoformat(),
-                        **(metadata or {}),
+                        "title": a["title"],
+                        "content": a["content"],
+                        "type": a["artifact_type"],
+                        "project_id": str(a["project_id"]),
+                        "indexed_at": indexed_at,
+                        **(a.get("metadata") or {}),
                     },
                 )
+                for a, embedding in zip(artifacts, embeddings)
             ],
         )
+        return len(artifacts)
 
     async def search_artifacts(
         self,
@@ -322,39 +440,90 @@ class VectorSearchRepository:
         """
         Generate embedding for text.
 
-        In production, this would call an embedding API.
-
         Args:
             text: Text to embed
 
         Returns:
             Embedding vector
         """
-        # In production, use actual embedding model
-        # Example with OpenAI:
-        # from openai import OpenAI
-        # client = OpenAI()
-        # response = client.embeddings.create(input=text, model="text-embedding-3-small")
-        # return response.data[0].embedding
-
-        # For now, return a placeholder
-        import hashlib
-        import numpy as np
-
-        # Create deterministic placeholder embedding based on text hash
-        hash_value = hashlib.sha256(text.encode()).hexdigest()
-        hash_int = int(hash_value[:16], 16)
+        return (await self._generate_embeddings([text]))[0]
+
+    def _embedding_model(self) -> str:
+        """Name of the model embeddings come from (part of the cache key)."""
+        if self.embedding_client is not None:
+            return self.embedding_client.default_config.model_name
+        return f"placeholder-{self._get_embedding_dimension()}"
+
+    async def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for texts, embedding only cache misses.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        model = self._embedding_model()
+        keys = [embedding_cache_key(model, text) for text in texts]
+        vectors = await self.embedding_cache.get_many(set(keys))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys = list(missing)
+            chunks = [
+                missing_keys[i:i + self.batch_size]
+                for i in range(0, len(missing_keys), self.batch_size)
+            ]
+            results = await asyncio.gather(*(
+                self._embed_batch([missing[key] for key in chunk]) for chunk in chunks
+            ))
+            computed = {
+                key: vector
+                for chunk, chunk_vectors in zip(chunks, results)
+                for key, vector in zip(chunk, chunk_vectors)
+            }
+            await self.embedding_cache.set_many(computed)
+            vectors.update(computed)
+
+        return [vectors[key] for key in keys]
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed one chunk of texts under the concurrency limit."""
+        async with self._embed_semaphore:
+            self._embedding_stats["batches"] += 1
+            self._embedding_stats["embedded"] += len(texts)
+            if self.embedding_client is not None:
+                return await self.embedding_client.aembed_documents(texts)
+            return [self._placeholder_embedding(text) for text in texts]
+
+    def _placeholder_embedding(self, text: str) -> List[float]:
+        """
+        Deterministic pseudo-random unit vector for text.
 
-        # Generate pseudo-random embedding
-        np.random.seed(hash_int)
-        dimension = self._get_embedding_dimension()
-        embedding = np.random.randn(dimension).tolist()
+        Used when no embedding client is configured. Uses a local generator
+        rather than reseeding NumPy's global RNG.
+        """
+        hash_value = hashlib.sha256(text.encode()).hexdigest()
+        rng = np.random.default_rng(int(hash_value[:16], 16))
+        embedding = rng.standard_normal(self._get_embedding_dimension())
+        return (embedding / np.linalg.norm(embedding)).tolist()
 
-        # Normalize
-        norm = sum(x**2 for x in embedding) ** 0.5
-        embedding = [x / norm for x in embedding]
+    def get_embedding_stats(self) -> Dict[str, Any]:
+        """
+        Get embedding cache and batching statistics.
 
-        return embedding
+        Returns:
+            Dictionary with cache hits/misses, texts embedded and batches sent
+        """
+        return {
+            **self._embedding_stats,
+            "cache": self.embedding_cache.get_stats(),
+        }
 
     async def health_check(self) -> Dict[str, Any]:
         """Check repository health."""
@@ -370,15 +539,64 @@ class VectorSearchRepository:
         self._initialized = False
 
 
+def _nearest_pairs(
+    ids: List[str],
+    embeddings: List[List[float]],
+    query_rows: List[int],
+    k: int,
+    min_similarity: float,
+    block_size: int = 512,
+) -> List[Tuple[str, str, float]]:
+    """Top-k cosine neighbour pairs of the query rows, computed in row blocks."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1.0, norms)
+
+    pairs: Dict[Tuple[int, int], float] = {}
+    for start in range(0, len(query_rows), block_size):
+        block = np.asarray(query_rows[start:start + block_size])
+        scores = matrix[block] @ matrix.T
+        scores[np.arange(len(block)), block] = -np.inf
+        neighbours = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for row, columns in enumerate(neighbours):
+            i = int(block[row])
+            for j in map(int, columns):
+                score = float(scores[row, j])
+                if score >= min_similarity:
+                    pairs[(min(i, j), max(i, j))] = score
+
+    return sorted(
+        ((ids[i], ids[j], score) for (i, j), score in pairs.items()),
+        key=lambda pair: pair[2],
+        reverse=True,
+    )
+
+
 # Repository instance
 _vector_repo: Optional[VectorSearchRepository] = None
 
 
+def _default_embedding_client():
+    """Get the shared EmbeddingClient if its default provider has an API key configured."""
+    try:
+        from backend.core.llm import EmbeddingProvider, get_embedding_client
+    except ImportError:
+        # LLM provider packages not installed
+        return None
+
+    client = get_embedding_client()
+    if client.default_config.provider == EmbeddingProvider.OPENAI:
+        api_key = client.openai_api_key
+    else:
+        api_key = client.anthropic_api_key
+    return client if api_key else None
+
+
 def get_vector_repo() -> VectorSearchRepository:
-    """Get vector search repository instance."""
+    """Get vector search repository instance (placeholder embeddings without an API key)."""
     global _vector_repo
 
     if _vector_repo is None:
-        _vector_repo = VectorSearchRepository()
+        _vector_repo = VectorSearchRepository(embedding_client=_default_embedding_client())
 
     return _vector_repo